@@ -4,18 +4,34 @@ MCP Server Manager - handles discovery, installation, and management of MCP serv
 
 import json
 import subprocess
-import requests
 import os
 import shutil
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import tempfile
 import platform
+import threading
 
 from ..utils.logger import get_logger
 from .vscode_config import VSCodeExtensionConfig
 from .system_checker import SystemChecker
 
+# Parsed server catalogs shared by every manager instance (each dialog creates its
+# own), keyed by path and tagged with the (mtime_ns, size) they were read at
+CATALOG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+
+# Docker servers installed in parallel must not each try to install or start Docker
+DOCKER_SETUP_LOCK = threading.Lock()
+
+# Installs of one type write to the same shared place (npm's global prefix,
+# site-packages, the servers checkout directory), so they run one at a time;
+# installs of different types can still run in parallel
+INSTALL_TYPE_LOCKS: Dict[str, threading.Lock] = {
+    "npm": threading.Lock(),
+    "git": threading.Lock(),
+    "python": threading.Lock()
+}
+
 
 class MCPServerManager:
     """Manages MCP server discovery, installation, and configuration"""
@@ -40,12 +56,22 @@ class MCPServerManager:
         config_file = Path("config/servers.json")
         
         try:
-            if config_file.exists():
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
+            try:
+                stat_result = os.stat(config_file)
+            except FileNotFoundError:
                 self.logger.warning("Server definitions file not found, using defaults")
                 return self._get_default_servers()
+            
+            # Reuse the catalog parsed by an earlier manager if the file is unchanged
+            cache_key = (stat_result.st_mtime_ns, stat_result.st_size)
+            cached = CATALOG_CACHE.get(str(config_file))
+            if cached is not None and cached[0] == cache_key:
+                return cached[1]
+            
+            with open(config_file, 'r', encoding='utf-8') as f:
+                servers = json.load(f)
+            CATALOG_CACHE[str(config_file)] = (cache_key, servers)
+            return servers
                 
         except Exception as e:
             self.logger.error("Failed to load server definitions", e)
@@ -124,6 +150,7 @@ class MCPServerManager:
         servers = []
         
         try:
+            import requests
             response = requests.get(
                 "https://api.github.com/search/repositories",
                 params={
@@ -161,6 +188,7 @@ class MCPServerManager:
         servers = []
         
         try:
+            import requests
             response = requests.get(
                 "https://registry.npmjs.org/-/v1/search",
                 params={
@@ -196,6 +224,7 @@ class MCPServerManager:
         servers = []
         
         try:
+            import requests
             response = requests.get(
                 "https://raw.githubusercontent.com/modelcontextprotocol/servers/main/README.md",
                 timeout=8  # Reduced timeout to prevent hanging
@@ -234,11 +263,14 @@ class MCPServerManager:
         
         try:
             if server_type == "npm":
-                return self._install_npm_server(server_config, target_path)
+                with INSTALL_TYPE_LOCKS["npm"]:
+                    return self._install_npm_server(server_config, target_path)
             elif server_type == "git":
-                return self._install_git_server(server_config, target_path)
+                with INSTALL_TYPE_LOCKS["git"]:
+                    return self._install_git_server(server_config, target_path)
             elif server_type == "python":
-                return self._install_python_server(server_config, target_path)
+                with INSTALL_TYPE_LOCKS["python"]:
+                    return self._install_python_server(server_config, target_path)
             elif server_type == "docker":
                 return self._install_docker_server(server_config)
             else:
@@ -384,29 +416,28 @@ class MCPServerManager:
             
             target_path.mkdir(parents=True, exist_ok=True)
             
-            # Clone repository
-            self.logger.info(f"Cloning repository: {repository} to {target_path}", category="install")
-            
-            clone_cmd = ["git", "clone", repository, str(target_path)]
+            run_kwargs = {"capture_output": True, "text": True, "timeout": 300}
             if platform.system() == "Windows":
-                result = subprocess.run(
-                    clone_cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=300,
-                    shell=True,
-                    creationflags=subprocess.CREATE_NO_WINDOW
-                )
+                run_kwargs.update(shell=True, creationflags=subprocess.CREATE_NO_WINDOW)
+            
+            # A reinstall finds the checkout an earlier install left behind; update it
+            # rather than cloning again (git refuses to clone into a non-empty directory)
+            if self._is_checkout_of(target_path, repository):
+                self.logger.info(f"Updating existing checkout of {repository} in {target_path}", category="install")
+                git_cmd = ["git", "-C", str(target_path), "pull", "--ff-only"]
+                success_msg = f"Successfully updated {server_name} in {target_path}"
+                failure_msg = "git pull failed"
             else:
-                result = subprocess.run(
-                    clone_cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=300
-                )
+                # Clone repository
+                self.logger.info(f"Cloning repository: {repository} to {target_path}", category="install")
+                git_cmd = ["git", "clone", repository, str(target_path)]
+                success_msg = f"Successfully cloned {server_name} to {target_path}"
+                failure_msg = "git clone failed"
+            
+            result = subprocess.run(git_cmd, **run_kwargs)
             
             self.logger.log_command_execution(
-                " ".join(clone_cmd),
+                " ".join(git_cmd),
                 result.returncode,
                 result.stdout,
                 result.stderr
@@ -427,11 +458,10 @@ class MCPServerManager:
                     if npm_install.returncode != 0:
                         self.logger.warning(f"npm install failed in {target_path}")
                 
-                success_msg = f"Successfully cloned {server_name} to {target_path}"
                 self.logger.log_server_operation("INSTALL", server_name, "Success")
                 return True, success_msg
             else:
-                error_msg = f"git clone failed: {result.stderr}"
+                error_msg = f"{failure_msg}: {result.stderr}"
                 return False, error_msg
                 
         except subprocess.TimeoutExpired:
@@ -439,6 +469,24 @@ class MCPServerManager:
         except Exception as e:
             return False, f"Git installation error: {str(e)}"
     
+    def _is_checkout_of(self, path: Path, repository: str) -> bool:
+        """Check whether path is already a git checkout of repository"""
+        if not (path / ".git").is_dir():
+            return False
+        
+        try:
+            result = subprocess.run(
+                ["git", "-C", str(path), "remote", "get-url", "origin"],
+                capture_output=True,
+                text=True,
+                timeout=10,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0)
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        
+        return result.returncode == 0 and result.stdout.strip() == repository
+    
     def _install_python_server(self, server_config: Dict, target_path: Optional[str] = None) -> Tuple[bool, str]:
         """Install Python-based MCP server"""
         package = server_config.get("package", "")
@@ -615,6 +663,11 @@ class MCPServerManager:
     
     def _ensure_docker_available(self) -> Tuple[bool, str]:
         """Ensure Docker is installed and running"""
+        with DOCKER_SETUP_LOCK:
+            return self._ensure_docker_available_locked()
+    
+    def _ensure_docker_available_locked(self) -> Tuple[bool, str]:
+        """Ensure Docker is installed and running (caller holds DOCKER_SETUP_LOCK)"""
         try:
             docker_status = self.system_checker.get_docker_status()
             
@@ -816,7 +869,39 @@ class MCPServerManager:
         
         return installed
     
-    def get_server_installation_status(self, server_config: Dict) -> Dict:
+    def _get_configured_servers_by_ide(self) -> List[Tuple[str, List[str]]]:
+        """List (IDE name, configured server names) for every installed IDE"""
+        ide_status = self.vscode_config.get_extension_status()
+        return [
+            (ide_info["name"], ide_info.get("servers", []))
+            for ide_info in ide_status.values()
+            if ide_info["installed"]
+        ]
+    
+    def get_installation_snapshot(self) -> Dict:
+        """Collect installed npm packages and IDE-configured servers once
+        
+        Pass the result to get_server_installation_status when checking a whole
+        list of servers, so 'npm list' and the IDE configs are read once per list
+        instead of once per server.
+        """
+        snapshot = {"npm_packages": frozenset(), "configured": []}
+        
+        try:
+            snapshot["npm_packages"] = frozenset(
+                installed["name"] for installed in self.get_installed_servers()
+            )
+        except Exception as e:
+            self.logger.debug(f"Could not collect installed packages: {e}")
+        
+        try:
+            snapshot["configured"] = self._get_configured_servers_by_ide()
+        except Exception as e:
+            self.logger.debug(f"Could not collect configured servers: {e}")
+        
+        return snapshot
+    
+    def get_server_installation_status(self, server_config: Dict, snapshot: Optional[Dict] = None) -> Dict:
         """Check if a server is installed and configured in IDEs"""
         server_name = server_config.get("name", "Unknown")
         server_type = server_config.get("type", "")
@@ -832,26 +917,27 @@ class MCPServerManager:
         try:
             # Check if package is installed
             if server_type == "npm" and package:
-                installed_servers = self.get_installed_servers()
-                for installed in installed_servers:
-                    if installed["name"] == package:
-                        status["package_installed"] = True
-                        break
+                if snapshot is not None:
+                    installed_packages = snapshot["npm_packages"]
+                else:
+                    installed_packages = {installed["name"] for installed in self.get_installed_servers()}
+                status["package_installed"] = package in installed_packages
             
             # Check if configured in IDEs
-            ide_status = self.vscode_config.get_extension_status()
-            for ide_name, ide_info in ide_status.items():
-                if ide_info["installed"]:
-                    configured_servers = ide_info.get("servers", [])
-                    
-                    # Check if this server is in the IDE's configuration
-                    for configured_server in configured_servers:
-                        # Match by server name or package name
-                        if (configured_server.lower().replace(" ", "_").replace("-", "_") == 
-                            server_name.lower().replace(" ", "_").replace("-", "_")) or \
-                           (package and package in configured_server):
-                            status["configured_in"].append(ide_info["name"])
-                            break
+            if snapshot is not None:
+                configured_by_ide = snapshot["configured"]
+            else:
+                configured_by_ide = self._get_configured_servers_by_ide()
+            
+            normalized_name = server_name.lower().replace(" ", "_").replace("-", "_")
+            for ide_name, configured_servers in configured_by_ide:
+                # Check if this server is in the IDE's configuration
+                for configured_server in configured_servers:
+                    # Match by server name or package name
+                    if (configured_server.lower().replace(" ", "_").replace("-", "_") == normalized_name) or \
+                       (package and package in configured_server):
+                        status["configured_in"].append(ide_name)
+                        break
             
             # Determine overall status
             if status["package_installed"] and status["configured_in"]:
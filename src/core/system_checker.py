@@ -3,12 +3,17 @@ System compatibility checker for MCP Installer
 Checks and installs prerequisites automatically
 """
 
+import functools
 import os
 import sys
 import platform
 import subprocess
 import shutil
+import threading
+import time
+from collections import deque
 from pathlib import Path
+from types import SimpleNamespace
 
 # Windows-specific imports (optional)
 try:
@@ -16,20 +21,79 @@ try:
     WINDOWS_REGISTRY_AVAILABLE = True
 except ImportError:
     WINDOWS_REGISTRY_AVAILABLE = False
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
 import json
-import requests
 
 from ..utils.logger import get_logger
+from ..utils.workers import DaemonThreadPool
+
+# platform.system() is constant for the life of the process
+IS_WINDOWS = platform.system() == "Windows"
+
+# Shared read-only extensions value for detections without extension info.
+# Detection results are only read downstream, so one tuple serves them all.
+EMPTY_EXTENSIONS = ()
+
+# Keyword arguments shared by every subprocess launch: never open a console
+# window on Windows (CREATE_NO_WINDOW only exists there) and never leak handles
+SUBPROCESS_FLAGS = {"creationflags": getattr(subprocess, "CREATE_NO_WINDOW", 0), "close_fds": True}
+SUBPROCESS_KW = {"capture_output": True, "text": True, **SUBPROCESS_FLAGS}
+
+
+@functools.lru_cache(maxsize=1)
+def _registry_notify_api() -> SimpleNamespace:
+    """kernel32/advapi32 functions behind the registry PATH watcher (Windows only)
+    
+    Handles are pointer-sized, so every prototype is declared rather than left to
+    ctypes' default C int, which truncates them on 64-bit Python. Private WinDLL
+    instances keep these prototypes from changing ctypes.windll for other code.
+    """
+    import ctypes
+    from ctypes import wintypes
+    
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    advapi32 = ctypes.WinDLL("advapi32", use_last_error=True)
+    
+    kernel32.CreateEventW.argtypes = [wintypes.LPVOID, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR]
+    kernel32.CreateEventW.restype = wintypes.HANDLE
+    kernel32.ResetEvent.argtypes = [wintypes.HANDLE]
+    kernel32.ResetEvent.restype = wintypes.BOOL
+    kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    kernel32.WaitForSingleObject.restype = wintypes.DWORD
+    advapi32.RegNotifyChangeKeyValue.argtypes = [
+        wintypes.HKEY, wintypes.BOOL, wintypes.DWORD, wintypes.HANDLE, wintypes.BOOL
+    ]
+    advapi32.RegNotifyChangeKeyValue.restype = wintypes.LONG
+    
+    return SimpleNamespace(
+        CreateEventW=kernel32.CreateEventW,
+        ResetEvent=kernel32.ResetEvent,
+        WaitForSingleObject=kernel32.WaitForSingleObject,
+        RegNotifyChangeKeyValue=advapi32.RegNotifyChangeKeyValue
+    )
 
 
 class SystemChecker:
     """Comprehensive system compatibility checker"""
     
+    # Checks whose failure makes the overall result "failed"
+    CRITICAL_CHECKS = frozenset({"python", "platform", "internet", "node_js"})
+    
+    # Checks that may install software when auto_fix is on, in the order they run:
+    # winget first, since the Node.js install goes through it (npm comes with Node.js)
+    AUTO_FIX_CHECKS = ("winget", "node_js")
+    
     def __init__(self):
         self.logger = get_logger()
         self.results = {}
+        self._summary = None  # (results dict, its summary), see get_summary()
         self.auto_fix = True  # Enable auto-fix by default
+        self._probe_cache = {}  # Shared subprocess probe results (e.g. npm list)
+        
+        # Registry PATH cache, invalidated by a change notification (Windows only)
+        self._path_cache = None
+        self._path_notify_event = None
+        self._path_watch_keys = []
         
     def check_all(self) -> Dict[str, Dict]:
         """Run all system checks and return results"""
@@ -46,26 +110,51 @@ class SystemChecker:
             ("docker", self.check_docker)
         ]
         
-        for check_name, check_func in checks:
-            try:
-                self.logger.info(f"Running check: {check_name}", category="system")
-                result = check_func()
-                self.results[check_name] = result
-                self.logger.log_system_info(
-                    check_name, 
-                    "PASS" if result["status"] else "FAIL", 
-                    result.get("details", "")
-                )
-            except Exception as e:
-                self.logger.error(f"Check {check_name} failed", e, category="system")
-                self.results[check_name] = {
-                    "status": False,
-                    "message": f"Check failed: {str(e)}",
-                    "details": str(e)
-                }
+        # Checks that can auto-fix install software and change PATH, so they run
+        # one at a time first; the rest only read the system and run concurrently
+        check_funcs = dict(checks)
+        results = {
+            check_name: self._run_check(check_name, check_funcs[check_name])
+            for check_name in self.AUTO_FIX_CHECKS
+        }
+        results.update(self._run_checks_parallel(
+            [(check_name, check_func) for check_name, check_func in checks if check_name not in results]
+        ))
+        
+        # Record results in list order
+        self.results.update((check_name, results[check_name]) for check_name, _ in checks)
+        self._summary = None
         
         return self.results
     
+    def _run_check(self, check_name: str, check_func: Callable[[], Dict]) -> Dict:
+        """Run one check, logging its outcome and turning errors into a failed result"""
+        try:
+            self.logger.info(f"Running check: {check_name}", category="system")
+            result = check_func()
+            self.logger.log_system_info(
+                check_name, 
+                "PASS" if result["status"] else "FAIL", 
+                result.get("details", "")
+            )
+            return result
+        except Exception as e:
+            self.logger.error(f"Check {check_name} failed", e, category="system")
+            return {
+                "status": False,
+                "message": f"Check failed: {str(e)}",
+                "details": str(e)
+            }
+    
+    def _run_checks_parallel(self, checks: List[Tuple[str, Callable[[], Dict]]]) -> Dict[str, Dict]:
+        """Run check functions on a thread pool and return results by name"""
+        with DaemonThreadPool(max_workers=len(checks), thread_name_prefix="system-check") as executor:
+            futures = {
+                check_name: executor.submit(self._run_check, check_name, check_func)
+                for check_name, check_func in checks
+            }
+            return {check_name: future.result() for check_name, future in futures.items()}
+    
     def check_python(self) -> Dict:
         """Check Python installation and version"""
         version = sys.version_info
@@ -120,7 +209,7 @@ class SystemChecker:
         """Check available disk space"""
         try:
             # Get disk usage for current drive
-            if platform.system() == "Windows":
+            if IS_WINDOWS:
                 drive = Path.cwd().drive
                 usage = shutil.disk_usage(drive)
             else:
@@ -205,15 +294,13 @@ class SystemChecker:
             ping_targets = ["8.8.8.8", "1.1.1.1", "google.com"]
             
             for target in ping_targets:
-                ping_cmd = ["ping", "-n", "1", target] if platform.system() == "Windows" else ["ping", "-c", "1", target]
+                ping_cmd = ["ping", "-n", "1", target] if IS_WINDOWS else ["ping", "-c", "1", target]
                 
                 try:
                     result = subprocess.run(
                         ping_cmd,
-                        capture_output=True,
-                        text=True,
-                        timeout=10,
-                        creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0
+                        **SUBPROCESS_KW,
+                        timeout=10
                     )
                     
                     if result.returncode == 0:
@@ -245,15 +332,10 @@ class SystemChecker:
         
         for node_cmd in node_commands:
             try:
-                # Use proper subprocess flags for Windows
-                creationflags = subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0
-                
                 result = subprocess.run(
-                    [node_cmd, "--version"], 
-                    capture_output=True, 
-                    text=True, 
+                    [node_cmd, "--version"],
+                    **SUBPROCESS_KW,
                     timeout=15,
-                    creationflags=creationflags,
                     shell=False
                 )
                 
@@ -270,10 +352,8 @@ class SystemChecker:
                             # Also check npm
                             npm_result = subprocess.run(
                                 ["npm", "--version"],
-                                capture_output=True,
-                                text=True,
-                                timeout=10,
-                                creationflags=creationflags
+                                **SUBPROCESS_KW,
+                                timeout=10
                             )
                             
                             npm_info = f", npm: {npm_result.stdout.strip()}" if npm_result.returncode == 0 else ""
@@ -313,7 +393,7 @@ class SystemChecker:
                 continue
         
         # If no node command worked, try checking common installation paths
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             common_paths = [
                 Path(os.environ.get("PROGRAMFILES", "")) / "nodejs" / "node.exe",
                 Path(os.environ.get("PROGRAMFILES(X86)", "")) / "nodejs" / "node.exe",
@@ -322,14 +402,12 @@ class SystemChecker:
             ]
             
             for path in common_paths:
-                if path.exists():
+                if os.path.exists(path):
                     try:
                         result = subprocess.run(
                             [str(path), "--version"],
-                            capture_output=True,
-                            text=True,
-                            timeout=10,
-                            creationflags=subprocess.CREATE_NO_WINDOW
+                            **SUBPROCESS_KW,
+                            timeout=10
                         )
                         
                         if result.returncode == 0:
@@ -354,7 +432,7 @@ class SystemChecker:
     
     def check_winget(self) -> Dict:
         """Check Windows Package Manager (winget)"""
-        if platform.system() != "Windows":
+        if not IS_WINDOWS:
             return {
                 "status": True,
                 "message": "winget not applicable (non-Windows)",
@@ -364,8 +442,7 @@ class SystemChecker:
         try:
             result = subprocess.run(
                 ["winget", "--version"],
-                capture_output=True,
-                text=True,
+                **SUBPROCESS_KW,
                 timeout=10
             )
             
@@ -398,6 +475,25 @@ class SystemChecker:
     
     def check_ides(self) -> Dict:
         """Check for installed IDEs and MCP-compatible extensions"""
+        ides_found = self._detect_ides()
+        
+        if ides_found:
+            details = "; ".join([f"{ide['name']} ({ide['version']})" for ide in ides_found])
+            return {
+                "status": True,
+                "message": f"Found {len(ides_found)} compatible IDE(s)",
+                "details": details,
+                "ides": ides_found
+            }
+        else:
+            return {
+                "status": False,
+                "message": "No compatible IDEs found",
+                "details": "Install VS Code, Cursor, Windsurf, Claude Desktop, or Claude Code for MCP support"
+            }
+    
+    def _detect_ides(self) -> List[Dict]:
+        """Run all IDE detectors and return the installations found"""
         ides_found = []
         
         # Check for VS Code
@@ -425,34 +521,16 @@ class SystemChecker:
         if claude_code_info:
             ides_found.append(claude_code_info)
         
-        if ides_found:
-            details = "; ".join([f"{ide['name']} ({ide['version']})" for ide in ides_found])
-            return {
-                "status": True,
-                "message": f"Found {len(ides_found)} compatible IDE(s)",
-                "details": details,
-                "ides": ides_found
-            }
-        else:
-            return {
-                "status": False,
-                "message": "No compatible IDEs found",
-                "details": "Install VS Code, Cursor, Windsurf, Claude Desktop, or Claude Code for MCP support"
-            }
+        return ides_found
     
     def check_docker(self) -> Dict:
         """Check Docker installation and daemon status"""
         try:
             # First check if docker command is available
-            creationflags = subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0
-            
-            # Check Docker version
             version_result = subprocess.run(
                 ["docker", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                creationflags=creationflags
+                **SUBPROCESS_KW,
+                timeout=10
             )
             
             if version_result.returncode != 0:
@@ -468,10 +546,8 @@ class SystemChecker:
             # Check if Docker daemon is running
             daemon_result = subprocess.run(
                 ["docker", "info"],
-                capture_output=True,
-                text=True,
-                timeout=15,
-                creationflags=creationflags
+                **SUBPROCESS_KW,
+                timeout=15
             )
             
             if daemon_result.returncode == 0:
@@ -524,7 +600,7 @@ class SystemChecker:
     
     def _check_vscode(self) -> Optional[Dict]:
         """Check for VS Code installation without opening the application"""
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             # Check common VS Code installation paths
             possible_paths = [
                 Path(os.environ.get("LOCALAPPDATA", "")) / "Programs" / "Microsoft VS Code" / "Code.exe",
@@ -533,13 +609,13 @@ class SystemChecker:
             ]
             
             for path in possible_paths:
-                if path.exists():
+                if os.path.exists(path):
                     # Get version from resources file instead of running the executable
                     version = "Unknown"
                     try:
                         # Try to read version from package.json if available
                         resources_path = path.parent / "resources" / "app" / "package.json"
-                        if resources_path.exists():
+                        if os.path.exists(resources_path):
                             with open(resources_path, 'r', encoding='utf-8') as f:
                                 package_data = json.load(f)
                                 version = package_data.get('version', 'Unknown')
@@ -552,7 +628,7 @@ class SystemChecker:
                             ]
                             
                             for version_file in version_file_paths:
-                                if version_file.exists():
+                                if os.path.exists(version_file):
                                     try:
                                         with open(version_file, 'r', encoding='utf-8') as f:
                                             version = f.read().strip()
@@ -588,7 +664,7 @@ class SystemChecker:
             ]
             
             for path in common_paths:
-                if path.exists():
+                if os.path.exists(path):
                     # Avoid running VS Code executable, just mark as installed
                     version = "Installed"
                     self.logger.info(f"VS Code detected at {path} (avoiding executable)", category="system")
@@ -606,7 +682,7 @@ class SystemChecker:
     
     def _get_startup_info(self):
         """Get Windows startup info to prevent window creation"""
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             try:
                 import subprocess
                 startupinfo = subprocess.STARTUPINFO()
@@ -622,7 +698,7 @@ class SystemChecker:
         extensions = []
         
         # Check extension directories for all platforms
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             possible_extension_dirs = [
                 Path.home() / ".vscode" / "extensions",
                 Path(os.environ.get("USERPROFILE", "")) / ".vscode" / "extensions"
@@ -641,7 +717,7 @@ class SystemChecker:
         }
         
         for ext_dir in possible_extension_dirs:
-            if ext_dir.exists():
+            if os.path.exists(ext_dir):
                 try:
                     self.logger.debug(f"Checking VS Code extensions in: {ext_dir}", category="system")
                     
@@ -662,7 +738,7 @@ class SystemChecker:
                             
                             # Check if config file exists
                             config_path = self._get_extension_config_path(ext_name)
-                            config_exists = Path(config_path).exists() if config_path else False
+                            config_exists = os.path.exists(config_path) if config_path else False
                             
                             extensions.append({
                                 "id": ext_id,
@@ -683,7 +759,7 @@ class SystemChecker:
     
     def _get_extension_config_path(self, ext_name: str) -> str:
         """Get the MCP configuration path for VS Code extensions"""
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             appdata = os.environ.get("APPDATA", "")
             if ext_name == "Cline":
                 return os.path.join(appdata, "Code", "User", "globalStorage", "saoudrizwan.claude-dev", "settings", "cline_mcp_settings.json")
@@ -701,7 +777,7 @@ class SystemChecker:
     
     def _check_cursor(self) -> Optional[Dict]:
         """Check for Cursor IDE installation"""
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             # Check common Cursor installation paths
             possible_paths = [
                 Path(os.environ.get("LOCALAPPDATA", "")) / "Programs" / "cursor" / "Cursor.exe",
@@ -717,7 +793,7 @@ class SystemChecker:
             ]
         
         for path in possible_paths:
-            if path.exists():
+            if os.path.exists(path):
                 # Avoid running Cursor executable to prevent GUI opening
                 version = "Installed"
                 self.logger.info(f"Cursor detected at {path} (avoiding executable)", category="system")
@@ -726,14 +802,14 @@ class SystemChecker:
                     "name": "Cursor",
                     "version": version,
                     "path": str(path),
-                    "extensions": []
+                    "extensions": EMPTY_EXTENSIONS
                 }
         
         return None
     
     def _check_claude_desktop(self) -> Optional[Dict]:
         """Check for Claude Desktop installation"""
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             # First, try to find Claude using Windows package management
             claude_info = self._find_claude_via_windows_packages()
             if claude_info:
@@ -771,12 +847,12 @@ class SystemChecker:
             ]
         
         for path in possible_paths:
-            if path.exists():
+            if os.path.exists(path):
                 version = "Unknown"
                 
                 # Don't try to run Claude Desktop as it might open the GUI
                 # Instead, try to find version info from files
-                if platform.system() == "Windows":
+                if IS_WINDOWS:
                     try:
                         # Look for version info in the installation directory
                         version_files = [
@@ -786,7 +862,7 @@ class SystemChecker:
                         ]
                         
                         for version_file in version_files:
-                            if version_file.exists():
+                            if os.path.exists(version_file):
                                 try:
                                     if version_file.name == "package.json":
                                         with open(version_file, 'r', encoding='utf-8') as f:
@@ -814,7 +890,7 @@ class SystemChecker:
                     "name": "Claude Desktop",
                     "version": version,
                     "path": str(path),
-                    "extensions": []
+                    "extensions": EMPTY_EXTENSIONS
                 }
         
         return None
@@ -832,10 +908,8 @@ class SystemChecker:
             
             result = subprocess.run(
                 ps_cmd,
-                capture_output=True,
-                text=True,
-                timeout=15,
-                creationflags=subprocess.CREATE_NO_WINDOW
+                **SUBPROCESS_KW,
+                timeout=15
             )
             
             if result.returncode == 0 and result.stdout.strip():
@@ -861,7 +935,7 @@ class SystemChecker:
                                 "version": version,
                                 "path": f"Windows Package ({source})",
                                 "install_location": install_location,
-                                "extensions": []
+                                "extensions": EMPTY_EXTENSIONS
                             }
                             
                 except json.JSONDecodeError as e:
@@ -878,10 +952,8 @@ class SystemChecker:
             
             result = subprocess.run(
                 winget_cmd,
-                capture_output=True,
-                text=True,
-                timeout=15,
-                creationflags=subprocess.CREATE_NO_WINDOW
+                **SUBPROCESS_KW,
+                timeout=15
             )
             
             if result.returncode == 0 and "claude" in result.stdout.lower():
@@ -900,7 +972,7 @@ class SystemChecker:
                                 "name": "Claude Desktop",
                                 "version": version,
                                 "path": "Windows Package (winget)",
-                                "extensions": []
+                                "extensions": EMPTY_EXTENSIONS
                             }
                             
         except Exception as e:
@@ -917,10 +989,8 @@ class SystemChecker:
             
             result = subprocess.run(
                 apps_cmd,
-                capture_output=True,
-                text=True,
-                timeout=15,
-                creationflags=subprocess.CREATE_NO_WINDOW
+                **SUBPROCESS_KW,
+                timeout=15
             )
             
             if result.returncode == 0 and result.stdout.strip():
@@ -940,7 +1010,7 @@ class SystemChecker:
                                 "name": "Claude Desktop",
                                 "version": version,
                                 "path": "Windows Store App",
-                                "extensions": []
+                                "extensions": EMPTY_EXTENSIONS
                             }
                             
                 except json.JSONDecodeError:
@@ -953,7 +1023,7 @@ class SystemChecker:
     
     def _check_windsurf(self) -> Optional[Dict]:
         """Check for Windsurf IDE installation"""
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             # Check common Windsurf installation paths
             possible_paths = [
                 Path(os.environ.get("LOCALAPPDATA", "")) / "Programs" / "Windsurf" / "Windsurf.exe",
@@ -971,7 +1041,7 @@ class SystemChecker:
             ]
         
         for path in possible_paths:
-            if path.exists():
+            if os.path.exists(path):
                 # Avoid running Windsurf executable to prevent GUI opening
                 version = "Installed"
                 self.logger.info(f"Windsurf detected at {path} (avoiding executable)", category="system")
@@ -980,7 +1050,7 @@ class SystemChecker:
                     "name": "Windsurf",
                     "version": version,
                     "path": str(path),
-                    "extensions": []
+                    "extensions": EMPTY_EXTENSIONS
                 }
         
         return None
@@ -993,8 +1063,12 @@ class SystemChecker:
         if wsl_info:
             return wsl_info
         
-        # On Windows, first try to find it via package management
-        if platform.system() == "Windows":
+        # On Windows, first try the uninstall registry, then package management
+        if IS_WINDOWS:
+            claude_code_info = self._find_claude_code_via_registry()
+            if claude_code_info:
+                return claude_code_info
+            
             claude_code_info = self._find_claude_code_via_windows_packages()
             if claude_code_info:
                 return claude_code_info
@@ -1007,10 +1081,8 @@ class SystemChecker:
                 # Check if command is available
                 result = subprocess.run(
                     [cmd, "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                    creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0
+                    **SUBPROCESS_KW,
+                    timeout=10
                 )
                 
                 if result.returncode == 0:
@@ -1020,13 +1092,13 @@ class SystemChecker:
                         "name": "Claude Code",
                         "version": version,
                         "path": f"CLI ({cmd})",
-                        "extensions": []
+                        "extensions": EMPTY_EXTENSIONS
                     }
             except Exception as e:
                 self.logger.debug(f"Claude Code check with '{cmd}' failed: {e}", category="system")
         
         # Check for Claude Code installation files on Windows
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             possible_paths = [
                 # Check common installation paths
                 Path(os.environ.get("LOCALAPPDATA", "")) / "Programs" / "Claude Code" / "claude-code.exe",
@@ -1044,16 +1116,14 @@ class SystemChecker:
             ]
             
             for path in possible_paths:
-                if path.exists():
+                if os.path.exists(path):
                     version = "Installed"
                     try:
                         # Try to get version without opening GUI
                         result = subprocess.run(
                             [str(path), "--version"],
-                            capture_output=True,
-                            text=True,
-                            timeout=5,
-                            creationflags=subprocess.CREATE_NO_WINDOW
+                            **SUBPROCESS_KW,
+                            timeout=5
                         )
                         if result.returncode == 0:
                             version = result.stdout.strip()
@@ -1065,35 +1135,19 @@ class SystemChecker:
                         "name": "Claude Code",
                         "version": version,
                         "path": str(path),
-                        "extensions": []
+                        "extensions": EMPTY_EXTENSIONS
                     }
         
         # Check if Claude Code might be installed via npm/node
-        try:
-            # Check if it's an npm global package
-            result = subprocess.run(
-                ["npm", "list", "-g", "claude-code"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0
-            )
-            
-            if result.returncode == 0 and "claude-code" in result.stdout:
-                # Extract version from npm list output
-                import re
-                version_match = re.search(r'claude-code@(\S+)', result.stdout)
-                version = version_match.group(1) if version_match else "Unknown"
-                
-                self.logger.info(f"Claude Code detected via npm: {version}", category="system")
-                return {
-                    "name": "Claude Code",
-                    "version": version,
-                    "path": "NPM Global",
-                    "extensions": []
-                }
-        except Exception as e:
-            self.logger.debug(f"NPM Claude Code check failed: {e}", category="system")
+        version = self._npm_global_claude_code_version()
+        if version:
+            self.logger.info(f"Claude Code detected via npm: {version}", category="system")
+            return {
+                "name": "Claude Code",
+                "version": version,
+                "path": "NPM Global",
+                "extensions": EMPTY_EXTENSIONS
+            }
         
         return None
     
@@ -1106,127 +1160,157 @@ class SystemChecker:
             
             self.logger.debug("Detected WSL environment, checking for Claude Code", category="system")
             
-            # WSL-specific Claude Code detection methods
-            claude_code_commands = ["claude-code", "claude_code", "claudecode"]
+            # Detection strategies in priority order - stop at the first hit
+            wsl_strategies = [
+                ("command", self._probe_wsl_claude_code_commands),
+                ("npm", self._probe_wsl_claude_code_npm),
+                ("pip", self._probe_wsl_claude_code_pip),
+                ("filesystem", self._probe_wsl_claude_code_paths),
+                ("windows", self._check_windows_claude_code_from_wsl)
+            ]
             
-            for cmd in claude_code_commands:
+            for strategy_name, probe in wsl_strategies:
                 try:
-                    # Check if command is available in WSL
-                    result = subprocess.run(
-                        [cmd, "--version"],
-                        capture_output=True,
-                        text=True,
-                        timeout=10
-                    )
-                    
-                    if result.returncode == 0:
-                        version = result.stdout.strip()
-                        self.logger.info(f"Claude Code detected in WSL via '{cmd}': {version}", category="system")
-                        return {
-                            "name": "Claude Code",
-                            "version": version,
-                            "path": f"WSL ({cmd})",
-                            "extensions": [],
-                            "environment": "WSL"
-                        }
+                    result = probe()
+                    if result:
+                        return result
                 except Exception as e:
-                    self.logger.debug(f"WSL Claude Code check with '{cmd}' failed: {e}", category="system")
-                    continue
+                    self.logger.debug(f"WSL Claude Code {strategy_name} check failed: {e}", category="system")
             
-            # Check for npm global installations in WSL
+            return None
+            
+        except Exception as e:
+            self.logger.debug(f"WSL Claude Code detection failed: {e}", category="system")
+            return None
+    
+    def _probe_wsl_claude_code_commands(self) -> Optional[Dict]:
+        """Look for a Claude Code command on the WSL PATH"""
+        claude_code_commands = ["claude-code", "claude_code", "claudecode"]
+        
+        for cmd in claude_code_commands:
             try:
+                # Check if command is available in WSL
                 result = subprocess.run(
-                    ["npm", "list", "-g", "claude-code"],
-                    capture_output=True,
-                    text=True,
+                    [cmd, "--version"],
+                    **SUBPROCESS_KW,
                     timeout=10
                 )
                 
-                if result.returncode == 0 and "claude-code" in result.stdout:
-                    # Extract version from npm list output
-                    import re
-                    version_match = re.search(r'claude-code@(\S+)', result.stdout)
-                    version = version_match.group(1) if version_match else "Unknown"
-                    
-                    self.logger.info(f"Claude Code detected in WSL via npm: {version}", category="system")
+                if result.returncode == 0:
+                    version = result.stdout.strip()
+                    self.logger.info(f"Claude Code detected in WSL via '{cmd}': {version}", category="system")
                     return {
                         "name": "Claude Code",
                         "version": version,
-                        "path": "WSL (NPM Global)",
-                        "extensions": [],
+                        "path": f"WSL ({cmd})",
+                        "extensions": EMPTY_EXTENSIONS,
                         "environment": "WSL"
                     }
             except Exception as e:
-                self.logger.debug(f"WSL npm Claude Code check failed: {e}", category="system")
+                self.logger.debug(f"WSL Claude Code check with '{cmd}' failed: {e}", category="system")
+        
+        return None
+    
+    def _probe_wsl_claude_code_npm(self) -> Optional[Dict]:
+        """Look for a global npm installation of Claude Code in WSL"""
+        version = self._npm_global_claude_code_version()
+        if not version:
+            return None
+        
+        self.logger.info(f"Claude Code detected in WSL via npm: {version}", category="system")
+        return {
+            "name": "Claude Code",
+            "version": version,
+            "path": "WSL (NPM Global)",
+            "extensions": EMPTY_EXTENSIONS,
+            "environment": "WSL"
+        }
+    
+    def _probe_wsl_claude_code_pip(self) -> Optional[Dict]:
+        """Look for a pip installation of Claude Code in WSL"""
+        for pip_cmd in ["pip", "pip3"]:
+            result = subprocess.run(
+                [pip_cmd, "show", "claude-code"],
+                **SUBPROCESS_KW,
+                timeout=10
+            )
             
-            # Check for Python pip installations in WSL
-            try:
-                pip_commands = ["pip", "pip3"]
-                for pip_cmd in pip_commands:
+            if result.returncode == 0:
+                # Parse pip show output for version
+                version_line = next((line for line in result.stdout.split('\n') if line.startswith('Version:')), '')
+                version = version_line.split('Version: ')[-1].strip() if version_line else "Unknown"
+                
+                self.logger.info(f"Claude Code detected in WSL via {pip_cmd}: {version}", category="system")
+                return {
+                    "name": "Claude Code",
+                    "version": version,
+                    "path": f"WSL (Python {pip_cmd})",
+                    "extensions": EMPTY_EXTENSIONS,
+                    "environment": "WSL"
+                }
+        
+        return None
+    
+    def _probe_wsl_claude_code_paths(self) -> Optional[Dict]:
+        """Look for Claude Code in common WSL installation paths"""
+        wsl_paths = [
+            Path.home() / ".local" / "bin" / "claude-code",
+            Path("/usr/local/bin/claude-code"),
+            Path("/usr/bin/claude-code"),
+            Path.home() / "bin" / "claude-code"
+        ]
+        
+        for path in wsl_paths:
+            if os.path.exists(path):
+                try:
                     result = subprocess.run(
-                        [pip_cmd, "show", "claude-code"],
-                        capture_output=True,
-                        text=True,
-                        timeout=10
+                        [str(path), "--version"],
+                        **SUBPROCESS_KW,
+                        timeout=5
                     )
                     
                     if result.returncode == 0:
-                        # Parse pip show output for version
-                        version_line = next((line for line in result.stdout.split('\n') if line.startswith('Version:')), '')
-                        version = version_line.split('Version: ')[-1].strip() if version_line else "Unknown"
-                        
-                        self.logger.info(f"Claude Code detected in WSL via {pip_cmd}: {version}", category="system")
+                        version = result.stdout.strip()
+                        self.logger.info(f"Claude Code detected in WSL at {path}: {version}", category="system")
                         return {
                             "name": "Claude Code",
                             "version": version,
-                            "path": f"WSL (Python {pip_cmd})",
-                            "extensions": [],
+                            "path": f"WSL ({path})",
+                            "extensions": EMPTY_EXTENSIONS,
                             "environment": "WSL"
                         }
-            except Exception as e:
-                self.logger.debug(f"WSL pip Claude Code check failed: {e}", category="system")
-            
-            # Check common WSL installation paths
-            wsl_paths = [
-                Path.home() / ".local" / "bin" / "claude-code",
-                Path("/usr/local/bin/claude-code"),
-                Path("/usr/bin/claude-code"),
-                Path.home() / "bin" / "claude-code"
-            ]
-            
-            for path in wsl_paths:
-                if path.exists():
-                    try:
-                        result = subprocess.run(
-                            [str(path), "--version"],
-                            capture_output=True,
-                            text=True,
-                            timeout=5
-                        )
-                        
-                        if result.returncode == 0:
-                            version = result.stdout.strip()
-                            self.logger.info(f"Claude Code detected in WSL at {path}: {version}", category="system")
-                            return {
-                                "name": "Claude Code",
-                                "version": version,
-                                "path": f"WSL ({path})",
-                                "extensions": [],
-                                "environment": "WSL"
-                            }
-                    except Exception as e:
-                        self.logger.debug(f"Failed to check Claude Code at {path}: {e}", category="system")
-            
-            # Check for Windows installations accessible from WSL
-            windows_claude_info = self._check_windows_claude_code_from_wsl()
-            if windows_claude_info:
-                return windows_claude_info
-            
-            return None
+                except Exception as e:
+                    self.logger.debug(f"Failed to check Claude Code at {path}: {e}", category="system")
+        
+        return None
+    
+    def _npm_global_claude_code_version(self) -> Optional[str]:
+        """Return the globally installed npm claude-code version, if any
+        
+        The lookup is shared by the native and WSL detection paths, so the
+        result is cached to run `npm list -g` at most once per checker.
+        """
+        if "npm_claude_code" in self._probe_cache:
+            return self._probe_cache["npm_claude_code"]
+        
+        version = None
+        try:
+            result = subprocess.run(
+                ["npm", "list", "-g", "claude-code"],
+                **SUBPROCESS_KW,
+                timeout=10
+            )
             
+            if result.returncode == 0 and "claude-code" in result.stdout:
+                # Extract version from npm list output
+                import re
+                version_match = re.search(r'claude-code@(\S+)', result.stdout)
+                version = version_match.group(1) if version_match else "Unknown"
         except Exception as e:
-            self.logger.debug(f"WSL Claude Code detection failed: {e}", category="system")
-            return None
+            self.logger.debug(f"NPM Claude Code check failed: {e}", category="system")
+        
+        self._probe_cache["npm_claude_code"] = version
+        return version
     
     def _is_running_in_wsl(self) -> bool:
         """Check if we're running in Windows Subsystem for Linux"""
@@ -1257,7 +1341,7 @@ class SystemChecker:
             if platform.system() == "Linux":
                 wsl_mount_points = ['/mnt/c', '/mnt/d', '/c', '/d']
                 for mount_point in wsl_mount_points:
-                    if Path(mount_point).exists():
+                    if os.path.exists(mount_point):
                         return True
             
             return False
@@ -1266,43 +1350,82 @@ class SystemChecker:
             self.logger.debug(f"WSL detection failed: {e}", category="system")
             return False
     
+    def _list_windows_users(self, mount_base: Path) -> List[str]:
+        """List real Windows user profile names under a WSL drive mount"""
+        system_profiles = {"Public", "Default", "All Users", "Default User"}
+        
+        try:
+            with os.scandir(mount_base / "Users") as entries:
+                return [
+                    entry.name for entry in entries
+                    if entry.name not in system_profiles and entry.is_dir()
+                ]
+        except OSError as e:
+            self.logger.debug(f"Could not list Windows users under {mount_base}: {e}", category="system")
+            return []
+    
     def _check_windows_claude_code_from_wsl(self) -> Optional[Dict]:
         """Check for Claude Code installed on Windows but accessible from WSL"""
         try:
+            # WSL appends the Windows PATH (/mnt/c/...) to its own, so a plain PATH
+            # lookup finds most installs without spawning any Windows shell
+            for binary in ("claude-code.exe", "claude-code"):
+                found = shutil.which(binary)
+                if found and found.startswith("/mnt/"):
+                    result = subprocess.run(
+                        [found, "--version"],
+                        **SUBPROCESS_KW,
+                        timeout=10
+                    )
+                    
+                    if result.returncode == 0:
+                        version = result.stdout.strip()
+                        self.logger.info(f"Claude Code detected on Windows PATH from WSL at {found}: {version}", category="system")
+                        return {
+                            "name": "Claude Code",
+                            "version": version,
+                            "path": f"Windows via WSL ({found})",
+                            "extensions": EMPTY_EXTENSIONS,
+                            "environment": "Windows-WSL"
+                        }
+            
             # Common Windows paths accessible through WSL mounts
             windows_paths = []
             
             # Check common Windows drive mounts
             for drive in ['c', 'd', 'e']:
                 mount_base = Path(f"/mnt/{drive}")
-                if mount_base.exists():
-                    # Add common Windows installation paths
+                if os.path.exists(mount_base):
+                    # User installations - only for user profiles that actually exist,
+                    # since the WSL $USER rarely matches the Windows username
+                    for win_user in self._list_windows_users(mount_base):
+                        user_appdata = mount_base / "Users" / win_user / "AppData"
+                        windows_paths.extend([
+                            user_appdata / "Local" / "Programs" / "Claude Code" / "claude-code.exe",
+                            user_appdata / "Roaming" / "npm" / "claude-code.cmd",
+                            user_appdata / "Roaming" / "npm" / "claude-code",
+                            
+                            # Common npm global paths
+                            user_appdata / "Roaming" / "npm" / "node_modules" / "claude-code" / "bin" / "claude-code.js"
+                        ])
+                    
                     windows_paths.extend([
-                        # User installations
-                        mount_base / "Users" / os.environ.get('USER', 'user') / "AppData" / "Local" / "Programs" / "Claude Code" / "claude-code.exe",
-                        mount_base / "Users" / os.environ.get('USER', 'user') / "AppData" / "Roaming" / "npm" / "claude-code.cmd",
-                        mount_base / "Users" / os.environ.get('USER', 'user') / "AppData" / "Roaming" / "npm" / "claude-code",
-                        
                         # System installations
                         mount_base / "Program Files" / "nodejs" / "claude-code.exe",
                         mount_base / "Program Files (x86)" / "nodejs" / "claude-code.exe",
                         mount_base / "nodejs" / "claude-code.exe",
                         
-                        # Common npm global paths
-                        mount_base / "Users" / os.environ.get('USER', 'user') / "AppData" / "Roaming" / "npm" / "node_modules" / "claude-code" / "bin" / "claude-code.js",
-                        
                         # Windows PATH executable
                         mount_base / "Windows" / "System32" / "claude-code.exe"
                     ])
             
             for path in windows_paths:
-                if path.exists():
+                if os.path.exists(path):
                     try:
                         # Try to execute the Windows binary from WSL
                         result = subprocess.run(
                             [str(path), "--version"],
-                            capture_output=True,
-                            text=True,
+                            **SUBPROCESS_KW,
                             timeout=10
                         )
                         
@@ -1313,60 +1436,61 @@ class SystemChecker:
                                 "name": "Claude Code",
                                 "version": version,
                                 "path": f"Windows via WSL ({path})",
-                                "extensions": [],
+                                "extensions": EMPTY_EXTENSIONS,
                                 "environment": "Windows-WSL"
                             }
                     except Exception as e:
                         self.logger.debug(f"Failed to check Windows Claude Code at {path}: {e}", category="system")
                         continue
             
-            # Try to use Windows PowerShell from WSL to detect Claude Code
+            # Try to use Windows PowerShell from WSL to detect Claude Code.
+            # One invocation resolves both the path and the version, since every
+            # powershell.exe launch from WSL is expensive.
+            powershell_answered = False
             try:
-                # Use powershell.exe to run Windows PowerShell from WSL
-                ps_cmd = [
-                    "powershell.exe", "-Command",
-                    "Get-Command claude-code -ErrorAction SilentlyContinue | Select-Object -ExpandProperty Source"
-                ]
+                ps_script = (
+                    "$cmd = Get-Command claude-code -ErrorAction SilentlyContinue; "
+                    "$version = $null; "
+                    "if ($cmd) { $version = (& $cmd.Source --version 2>$null | Out-String).Trim() }; "
+                    "@{ path = $cmd.Source; version = $version } | ConvertTo-Json -Compress"
+                )
+                ps_cmd = ["powershell.exe", "-NoProfile", "-Command", ps_script]
                 
                 result = subprocess.run(
                     ps_cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=15
+                    **SUBPROCESS_KW,
+                    timeout=20
                 )
                 
                 if result.returncode == 0 and result.stdout.strip():
-                    claude_code_path = result.stdout.strip()
-                    
-                    # Try to get version
-                    version_cmd = ["powershell.exe", "-Command", "claude-code --version"]
-                    version_result = subprocess.run(
-                        version_cmd,
-                        capture_output=True,
-                        text=True,
-                        timeout=10
-                    )
-                    
-                    version = version_result.stdout.strip() if version_result.returncode == 0 else "Unknown"
+                    ps_data = json.loads(result.stdout.strip())
+                    powershell_answered = True
+                    claude_code_path = ps_data.get("path")
                     
-                    self.logger.info(f"Claude Code detected via Windows PowerShell from WSL: {claude_code_path}", category="system")
-                    return {
-                        "name": "Claude Code",
-                        "version": version,
-                        "path": f"Windows PowerShell via WSL ({claude_code_path})",
-                        "extensions": [],
-                        "environment": "Windows-WSL"
-                    }
+                    if claude_code_path:
+                        version = ps_data.get("version") or "Unknown"
+                        
+                        self.logger.info(f"Claude Code detected via Windows PowerShell from WSL: {claude_code_path}", category="system")
+                        return {
+                            "name": "Claude Code",
+                            "version": version,
+                            "path": f"Windows PowerShell via WSL ({claude_code_path})",
+                            "extensions": EMPTY_EXTENSIONS,
+                            "environment": "Windows-WSL"
+                        }
                     
             except Exception as e:
                 self.logger.debug(f"Windows PowerShell check from WSL failed: {e}", category="system")
             
+            # PowerShell already searched the Windows PATH - cmd.exe would see the same
+            if powershell_answered:
+                return None
+            
             # Try using cmd.exe to find Claude Code
             try:
                 cmd_result = subprocess.run(
                     ["cmd.exe", "/c", "where claude-code"],
-                    capture_output=True,
-                    text=True,
+                    **SUBPROCESS_KW,
                     timeout=10
                 )
                 
@@ -1376,8 +1500,7 @@ class SystemChecker:
                     # Try to get version
                     version_result = subprocess.run(
                         ["cmd.exe", "/c", "claude-code --version"],
-                        capture_output=True,
-                        text=True,
+                        **SUBPROCESS_KW,
                         timeout=10
                     )
                     
@@ -1388,7 +1511,7 @@ class SystemChecker:
                         "name": "Claude Code",
                         "version": version,
                         "path": f"Windows CMD via WSL ({claude_code_path})",
-                        "extensions": [],
+                        "extensions": EMPTY_EXTENSIONS,
                         "environment": "Windows-WSL"
                     }
                     
@@ -1401,88 +1524,153 @@ class SystemChecker:
             self.logger.debug(f"Windows Claude Code check from WSL failed: {e}", category="system")
             return None
     
+    def _find_claude_code_via_registry(self) -> Optional[Dict]:
+        """Find Claude Code in the Windows uninstall registry without spawning a process"""
+        if not WINDOWS_REGISTRY_AVAILABLE:
+            return None
+        
+        uninstall_keys = [
+            (winreg.HKEY_LOCAL_MACHINE, r"Software\Microsoft\Windows\CurrentVersion\Uninstall"),
+            (winreg.HKEY_LOCAL_MACHINE, r"Software\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"),
+            (winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Uninstall")
+        ]
+        
+        for hive, key_path in uninstall_keys:
+            try:
+                with winreg.OpenKey(hive, key_path) as uninstall_key:
+                    subkey_count = winreg.QueryInfoKey(uninstall_key)[0]
+                    for index in range(subkey_count):
+                        try:
+                            with winreg.OpenKey(uninstall_key, winreg.EnumKey(uninstall_key, index)) as app_key:
+                                name, _ = winreg.QueryValueEx(app_key, "DisplayName")
+                                if 'claude' not in name.lower() or 'code' not in name.lower():
+                                    continue
+                                
+                                try:
+                                    version, _ = winreg.QueryValueEx(app_key, "DisplayVersion")
+                                except FileNotFoundError:
+                                    version = "Unknown"
+                                try:
+                                    install_location, _ = winreg.QueryValueEx(app_key, "InstallLocation")
+                                except FileNotFoundError:
+                                    install_location = "Unknown"
+                        except OSError:
+                            continue
+                        
+                        self.logger.info(f"Claude Code found in uninstall registry: {name} v{version}", category="system")
+                        
+                        return {
+                            "name": "Claude Code",
+                            "version": version,
+                            "path": "Windows Package (registry)",
+                            "install_location": install_location or "Unknown",
+                            "extensions": EMPTY_EXTENSIONS
+                        }
+            except OSError as e:
+                self.logger.debug(f"Could not read uninstall registry {key_path}: {e}", category="system")
+        
+        return None
+    
     def _find_claude_code_via_windows_packages(self) -> Optional[Dict]:
         """Find Claude Code using Windows package management"""
+        # Query Get-Package and winget from a single PowerShell process
+        package_data = []
+        winget_packages = []
+        winget_output = ""
         try:
-            # Method 1: Use PowerShell Get-Package to find Claude Code
-            self.logger.debug("Checking for Claude Code via PowerShell Get-Package", category="system")
+            self.logger.debug("Checking for Claude Code via PowerShell Get-Package and winget", category="system")
             
-            ps_cmd = [
-                "powershell", "-Command", 
-                "Get-Package | Where-Object { $_.Name -like '*Claude*Code*' -or $_.Name -like '*ClaudeCode*' } | Select-Object Name, Version, Source, InstallLocation | ConvertTo-Json"
-            ]
+            # Prefer the structured Microsoft.WinGet.Client cmdlets; only fall back
+            # to scraping 'winget list' text when the module is not installed
+            ps_script = (
+                "$packages = @(Get-Package -ErrorAction SilentlyContinue | "
+                "Where-Object { $_.Name -like '*Claude*Code*' -or $_.Name -like '*ClaudeCode*' } | "
+                "Select-Object Name, Version, Source, InstallLocation); "
+                "$wingetPackages = $null; $winget = ''; "
+                "try { Import-Module Microsoft.WinGet.Client -ErrorAction Stop; "
+                "$wingetPackages = @(Get-WinGetPackage -Query 'claude-code' -ErrorAction Stop | "
+                "Select-Object Id, Name, InstalledVersion, Source) } "
+                "catch { if (Get-Command winget -ErrorAction SilentlyContinue) { "
+                "$winget = (winget list claude-code | Out-String); "
+                "if ($LASTEXITCODE -ne 0) { $winget = '' } } }; "
+                "@{ packages = $packages; winget_packages = $wingetPackages; winget = $winget } | "
+                "ConvertTo-Json -Depth 3 -Compress"
+            )
+            ps_cmd = ["powershell", "-NoProfile", "-Command", ps_script]
             
             result = subprocess.run(
                 ps_cmd,
-                capture_output=True,
-                text=True,
-                timeout=15,
-                creationflags=subprocess.CREATE_NO_WINDOW
+                **SUBPROCESS_KW,
+                timeout=30
             )
             
             if result.returncode == 0 and result.stdout.strip():
                 try:
-                    package_data = json.loads(result.stdout.strip())
+                    ps_data = json.loads(result.stdout.strip())
+                    package_data = ps_data.get("packages") or []
                     if not isinstance(package_data, list):
                         package_data = [package_data]
-                    
-                    for package in package_data:
-                        name = package.get('Name', '')
-                        if 'claude' in name.lower() and 'code' in name.lower():
-                            version = package.get('Version', 'Unknown')
-                            install_location = package.get('InstallLocation', 'Unknown')
-                            source = package.get('Source', 'Unknown')
-                            
-                            self.logger.info(f"Claude Code found via Get-Package: {name} v{version}", category="system")
-                            
-                            return {
-                                "name": "Claude Code",
-                                "version": version,
-                                "path": f"Windows Package ({source})",
-                                "install_location": install_location,
-                                "extensions": []
-                            }
-                            
+                    winget_packages = ps_data.get("winget_packages") or []
+                    if not isinstance(winget_packages, list):
+                        winget_packages = [winget_packages]
+                    winget_output = ps_data.get("winget") or ""
                 except json.JSONDecodeError as e:
-                    self.logger.debug(f"Could not parse Claude Code Get-Package JSON: {e}", category="system")
+                    self.logger.debug(f"Could not parse Claude Code package query JSON: {e}", category="system")
                     
         except Exception as e:
-            self.logger.debug(f"Claude Code Get-Package check failed: {e}", category="system")
+            self.logger.debug(f"Claude Code package query failed: {e}", category="system")
         
-        # Method 2: Use winget to find Claude Code
-        try:
-            self.logger.debug("Checking for Claude Code via winget", category="system")
-            
-            winget_cmd = ["winget", "list", "claude-code"]
-            
-            result = subprocess.run(
-                winget_cmd,
-                capture_output=True,
-                text=True,
-                timeout=15,
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
-            
-            if result.returncode == 0 and "claude-code" in result.stdout.lower():
-                lines = result.stdout.split('\n')
-                for line in lines:
-                    if 'claude-code' in line.lower() and not line.startswith('-'):
-                        parts = line.split()
-                        if len(parts) >= 3:
-                            name = parts[0]
-                            version = parts[2] if len(parts) > 2 else "Unknown"
-                            
-                            self.logger.info(f"Claude Code found via winget: {name} v{version}", category="system")
-                            
-                            return {
-                                "name": "Claude Code",
-                                "version": version,
-                                "path": "Windows Package (winget)",
-                                "extensions": []
-                            }
-                            
-        except Exception as e:
-            self.logger.debug(f"Claude Code winget check failed: {e}", category="system")
+        # Method 1: Get-Package results
+        for package in package_data:
+            name = package.get('Name', '')
+            if 'claude' in name.lower() and 'code' in name.lower():
+                version = package.get('Version', 'Unknown')
+                install_location = package.get('InstallLocation', 'Unknown')
+                source = package.get('Source', 'Unknown')
+                
+                self.logger.info(f"Claude Code found via Get-Package: {name} v{version}", category="system")
+                
+                return {
+                    "name": "Claude Code",
+                    "version": version,
+                    "path": f"Windows Package ({source})",
+                    "install_location": install_location,
+                    "extensions": EMPTY_EXTENSIONS
+                }
+        
+        # Method 2: winget results (structured cmdlet output)
+        for package in winget_packages:
+            package_id = package.get('Id') or package.get('Name') or ''
+            if 'claude' in package_id.lower() and 'code' in package_id.lower():
+                version = package.get('InstalledVersion') or "Unknown"
+                source = package.get('Source') or "winget"
+                
+                self.logger.info(f"Claude Code found via Get-WinGetPackage: {package_id} v{version}", category="system")
+                
+                return {
+                    "name": "Claude Code",
+                    "version": version,
+                    "path": f"Windows Package ({source})",
+                    "extensions": EMPTY_EXTENSIONS
+                }
+        
+        # Method 3: winget results (text output, when the WinGet module is missing)
+        if "claude-code" in winget_output.lower():
+            for line in winget_output.split('\n'):
+                if 'claude-code' in line.lower() and not line.startswith('-'):
+                    parts = line.split()
+                    if len(parts) >= 3:
+                        name = parts[0]
+                        version = parts[2] if len(parts) > 2 else "Unknown"
+                        
+                        self.logger.info(f"Claude Code found via winget: {name} v{version}", category="system")
+                        
+                        return {
+                            "name": "Claude Code",
+                            "version": version,
+                            "path": "Windows Package (winget)",
+                            "extensions": EMPTY_EXTENSIONS
+                        }
         
         return None
     
@@ -1491,12 +1679,13 @@ class SystemChecker:
         self.logger.info("Attempting to install Node.js automatically", category="system")
         
         try:
-            if platform.system() == "Windows":
-                # Check if winget is available first
+            if IS_WINDOWS:
+                # Check if winget is available first - only the exit code matters
                 winget_check = subprocess.run(
                     ["winget", "--version"],
-                    capture_output=True,
-                    text=True,
+                    **SUBPROCESS_FLAGS,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     timeout=10
                 )
                 
@@ -1521,35 +1710,37 @@ class SystemChecker:
                 for cmd in winget_commands:
                     try:
                         self.logger.info(f"Trying: {' '.join(cmd)}", category="system")
-                        result = subprocess.run(
-                            cmd,
-                            capture_output=True,
-                            text=True,
-                            timeout=600,  # 10 minutes timeout for installation
-                            creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0
-                        )
+                        returncode = self._run_streaming(cmd, timeout=600)  # 10 minutes timeout for installation
                         
-                        self.logger.info(f"Command output: {result.stdout}", category="system")
-                        if result.stderr:
-                            self.logger.warning(f"Command stderr: {result.stderr}", category="system")
-                        
-                        if result.returncode == 0:
-                            # Wait a moment for installation to complete
-                            import time
-                            time.sleep(5)
-                            
-                            # Try to refresh PATH and test Node.js
-                            self._refresh_environment_path()
-                            
-                            # Test if Node.js is now available
-                            test_result = subprocess.run(
-                                ["node", "--version"],
-                                capture_output=True,
-                                text=True,
-                                timeout=10
-                            )
+                        if returncode == 0:
+                            # Poll for Node.js with bounded backoff instead of a fixed
+                            # wait - the installer usually settles well under a second
+                            test_result = None
+                            delay = 0.1
+                            deadline = time.monotonic() + 10
+                            while True:
+                                # Refresh PATH and test if Node.js is now available
+                                self._refresh_environment_path()
+                                try:
+                                    test_result = subprocess.run(
+                                        ["node", "--version"],
+                                        **SUBPROCESS_FLAGS,
+                                        stdout=subprocess.PIPE,
+                                        stderr=subprocess.DEVNULL,
+                                        text=True,
+                                        timeout=3
+                                    )
+                                    if test_result.returncode == 0:
+                                        break
+                                except (OSError, subprocess.TimeoutExpired):
+                                    test_result = None
+                                
+                                if time.monotonic() + delay > deadline:
+                                    break
+                                time.sleep(delay)
+                                delay = min(delay * 1.7, 1.0)
                             
-                            if test_result.returncode == 0:
+                            if test_result is not None and test_result.returncode == 0:
                                 version = test_result.stdout.strip()
                                 self.logger.info(f"Node.js installed successfully: {version}", category="system")
                                 return {
@@ -1560,7 +1751,7 @@ class SystemChecker:
                             else:
                                 self.logger.warning("Node.js installation completed but not accessible", category="system")
                         else:
-                            self.logger.warning(f"winget command failed with code {result.returncode}", category="system")
+                            self.logger.warning(f"winget command failed with code {returncode}", category="system")
                             continue  # Try next command
                             
                     except subprocess.TimeoutExpired:
@@ -1588,13 +1779,60 @@ class SystemChecker:
                 "details": "Please install manually from https://nodejs.org"
             }
     
+    def _run_streaming(self, cmd: List[str], timeout: float) -> int:
+        """Run a long installer command, logging its output line by line
+        
+        Output is streamed instead of buffered so progress shows up in the log
+        while the command runs, and only the last few lines are kept for the
+        failure summary. Raises subprocess.TimeoutExpired when the deadline passes.
+        """
+        process = subprocess.Popen(
+            cmd,
+            **SUBPROCESS_FLAGS,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        )
+        
+        # Reading stdout blocks, so enforce the deadline from a timer thread
+        watchdog = threading.Timer(timeout, process.kill)
+        watchdog.start()
+        started = time.monotonic()
+        output_tail = deque(maxlen=20)
+        
+        try:
+            for line in process.stdout:
+                line = line.rstrip()
+                if line:
+                    output_tail.append(line)
+                    self.logger.debug(f"[{cmd[0]}] {line}", category="system")
+            returncode = process.wait()
+        finally:
+            watchdog.cancel()
+            process.stdout.close()
+        
+        if time.monotonic() - started >= timeout:
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        
+        if returncode != 0 and output_tail:
+            self.logger.warning(f"Command output (last lines): {' | '.join(output_tail)}", category="system")
+        
+        return returncode
+    
     def _refresh_environment_path(self):
         """Refresh the PATH environment variable on Windows"""
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             try:
                 # Get updated PATH from registry
                 if WINDOWS_REGISTRY_AVAILABLE:
-                    import winreg
+                    # Skip the registry reads when nothing has changed since last time
+                    if self._path_cache is not None and not self._registry_path_changed():
+                        os.environ["PATH"] = self._path_cache
+                        return
+                    
+                    # (Re-)arm the change watcher before reading so no update is missed
+                    self._watch_registry_path()
                     
                     # Read machine PATH
                     with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
@@ -1611,11 +1849,79 @@ class SystemChecker:
                     # Update current process PATH
                     new_path = f"{machine_path};{user_path}"
                     os.environ["PATH"] = new_path
+                    self._path_cache = new_path
                     self.logger.info("Environment PATH refreshed", category="system")
                     
             except Exception as e:
                 self.logger.warning(f"Failed to refresh PATH: {e}", category="system")
     
+    def _watch_registry_path(self):
+        """Register for change notifications on the machine and user Environment keys
+        
+        RegNotifyChangeKeyValue notifications are one-shot, so this is called again
+        after every re-read. If the watcher cannot be set up the PATH cache is not
+        trusted and every refresh falls back to reading the registry.
+        """
+        try:
+            import ctypes
+            
+            api = _registry_notify_api()
+            REG_NOTIFY_CHANGE_LAST_SET = 0x00000004
+            
+            if self._path_notify_event is None:
+                # Manual-reset event shared by both keys, initially not signaled
+                event = api.CreateEventW(None, True, False, None)
+                if not event:
+                    raise ctypes.WinError(ctypes.get_last_error())
+                self._path_notify_event = event
+                self._path_watch_keys = [
+                    winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
+                                   r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment",
+                                   0, winreg.KEY_NOTIFY),
+                    winreg.OpenKey(winreg.HKEY_CURRENT_USER, "Environment", 0, winreg.KEY_NOTIFY)
+                ]
+            elif not api.ResetEvent(self._path_notify_event):
+                raise ctypes.WinError(ctypes.get_last_error())
+            
+            for key in self._path_watch_keys:
+                status = api.RegNotifyChangeKeyValue(
+                    key.handle, False, REG_NOTIFY_CHANGE_LAST_SET, self._path_notify_event, True
+                )
+                if status != 0:
+                    raise OSError(status, "RegNotifyChangeKeyValue failed")
+                    
+        except Exception as e:
+            self.logger.debug(f"Registry PATH watcher unavailable, PATH will be re-read each time: {e}", category="system")
+            self._path_notify_event = None
+            self._path_watch_keys = []
+    
+    def _registry_path_changed(self) -> bool:
+        """Check whether the registry signaled a PATH change since the last read
+        
+        Only a timed-out wait means "unchanged". A failed wait (e.g. an invalid
+        handle) counts as a change and drops the watcher, so the next refresh
+        re-reads the registry and sets up a new one.
+        """
+        if self._path_notify_event is None:
+            return True
+        
+        WAIT_TIMEOUT = 0x00000102
+        try:
+            result = _registry_notify_api().WaitForSingleObject(self._path_notify_event, 0)
+        except Exception:
+            result = None
+        
+        if result == WAIT_TIMEOUT:
+            return False
+        
+        WAIT_OBJECT_0 = 0
+        if result != WAIT_OBJECT_0:
+            self.logger.debug(f"Registry PATH watcher failed (wait result {result}), re-reading PATH", category="system")
+            self._path_cache = None
+            self._path_notify_event = None
+            self._path_watch_keys = []
+        return True
+    
     def _install_winget(self) -> Dict:
         """Attempt to install winget automatically"""
         self.logger.info("Attempting to install winget automatically", category="system")
@@ -1627,20 +1933,26 @@ class SystemChecker:
         }
     
     def get_summary(self) -> Dict:
-        """Get a summary of all check results"""
+        """Get a summary of all check results
+        
+        The summary is computed once per check_all() run; the display formatter and
+        the GUI both ask for it after each run.
+        """
         if not self.results:
             return {"status": "not_run", "message": "System check not run yet"}
         
-        passed = sum(1 for result in self.results.values() if result["status"])
+        if self._summary is None or self._summary[0] is not self.results:
+            self._summary = (self.results, self._build_summary())
+        return self._summary[1]
+    
+    def _build_summary(self) -> Dict:
+        """Summarize self.results"""
+        passed = sum(bool(result["status"]) for result in self.results.values())
         total = len(self.results)
-        critical_failed = []
-        
-        # Define critical checks
-        critical_checks = ["python", "platform", "internet", "node_js"]
-        
-        for check in critical_checks:
-            if check in self.results and not self.results[check]["status"]:
-                critical_failed.append(check)
+        critical_failed = [
+            check for check, result in self.results.items()
+            if check in self.CRITICAL_CHECKS and not result["status"]
+        ]
         
         if critical_failed:
             return {
@@ -1670,32 +1982,33 @@ class SystemChecker:
         if not self.results:
             return "System check not run yet."
         
-        output = []
-        output.append("=== SYSTEM COMPATIBILITY CHECK ===\n")
+        parts = ["=== SYSTEM COMPATIBILITY CHECK ===\n"]
+        parts.extend(
+            self._format_check_result(check_name, result)
+            for check_name, result in self.results.items()
+        )
+        parts.append(self._format_summary())
         
-        for check_name, result in self.results.items():
-            status_icon = "[+]" if result["status"] else "[X]"
-            status_text = "PASS" if result["status"] else "FAIL"
-            
-            output.append(f"{status_icon} {check_name.upper()}: {status_text}")
-            output.append(f"   {result['message']}")
-            if result.get("details"):
-                output.append(f"   Details: {result['details']}")
-            output.append("")
+        return "\n".join(parts)
+    
+    def _format_check_result(self, check_name: str, result: Dict) -> str:
+        """Format a single check result as one display block"""
+        status_icon, status_text = ("[+]", "PASS") if result["status"] else ("[X]", "FAIL")
+        details = f"\n   Details: {result['details']}" if result.get("details") else ""
         
-        # Add summary
+        return f"{status_icon} {check_name.upper()}: {status_text}\n   {result['message']}{details}\n"
+    
+    def _format_summary(self) -> str:
+        """Format the overall summary block for display"""
         summary = self.get_summary()
-        output.append("=== SUMMARY ===")
-        output.append(f"Status: {summary['status'].upper()}")
-        output.append(f"Message: {summary['message']}")
+        text = f"=== SUMMARY ===\nStatus: {summary['status'].upper()}\nMessage: {summary['message']}"
         
         if summary['status'] == 'failed':
-            output.append("\n[!] Critical issues detected!")
-            output.append("Please resolve the failed checks before proceeding.")
+            text += "\n\n[!] Critical issues detected!\nPlease resolve the failed checks before proceeding."
         elif summary['status'] == 'passed':
-            output.append("\n[+] System is ready for MCP installation!")
+            text += "\n\n[+] System is ready for MCP installation!"
         
-        return "\n".join(output)
+        return text
     
     def is_docker_available(self) -> bool:
         """Quick check if Docker is available and running"""
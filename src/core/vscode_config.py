@@ -3,13 +3,47 @@ VS Code extension configuration manager for MCP servers
 Handles Cline and Roo extension MCP configurations
 """
 
+import copy
+import functools
 import json
 import os
+import re
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 import platform
 
+# Faster JSON parsing/serialization (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..utils.logger import get_logger
+from ..utils.workers import DaemonThreadPool
+
+# platform.system() is constant for the life of the process
+IS_WINDOWS = platform.system() == "Windows"
+
+# UTF-8 byte order mark some editors prepend to settings files
+UTF8_BOM = b'\xef\xbb\xbf'
+
+# Opening of the "mcpServers" object, used to splice in new servers
+MCP_SECTION_PATTERN = re.compile(r'"mcpServers"\s*:\s*\{')
+
+# Held around every read-modify-write of a settings file, so servers installed
+# concurrently (possibly through different manager instances) don't drop each other
+CONFIG_WRITE_LOCK = threading.RLock()
+
+
+def _serialized_write(method):
+    """Run a settings file update while holding CONFIG_WRITE_LOCK"""
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with CONFIG_WRITE_LOCK:
+            return method(*args, **kwargs)
+    return wrapper
 
 
 class VSCodeExtensionConfig:
@@ -24,25 +58,41 @@ class VSCodeExtensionConfig:
                 "name": "Cline",
                 "id": "saoudrizwan.claude-dev",
                 "config_path": self._get_cline_config_path(),
-                "config_file": "cline_mcp_settings.json"
+                "config_file": "cline_mcp_settings.json",
+                "formatter": self._format_server_entry
             },
             "roo": {
                 "name": "Roo", 
                 "id": "rooveterinaryinc.roo-cline",
                 "config_path": self._get_roo_config_path(),
-                "config_file": "mcp_settings.json"
+                "config_file": "mcp_settings.json",
+                "formatter": self._format_server_entry
             },
             "claude_desktop": {
                 "name": "Claude Desktop",
                 "id": "claude-desktop",
                 "config_path": self._get_claude_desktop_config_path(),
-                "config_file": "claude_desktop_config.json"
+                "config_file": "claude_desktop_config.json",
+                "formatter": self._format_claude_desktop_entry
             }
         }
+        
+        # Resolve each configuration file location once instead of per call
+        for ext_info in self.extension_configs.values():
+            ext_info["config_dir"] = Path(ext_info["config_path"])
+            ext_info["config_file_path"] = ext_info["config_dir"] / ext_info["config_file"]
+        
+        # Parsed settings per extension, tagged with the (mtime_ns, size) they were read at
+        self._config_cache: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+        
+        # Raw settings text and the offset of the "mcpServers" closing brace, per
+        # extension, so adding a server can splice instead of re-serializing
+        self._mcp_sections: Dict[str, Tuple[Tuple[int, int], str, int]] = {}
+        self._json_decoder = json.JSONDecoder()
     
     def _get_cline_config_path(self) -> str:
         """Get Cline extension MCP configuration path"""
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             appdata = os.environ.get("APPDATA", "")
             return os.path.join(
                 appdata, 
@@ -59,7 +109,7 @@ class VSCodeExtensionConfig:
     
     def _get_roo_config_path(self) -> str:
         """Get Roo extension MCP configuration path"""
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             appdata = os.environ.get("APPDATA", "")
             return os.path.join(
                 appdata,
@@ -76,7 +126,7 @@ class VSCodeExtensionConfig:
     
     def _get_claude_desktop_config_path(self) -> str:
         """Get Claude Desktop MCP configuration path"""
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             appdata = os.environ.get("APPDATA", "")
             return os.path.join(appdata, "Claude")
         elif platform.system() == "Darwin":
@@ -88,6 +138,49 @@ class VSCodeExtensionConfig:
             home = Path.home()
             return str(home / ".config" / "Claude")
     
+    def _read_config_file(self, config_file: Path) -> Dict:
+        """Parse a JSON configuration file, tolerating a leading BOM"""
+        with open(config_file, 'rb') as f:
+            data = f.read()
+        
+        # Files written here never carry a BOM, so the common case is a
+        # prefix check with no copy; only editor-saved files get sliced
+        if data[:3] == UTF8_BOM:
+            data = memoryview(data)[3:]
+        
+        if ORJSON_AVAILABLE:
+            return orjson.loads(data)
+        # Decode as UTF-8 explicitly rather than letting json sniff UTF-16/32
+        return json.loads(str(data, 'utf-8'))
+    
+    def _serialize_config(self, config: Dict) -> bytes:
+        """Serialize a configuration as indented UTF-8 JSON"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        return json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    def _write_config_file(self, config_file: Path, config: Dict):
+        """Write a configuration to its settings file"""
+        self._write_config_bytes(config_file, self._serialize_config(config))
+    
+    def _write_config_bytes(self, config_file: Path, data: bytes):
+        """Atomically replace a settings file with the given bytes"""
+        # Write to a sibling temp file and rename over the target, so the
+        # extension never sees a half-written settings file
+        tmp_file = config_file.with_suffix('.tmp')
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, config_file)
+        except Exception:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+            raise
+    
     def get_extension_config(self, extension: str) -> Optional[Dict]:
         """Read MCP configuration for a specific extension"""
         if extension not in self.extension_configs:
@@ -95,24 +188,45 @@ class VSCodeExtensionConfig:
             return None
         
         ext_info = self.extension_configs[extension]
-        config_dir = Path(ext_info["config_path"])
-        config_file = config_dir / ext_info["config_file"]
+        config_dir = ext_info["config_dir"]
+        config_file = ext_info["config_file_path"]
         
         try:
-            if config_file.exists():
-                with open(config_file, 'r', encoding='utf-8-sig') as f:
-                    config = json.load(f)
-                
-                self.logger.info(f"Loaded {ext_info['name']} MCP configuration", category="system")
-                return config
-            else:
+            try:
+                stat_result = os.stat(config_file)
+            except FileNotFoundError:
                 self.logger.info(f"{ext_info['name']} MCP configuration not found at {config_file}")
                 return None
+            
+            # Callers may edit the config before writing it back; the cached dict
+            # must keep matching the file, so they get their own copy
+            return copy.deepcopy(self._load_config_cached(extension, config_file, stat_result))
                 
         except Exception as e:
             self.logger.error(f"Failed to read {ext_info['name']} configuration", e)
             return None
     
+    def _load_config_cached(self, extension: str, config_file: Path, stat_result: os.stat_result) -> Dict:
+        """Return the parsed settings file, re-reading only when it changed on disk
+        
+        The returned dict is the cached one: read it, never modify it.
+        """
+        cache_key = (stat_result.st_mtime_ns, stat_result.st_size)
+        cached = self._config_cache.get(extension)
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+        
+        config = self._read_config_file(config_file)
+        self._config_cache[extension] = (cache_key, config)
+        
+        self.logger.info(f"Loaded {self.extension_configs[extension]['name']} MCP configuration", category="system")
+        return config
+    
+    def _invalidate_config_cache(self, extension: str):
+        """Drop the memoized settings for an extension that is about to change"""
+        self._config_cache.pop(extension, None)
+    
+    @_serialized_write
     def update_extension_config(self, extension: str, mcp_servers: List[Dict]) -> bool:
         """Update MCP server configuration for an extension"""
         if extension not in self.extension_configs:
@@ -120,8 +234,11 @@ class VSCodeExtensionConfig:
             return False
         
         ext_info = self.extension_configs[extension]
-        config_dir = Path(ext_info["config_path"])
-        config_file = config_dir / ext_info["config_file"]
+        config_dir = ext_info["config_dir"]
+        config_file = ext_info["config_file_path"]
+        
+        self._invalidate_config_cache(extension)
+        self._mcp_sections.pop(extension, None)
         
         try:
             # Create directory if it doesn't exist
@@ -129,22 +246,15 @@ class VSCodeExtensionConfig:
             
             # Load existing configuration or create new
             if config_file.exists():
-                with open(config_file, 'r', encoding='utf-8-sig') as f:
-                    config = json.load(f)
+                config = self._read_config_file(config_file)
             else:
                 config = {}
             
             # Update MCP servers section
-            if extension == "cline":
-                config["mcpServers"] = self._format_servers_for_cline(mcp_servers)
-            elif extension == "roo":
-                config["mcpServers"] = self._format_servers_for_roo(mcp_servers)
-            elif extension == "claude_desktop":
-                config["mcpServers"] = self._format_servers_for_claude_desktop(mcp_servers)
+            config["mcpServers"] = dict(map(ext_info["formatter"], mcp_servers))
             
             # Write updated configuration
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            self._write_config_file(config_file, config)
             
             self.logger.info(f"Updated {ext_info['name']} MCP configuration with {len(mcp_servers)} servers")
             return True
@@ -153,92 +263,145 @@ class VSCodeExtensionConfig:
             self.logger.error(f"Failed to update {ext_info['name']} configuration", e)
             return False
     
-    def _format_servers_for_cline(self, servers: List[Dict]) -> Dict:
-        """Format server configurations for Cline extension"""
-        formatted_servers = {}
-        
-        for server in servers:
-            server_name = server.get("name", "unknown")
-            server_config = {
-                "command": server.get("command", ""),
-                "args": server.get("args", []),
-                "env": server.get("env", {})
-            }
-            
-            formatted_servers[server_name] = server_config
-        
-        return formatted_servers
-    
-    def _format_servers_for_roo(self, servers: List[Dict]) -> Dict:
-        """Format server configurations for Roo extension"""
-        # Roo uses similar format to Cline
-        return self._format_servers_for_cline(servers)
+    def _format_server_entry(self, server: Dict) -> Tuple[str, Dict]:
+        """Format a server configuration for Cline and Roo extensions"""
+        return server.get("name", "unknown"), {
+            "command": server.get("command", ""),
+            "args": server.get("args") or [],
+            "env": server.get("env") or {}
+        }
     
-    def _format_servers_for_claude_desktop(self, servers: List[Dict]) -> Dict:
-        """Format server configurations for Claude Desktop"""
-        formatted_servers = {}
-        
-        for server in servers:
-            server_name = server.get("name", "unknown")
-            # Claude Desktop uses safe keys (lowercase, underscores)
-            server_key = server_name.lower().replace(" ", "_").replace("-", "_")
-            
-            server_config = {
-                "command": server.get("command", ""),
-                "args": server.get("args", [])
-            }
-            
-            # Only add env if it exists and is not empty
-            if server.get("env"):
-                server_config["env"] = server.get("env", {})
-            
-            formatted_servers[server_key] = server_config
+    def _format_claude_desktop_entry(self, server: Dict) -> Tuple[str, Dict]:
+        """Format a server configuration for Claude Desktop"""
+        # Claude Desktop uses safe keys (lowercase, underscores)
+        server_key = server.get("name", "unknown").lower().replace(" ", "_").replace("-", "_")
         
-        return formatted_servers
+        server_config = {
+            "command": server.get("command", ""),
+            "args": server.get("args") or []
+        }
+        
+        # Only add env if it exists and is not empty
+        if server.get("env"):
+            server_config["env"] = server["env"]
+        
+        return server_key, server_config
     
+    @_serialized_write
     def add_server_to_extension(self, extension: str, server_config: Dict) -> bool:
         """Add a single MCP server to an extension's configuration"""
+        if extension not in self.extension_configs:
+            self.logger.warning(f"Unknown extension: {extension}")
+            return False
+        
         current_config = self.get_extension_config(extension)
         
+        # The settings file is rewritten below
+        self._invalidate_config_cache(extension)
+        
+        config_loaded = current_config is not None
         if current_config is None:
             current_config = {"mcpServers": {}}
         
         if "mcpServers" not in current_config:
             current_config["mcpServers"] = {}
         
-        # Add the new server
-        server_name = server_config.get("name", "unknown")
+        # Build the new server entry
+        server_key, server_entry = self.extension_configs[extension]["formatter"](server_config)
         
-        if extension == "cline":
-            current_config["mcpServers"][server_name] = {
-                "command": server_config.get("command", ""),
-                "args": server_config.get("args", []),
-                "env": server_config.get("env", {})
-            }
-        elif extension == "roo":
-            current_config["mcpServers"][server_name] = {
-                "command": server_config.get("command", ""),
-                "args": server_config.get("args", []),
-                "env": server_config.get("env", {})
-            }
-        elif extension == "claude_desktop":
-            # Claude Desktop uses a slightly different format - create a safe server key
-            server_key = server_name.lower().replace(" ", "_").replace("-", "_")
-            current_config["mcpServers"][server_key] = {
-                "command": server_config.get("command", ""),
-                "args": server_config.get("args", [])
-            }
-            # Add env only if it exists and is not empty
-            if server_config.get("env"):
-                current_config["mcpServers"][server_key]["env"] = server_config.get("env", {})
+        # A brand new server can be spliced into an existing file as-is
+        if config_loaded and server_key not in current_config["mcpServers"]:
+            if self._append_server_entry(extension, current_config, server_key, server_entry):
+                return True
+        
+        current_config["mcpServers"][server_key] = server_entry
         
         # Save the updated configuration
         return self._save_extension_config(extension, current_config)
     
+    def _locate_mcp_section(self, extension: str, servers: Dict) -> Optional[Tuple[Tuple[int, int], str, int]]:
+        """Find the "mcpServers" closing brace in the settings file on disk"""
+        config_file = self.extension_configs[extension]["config_file_path"]
+        stat_result = os.stat(config_file)
+        cache_key = (stat_result.st_mtime_ns, stat_result.st_size)
+        
+        cached = self._mcp_sections.get(extension)
+        if cached is not None and cached[0] == cache_key:
+            return cached
+        
+        with open(config_file, 'rb') as f:
+            data = f.read()
+        if data[:3] == UTF8_BOM:
+            return None
+        text = data.decode('utf-8')
+        
+        # Only trust a single match whose object decodes to the servers we hold
+        matches = list(MCP_SECTION_PATTERN.finditer(text))
+        if len(matches) != 1:
+            return None
+        open_brace = matches[0].end() - 1
+        section, section_end = self._json_decoder.raw_decode(text, open_brace)
+        if section != servers:
+            return None
+        
+        located = (cache_key, text, section_end - 1)
+        self._mcp_sections[extension] = located
+        return located
+    
+    def _append_server_entry(self, extension: str, current_config: Dict, server_key: str, server_entry: Dict) -> bool:
+        """Insert a new server into the settings file without re-serializing it"""
+        ext_info = self.extension_configs[extension]
+        config_file = ext_info["config_file_path"]
+        
+        try:
+            located = self._locate_mcp_section(extension, current_config["mcpServers"])
+            if located is None:
+                return False
+            _, text, close_brace = located
+            
+            # Only splice into the indented layout this class writes; the closing
+            # brace must sit on its own line after at least one existing server
+            line_start = text.rfind('\n', 0, close_brace) + 1
+            indent = text[line_start:close_brace]
+            if line_start == 0 or indent.strip(" ") or '\r' in text[line_start - 2:line_start]:
+                return False
+            
+            insert_at = line_start - 1
+            while text[insert_at - 1] in ' \t\r\n':
+                insert_at -= 1
+            if text[insert_at - 1] == '{':
+                return False
+            
+            # Serialize just the new entry and indent it one level inside the section
+            entry_lines = self._serialize_config({server_key: server_entry}).decode('utf-8').split('\n')[1:-1]
+            insertion = ',\n' + '\n'.join(indent + line for line in entry_lines)
+            new_text = text[:insert_at] + insertion + text[insert_at:]
+            
+            self._write_config_bytes(config_file, new_text.encode('utf-8'))
+            
+            # Keep both caches in step with what was just written
+            current_config["mcpServers"][server_key] = server_entry
+            stat_result = os.stat(config_file)
+            cache_key = (stat_result.st_mtime_ns, stat_result.st_size)
+            self._config_cache[extension] = (cache_key, current_config)
+            self._mcp_sections[extension] = (cache_key, new_text, close_brace + len(insertion))
+            
+            self.logger.debug(f"Appended server '{server_key}' to {ext_info['name']} configuration", category="install")
+            return True
+            
+        except Exception as e:
+            self.logger.debug(f"Falling back to full rewrite of {ext_info['name']} configuration: {e}", category="install")
+            self._mcp_sections.pop(extension, None)
+            return False
+    
+    @_serialized_write
     def remove_server_from_extension(self, extension: str, server_name: str) -> bool:
         """Remove a MCP server from an extension's configuration"""
         current_config = self.get_extension_config(extension)
         
+        # The settings file is rewritten below
+        self._invalidate_config_cache(extension)
+        
         if current_config is None or "mcpServers" not in current_config:
             self.logger.warning(f"No MCP servers found in {extension} configuration")
             return False
@@ -257,14 +420,16 @@ class VSCodeExtensionConfig:
             return False
         
         ext_info = self.extension_configs[extension]
-        config_dir = Path(ext_info["config_path"])
-        config_file = config_dir / ext_info["config_file"]
+        config_dir = ext_info["config_dir"]
+        config_file = ext_info["config_file_path"]
+        
+        self._invalidate_config_cache(extension)
+        self._mcp_sections.pop(extension, None)
         
         try:
             config_dir.mkdir(parents=True, exist_ok=True)
             
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            self._write_config_file(config_file, config)
             
             return True
             
@@ -281,38 +446,78 @@ class VSCodeExtensionConfig:
         
         return []
     
+    def _scan_dir(self, directory: Path) -> Optional[Dict[str, os.DirEntry]]:
+        """List a directory once, returning its entries by name (None if missing)"""
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name: entry for entry in entries}
+        except OSError:
+            return None
+    
+    def _list_servers_from_entry(self, extension: str, entry: os.DirEntry) -> List[str]:
+        """List configured servers from a scanned settings file entry"""
+        ext_info = self.extension_configs[extension]
+        try:
+            config = self._load_config_cached(extension, Path(entry.path), entry.stat())
+        except Exception as e:
+            self.logger.error(f"Failed to read {ext_info['name']} configuration", e)
+            return []
+        
+        if isinstance(config, dict) and "mcpServers" in config:
+            return list(config["mcpServers"].keys())
+        
+        return []
+    
     def get_extension_status(self) -> Dict[str, Dict]:
-        """Get status of all supported extensions"""
-        status = {}
+        """Get status of all supported extensions, reading their settings files in parallel"""
+        with DaemonThreadPool(max_workers=len(self.extension_configs), thread_name_prefix="extension-config") as executor:
+            futures = {
+                ext_name: executor.submit(self._extension_status, ext_name)
+                for ext_name in self.extension_configs
+            }
+            return {ext_name: future.result() for ext_name, future in futures.items()}
+    
+    def _extension_status(self, ext_name: str) -> Dict:
+        """Installation and configuration status of one extension"""
+        ext_info = self.extension_configs[ext_name]
+        config_dir = ext_info["config_dir"]
+        config_file = ext_info["config_file_path"]
         
-        for ext_name, ext_info in self.extension_configs.items():
-            config_dir = Path(ext_info["config_path"])
-            config_file = config_dir / ext_info["config_file"]
+        # Check if extension/application is installed, listing each directory
+        # once so the same scan also answers whether the settings file exists
+        if ext_name == "claude_desktop":
+            # For Claude Desktop, check if the application directory exists
+            dir_entries = self._scan_dir(config_dir)
+            extension_installed = dir_entries is not None
+        else:
+            # For VS Code extensions, check if extension directory exists
+            parent_entries = self._scan_dir(config_dir.parent)
+            extension_installed = parent_entries is not None
             
-            # Check if extension/application is installed
-            if ext_name == "claude_desktop":
-                # For Claude Desktop, check if the application directory exists
-                extension_installed = config_dir.exists()
+            settings_entry = parent_entries.get(config_dir.name) if parent_entries else None
+            if settings_entry is not None and settings_entry.is_dir():
+                dir_entries = self._scan_dir(config_dir)
             else:
-                # For VS Code extensions, check if extension directory exists
-                extension_installed = config_dir.parent.exists()
-            
-            # Check if MCP configuration exists
-            config_exists = config_file.exists()
-            
-            # Count configured servers
-            servers = self.list_configured_servers(ext_name)
-            
-            status[ext_name] = {
-                "name": ext_info["name"],
-                "installed": extension_installed,
-                "config_exists": config_exists,
-                "config_path": str(config_file),
-                "server_count": len(servers),
-                "servers": servers
-            }
+                dir_entries = None
+        
+        # Check if MCP configuration exists
+        config_entry = dir_entries.get(config_file.name) if dir_entries else None
+        config_exists = config_entry is not None
         
-        return status
+        # Count configured servers
+        if config_entry is not None and config_entry.is_file():
+            servers = self._list_servers_from_entry(ext_name, config_entry)
+        else:
+            servers = []
+        
+        return {
+            "name": ext_info["name"],
+            "installed": extension_installed,
+            "config_exists": config_exists,
+            "config_path": str(config_file),
+            "server_count": len(servers),
+            "servers": servers
+        }
     
     def create_default_config(self, extension: str) -> bool:
         """Create a default MCP configuration for an extension"""
@@ -4,14 +4,228 @@ Provides server discovery, installation, and configuration dialogs
 """
 
 import customtkinter as ctk
+import tkinter as tk
 import threading
 import json
-from typing import Dict, List, Optional, Callable
+import os
+import queue
+import re
+import time
+from concurrent.futures import as_completed
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Dict, List, Optional, Callable
 from pathlib import Path
 
 from ..utils.logger import get_logger
-from ..core.server_manager import MCPServerManager
-from ..core.system_checker import SystemChecker
+from ..utils.workers import DaemonThreadPool
+from .ui_pump import UiPump
+
+if TYPE_CHECKING:
+    from ..core.server_manager import MCPServerManager
+
+# Online discovery results persisted between dialogs (see ServerDiscoveryDialog._cached_discover)
+DISCOVERY_CACHE_FILE = Path.home() / ".cache" / "mcpinstaller" / "discovery.json"
+DISCOVERY_CACHE_TTL = 300  # seconds
+
+# Lists up to this size are drawn in one pass; longer ones are built lazily,
+# LAZY_ROW_CHUNK rows at a time as the user scrolls past LAZY_LOAD_THRESHOLD
+BATCH_DRAW_LIMIT = 200
+LAZY_ROW_CHUNK = 40
+LAZY_LOAD_THRESHOLD = 0.9
+
+# Servers the installation dialog installs at once when parallel installs are on;
+# servers of the same type still take turns (see server_manager.INSTALL_TYPE_LOCKS)
+MAX_PARALLEL_INSTALLS = 4
+
+# How often the installation dialog shows the worker's progress
+PROGRESS_POLL_INTERVAL_MS = 100
+
+# Longest description shown in a server row before it is cut off with "..."
+DESCRIPTION_PREVIEW_LENGTH = 120
+
+# (server key, label) of the optional fields listed in the install dialog and in
+# the technical section of the details dialog, in display order
+INSTALL_INFO_FIELDS = (("package", "Package"), ("repository", "Repository"), ("version", "Version"))
+TECHNICAL_DETAIL_FIELDS = (
+    ("package", "Package"),
+    ("repository", "Repository"),
+    ("image", "Docker Image"),
+    ("version", "Version"),
+    ("language", "Language")
+)
+
+# Progress bar moves smaller than this (under a pixel) are skipped instead of redrawn
+PROGRESS_MIN_STEP = 0.001
+
+# KEY=value lines of the custom server env box; key and value are stripped of
+# spaces and tabs, and lines without "=" are skipped
+ENV_LINE_PATTERN = re.compile(r'^[ \t]*([^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t]*$', re.MULTILINE)
+
+# Retry delay for a modal grab on a window the window manager has not mapped yet
+GRAB_RETRY_MS = 20
+
+# Installation snapshot (see MCPServerManager.get_installation_snapshot) used for
+# rows drawn before the real one has been read: nothing installed or configured
+EMPTY_INSTALLATION_SNAPSHOT = {"npm_packages": frozenset(), "configured": ()}
+
+
+def _truncate_description(description: str) -> str:
+    """Shorten a description to the length shown in server rows"""
+    if len(description) > DESCRIPTION_PREVIEW_LENGTH:
+        return description[:DESCRIPTION_PREVIEW_LENGTH] + "..."
+    return description
+
+
+def _set_progress(progress_bar, value: float):
+    """Set a progress bar, skipping the canvas redraw when it would not visibly move"""
+    if abs(progress_bar.get() - value) >= PROGRESS_MIN_STEP:
+        progress_bar.set(value)
+
+
+def _make_modal(window, parent):
+    """Make window transient for parent and grab input once Tk is idle
+    
+    Called after the window's widgets are built, so the window manager is not
+    queried while the window is still being laid out. A grab on a window that
+    is not viewable yet fails, so it is retried until the window is mapped.
+    """
+    def grab():
+        try:
+            # A window hidden again before the grab ran stays ungrabbed
+            if window.winfo_exists() and window.state() != "withdrawn":
+                window.grab_set()
+        except tk.TclError:
+            window.after(GRAB_RETRY_MS, grab)
+    
+    def attach():
+        if window.winfo_exists():
+            window.transient(parent)
+            grab()
+    
+    window.after_idle(attach)
+
+
+class _TextFeed:
+    """Collects text from any thread and inserts it into a textbox in batches
+    
+    Worker threads only queue their text, and the first line queued asks the
+    UI pump for a flush that inserts everything queued by then. Text written
+    from the Tk thread flushes at once, after anything still queued.
+    """
+    
+    def __init__(self, ui: UiPump, get_textbox: Callable):
+        self._ui = ui
+        self._get_textbox = get_textbox
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._scheduled = False
+    
+    def write(self, text: str):
+        """Queue text for the textbox"""
+        self._queue.put(text)
+        
+        if threading.current_thread() == threading.main_thread():
+            self.flush()
+            return
+        
+        with self._lock:
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._ui.call(self.flush)
+    
+    def flush(self):
+        """Insert all queued text with a single textbox update (Tk thread only)"""
+        with self._lock:
+            self._scheduled = False
+        
+        chunks = []
+        while True:
+            try:
+                chunks.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        if chunks:
+            self._get_textbox().append("".join(chunks))
+
+
+class _LogText:
+    """Append-only log area: a plain tk.Text, kept disabled, inside a CTkFrame
+    
+    CTkTextbox routes every insert and see through its styled wrapper. A raw
+    Text is only switched to "normal" around each batched insert, so a flush
+    from _TextFeed costs a handful of Tcl calls however much text it carries.
+    """
+    
+    def __init__(self, parent, width: int, height: int, font: ctk.CTkFont):
+        theme = ctk.ThemeManager.theme["CTkTextbox"]
+        mode = 1 if ctk.get_appearance_mode() == "Dark" else 0
+        
+        # The frame holds the pixel size CTkTextbox took; the Text fills it
+        self.frame = ctk.CTkFrame(
+            parent,
+            width=width,
+            height=height,
+            fg_color=theme["fg_color"],
+            corner_radius=theme["corner_radius"]
+        )
+        self.frame.pack_propagate(False)
+        
+        scrollbar = ctk.CTkScrollbar(self.frame)
+        scrollbar.pack(side="right", fill="y", padx=(0, 3), pady=3)
+        
+        self.text = tk.Text(
+            self.frame,
+            width=1,
+            height=1,
+            font=font,
+            wrap="word",
+            state="disabled",
+            bg=theme["fg_color"][mode],
+            fg=theme["text_color"][mode],
+            relief="flat",
+            borderwidth=0,
+            highlightthickness=0,
+            yscrollcommand=scrollbar.set
+        )
+        self.text.pack(side="left", fill="both", expand=True, padx=(6, 0), pady=6)
+        scrollbar.configure(command=self.text.yview)
+    
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+    
+    def append(self, text: str):
+        """Insert text at the end and scroll to it"""
+        self.text.configure(state="normal")
+        self.text.insert("end", text)
+        self.text.configure(state="disabled")
+        self.text.see("end")
+    
+    def clear(self):
+        """Remove all text"""
+        self.text.configure(state="normal")
+        self.text.delete("1.0", "end")
+        self.text.configure(state="disabled")
+
+
+@lru_cache(maxsize=None)
+def _font(**options) -> ctk.CTkFont:
+    """Shared CTkFont for the given options, created on first use (after the Tk root)"""
+    return ctk.CTkFont(**options)
+
+
+@lru_cache(maxsize=None)
+def _install_pool() -> DaemonThreadPool:
+    """Worker threads shared by every installation dialog, started on first use"""
+    return DaemonThreadPool(max_workers=MAX_PARALLEL_INSTALLS, thread_name_prefix="mcp-install")
+
+
+@lru_cache(maxsize=1)
+def _docker_available_cached() -> bool:
+    """Check Docker availability once per session ('docker info' can take over a second)"""
+    from ..core.system_checker import SystemChecker
+    return SystemChecker().is_docker_available()
 
 
 class ServerDiscoveryDialog:
@@ -21,6 +235,11 @@ class ServerDiscoveryDialog:
         self.parent = parent
         self.callback = callback
         self.logger = get_logger()
+        
+        # The core managers pull in requests and subprocess helpers, so load them
+        # when a dialog is opened rather than when this module is imported
+        from ..core.server_manager import MCPServerManager
+        from ..core.system_checker import SystemChecker
         self.server_manager = MCPServerManager()
         self.system_checker = SystemChecker()
         
@@ -28,22 +247,68 @@ class ServerDiscoveryDialog:
         self.dialog = ctk.CTkToplevel(parent)
         self.dialog.title("Discover MCP Servers")
         self.dialog.geometry("900x700")
-        self.dialog.transient(parent)
-        self.dialog.grab_set()
         
         # Center the dialog
         self._center_dialog()
         
-        # Initialize discovered servers
+        # Background threads hand their UI updates to the Tk thread through this
+        self._ui = UiPump(self.dialog)
+        
+        # Fonts for the server rows, looked up once instead of per row
+        self._font_name = _font(size=14, weight="bold")
+        self._font_badge = _font(size=10, weight="bold")
+        self._font_desc = _font(size=11)
+        self._font_details = _font(size=10)
+        self._font_btn = _font(size=11)
+        self._font_btn_small = _font(size=10)
+        
+        # Initialize discovered servers; selections are kept by (name, type), the key
+        # rows are deduplicated by (see _merge_source), in selection order
         self.discovered_servers = {}
-        self.selected_servers = []
+        self.selected_servers: Dict[tuple, Dict] = {}
+        
+        # Background work (Docker check, discovery, installs) shares one bounded pool
+        # so clicking Install on many rows queues instead of running all at once;
+        # its threads are daemons, so closing the app never waits for them
+        self._executor = DaemonThreadPool(max_workers=4, thread_name_prefix="mcp-bg")
         
         # Cache Docker status to avoid blocking UI
         self._docker_available = None
         self._cache_docker_status()
         
-        # Create UI
+        # Installation status per server name, and the installed-package/IDE-config
+        # snapshot the statuses are derived from; workers read a new snapshot and the
+        # Tk thread swaps it in (see _refresh_installation_snapshot)
+        self._install_status_cache = {}
+        self._installation_snapshot = None
+        
+        # Server list frames and their loading labels, by source
+        self._lists: Dict[str, ctk.CTkScrollableFrame] = {}
+        self._loading: Dict[str, ctk.CTkLabel] = {}
+        
+        # Rows still to be created for lazily built lists, by source, and how often
+        # each server's row was changed in place (such rows are rebuilt on refresh)
+        self._lazy_rows = {}
+        self._row_edits: Dict[str, int] = {}
+        
+        # Confirmation/error popups and the details dialog are built once, then
+        # hidden and reused instead of recreated for every click
+        self._popups: Dict[str, Dict] = {}
+        self._details_dialog: Optional["ServerDetailsDialog"] = None
+        
+        # Online discovery results as source -> (timestamp, servers), loaded lazily
+        self._discovery_cache: Optional[Dict[str, tuple]] = None
+        self._discovery_cache_lock = threading.Lock()
+        
+        # Latest progress/status requested by background work, applied by _flush_update
+        self._pending_progress: Optional[float] = None
+        self._pending_status: Optional[str] = None
+        self._updater_scheduled = False
+        self._update_lock = threading.Lock()
+        
+        # Create UI, then make the dialog modal
         self._create_widgets()
+        _make_modal(self.dialog, parent)
         
         # Start with local-only discovery to avoid initial freeze
         self._load_local_only()
@@ -52,17 +317,16 @@ class ServerDiscoveryDialog:
         """Cache Docker status in background to avoid UI blocking"""
         def check_docker():
             try:
-                self._docker_available = self.system_checker.is_docker_available()
+                self._docker_available = _docker_available_cached()
             except Exception as e:
                 self.logger.debug(f"Docker status check failed: {e}")
                 self._docker_available = False
         
-        # Run Docker check in background thread
-        threading.Thread(target=check_docker, daemon=True).start()
+        # Run Docker check in background
+        self._executor.submit(check_docker)
     
     def _center_dialog(self):
         """Center dialog on parent window"""
-        self.dialog.update_idletasks()
         x = self.parent.winfo_x() + (self.parent.winfo_width() // 2) - (900 // 2)
         y = self.parent.winfo_y() + (self.parent.winfo_height() // 2) - (700 // 2)
         self.dialog.geometry(f"900x700+{x}+{y}")
@@ -77,14 +341,14 @@ class ServerDiscoveryDialog:
         title_label = ctk.CTkLabel(
             header_frame,
             text="[*] Discover MCP Servers",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=_font(size=20, weight="bold")
         )
         title_label.pack(pady=15)
         
         subtitle_label = ctk.CTkLabel(
             header_frame,
             text="Browse and install MCP servers from various sources",
-            font=ctk.CTkFont(size=12),
+            font=_font(size=12),
             text_color="gray70"
         )
         subtitle_label.pack(pady=(0, 15))
@@ -116,13 +380,13 @@ class ServerDiscoveryDialog:
         self.status_label = ctk.CTkLabel(
             status_frame,
             text="Starting discovery...",
-            font=ctk.CTkFont(size=12)
+            font=_font(size=12)
         )
         self.status_label.pack(side="left", padx=20, pady=10)
         
         self.progress_bar = ctk.CTkProgressBar(status_frame, width=200)
         self.progress_bar.pack(side="right", padx=20, pady=10)
-        self.progress_bar.set(0)
+        _set_progress(self.progress_bar, 0)
         
         # Buttons
         button_frame = ctk.CTkFrame(self.dialog)
@@ -169,78 +433,127 @@ class ServerDiscoveryDialog:
         scrollable_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Store reference
-        setattr(self, f"{source}_list", scrollable_frame)
+        self._lists[source] = scrollable_frame
         
         # Loading label
         loading_label = ctk.CTkLabel(
             scrollable_frame,
             text=f"Loading {source} servers...",
-            font=ctk.CTkFont(size=12),
+            font=_font(size=12),
             text_color="gray60"
         )
         loading_label.pack(pady=50)
-        setattr(self, f"{source}_loading", loading_label)
+        self._loading[source] = loading_label
+        
+        # Grow lazily built lists as the user scrolls towards their end
+        scrollbar = scrollable_frame._scrollbar
+        scrollable_frame._parent_canvas.configure(
+            yscrollcommand=lambda first, last: self._on_list_scrolled(source, scrollbar, first, last)
+        )
+    
+    def _on_list_scrolled(self, source: str, scrollbar, first: str, last: str):
+        """Update the scrollbar and schedule more rows when nearing the end of a lazy list"""
+        scrollbar.set(first, last)
+        
+        pending = self._lazy_rows.get(source)
+        if pending and not pending["scheduled"] and float(last) >= LAZY_LOAD_THRESHOLD:
+            pending["scheduled"] = True
+            self.dialog.after_idle(lambda: self._create_next_rows(source))
+    
+    def _create_next_rows(self, source: str):
+        """Create the next chunk of rows for a lazily built list"""
+        pending = self._lazy_rows.get(source)
+        if not pending:
+            return
+        
+        list_frame = self._lists[source]
+        servers = pending["servers"]
+        start = pending["next_index"]
+        end = min(start + LAZY_ROW_CHUNK, len(servers))
+        
+        for index in range(start, end):
+            pending["builder"](list_frame, servers[index], source, index)
+        
+        if end >= len(servers):
+            del self._lazy_rows[source]
+            self.logger.info(f"Completed creating {end} server entries for {source}", category="install")
+        else:
+            pending["next_index"] = end
+            pending["scheduled"] = False
     
     def _start_discovery(self):
         """Start server discovery in background thread"""
         self.status_label.configure(text="Discovering servers...")
-        self.progress_bar.set(0.1)
+        _set_progress(self.progress_bar, 0.1)
         self.refresh_btn.configure(state="disabled")
         self.local_only_btn.configure(state="disabled")
         
         # Clear existing results
         self.discovered_servers = {}
-        self.selected_servers = []
+        self.selected_servers = {}
         self.install_btn.configure(state="disabled")
         
-        # Start discovery thread
-        threading.Thread(target=self._discover_servers, daemon=True).start()
+        # Start discovery in background
+        self._executor.submit(self._discover_servers)
     
     def _load_local_only(self):
         """Load only local servers quickly without network requests"""
         self.status_label.configure(text="Loading local servers...")
-        self.progress_bar.set(0.1)
+        _set_progress(self.progress_bar, 0.1)
         self.refresh_btn.configure(state="disabled")
         self.local_only_btn.configure(state="disabled")
         
+        # Installation status needs 'npm list', so gather it off the Tk thread
+        self._executor.submit(self._load_local_servers)
+    
+    def _load_local_servers(self):
+        """Background part of _load_local_only: read the catalog and installation status"""
         try:
-            # Load local servers immediately
             servers_dict = self.server_manager.servers.get("servers", {})
             self.logger.info(f"Loaded servers dict with {len(servers_dict)} entries: {list(servers_dict.keys())}", category="install")
-            local_servers = list(servers_dict.values())
+            local_servers = self._merge_source("local", servers_dict.values(), {})
             self.logger.info(f"Converted to {len(local_servers)} server objects", category="install")
             
-            # Clear other sources
-            self.discovered_servers = {
-                "local": local_servers,
-                "github": [],
-                "npm": [],
-                "official": []
-            }
-            
-            # Update progress
-            self.progress_bar.set(0.5)
-            
-            # Populate only the local tab
-            self._populate_single_list("local", local_servers)
-            
-            # Clear other tabs
-            for source in ["github", "npm", "official"]:
-                self._populate_single_list(source, [])
-            
-            # Complete
-            self.progress_bar.set(1.0)
-            self.status_label.configure(text=f"Local servers loaded ({len(local_servers)} found)")
-            self.refresh_btn.configure(state="normal")
-            self.local_only_btn.configure(state="normal")
-            
-            self.logger.info(f"Local-only discovery completed: {len(local_servers)} servers", category="install")
+            self._refresh_installation_snapshot()
+            self._ui.call(lambda: self._show_local_servers(local_servers))
             
         except Exception as e:
             self.logger.error("Local server loading failed", e)
-            self._show_error(f"Failed to load local servers: {str(e)}")
-            self.refresh_btn.configure(state="normal")
-            self.local_only_btn.configure(state="normal")
+            self._ui.call(partial(self._local_loading_failed, e))
+    
+    def _show_local_servers(self, local_servers: List[Dict]):
+        """Fill the local tab and clear the online ones"""
+        # Clear other sources
+        self.discovered_servers = {
+            "local": local_servers,
+            "github": [],
+            "npm": [],
+            "official": []
+        }
+        
+        # Update progress
+        _set_progress(self.progress_bar, 0.5)
+        
+        # Populate only the local tab
+        self._populate_single_list("local", local_servers)
+        
+        # Clear other tabs
+        for source in ["github", "npm", "official"]:
+            self._populate_single_list(source, [])
+        
+        # Complete
+        _set_progress(self.progress_bar, 1.0)
+        self.status_label.configure(text=f"Local servers loaded ({len(local_servers)} found)")
+        self.refresh_btn.configure(state="normal")
+        self.local_only_btn.configure(state="normal")
+        
+        self.logger.info(f"Local-only discovery completed: {len(local_servers)} servers", category="install")
+    
+    def _local_loading_failed(self, error: Exception):
+        """Report a failed local load and let the user retry"""
+        self._show_error(f"Failed to load local servers: {str(error)}")
+        self.refresh_btn.configure(state="normal")
+        self.local_only_btn.configure(state="normal")
     
     def _discover_servers(self):
         """Background thread for server discovery"""
@@ -248,8 +561,7 @@ class ServerDiscoveryDialog:
             self.logger.log_user_action("Server discovery started")
             
             # Update progress
-            self.dialog.after(0, lambda: self.progress_bar.set(0.2))
-            self.dialog.after(0, lambda: self.status_label.configure(text="Loading local servers..."))
+            self._schedule_update(progress=0.2, status="Loading local servers...")
             
             # Initialize discovered servers
             discovered = {
@@ -259,14 +571,21 @@ class ServerDiscoveryDialog:
                 "official": []
             }
             
+            # Servers already listed, by (name, type); each source only shows the ones
+            # no source ahead of it in the tab order has listed
+            seen = {}
+            
             # Load local servers first (fast)
             try:
-                discovered["local"] = list(self.server_manager.servers.get("servers", {}).values())
+                discovered["local"] = self._merge_source(
+                    "local", self.server_manager.servers.get("servers", {}).values(), seen
+                )
                 self.logger.info(f"Found {len(discovered['local'])} local servers", category="install")
-                self.dialog.after(0, lambda: self.progress_bar.set(0.3))
+                self._refresh_installation_snapshot()
+                self._schedule_update(progress=0.3)
                 
                 # Update local tab immediately
-                self.dialog.after(0, lambda: self._populate_single_list("local", discovered["local"]))
+                self._ui.call(lambda: self._populate_single_list("local", discovered["local"]))
                 
             except Exception as e:
                 self.logger.error("Local discovery failed", e, category="install")
@@ -281,114 +600,222 @@ class ServerDiscoveryDialog:
             progress_step = 0.7 / len(online_sources)  # Remaining 70% divided by sources
             current_progress = 0.3
             
-            for source_name, status_text, discover_func in online_sources:
-                try:
-                    # Update status
-                    self.dialog.after(0, lambda t=status_text: self.status_label.configure(text=t))
-                    
-                    # Small delay to let UI process events
-                    import time
-                    time.sleep(0.1)
-                    
-                    # Discover servers
-                    servers = discover_func()
-                    discovered[source_name] = servers
-                    self.logger.info(f"Found {len(servers)} servers from {source_name}", category="install")
+            self._schedule_update(status="Loading online servers...")
+            
+            # The sources are independent network calls, so query them all at once.
+            # Tabs are filled in source order, each as soon as it and every source
+            # ahead of it have answered, so duplicates always stay in the same tab
+            source_order = [source_name for source_name, _, _ in online_sources]
+            answered = {}
+            next_source = 0
+            
+            with DaemonThreadPool(max_workers=len(online_sources), thread_name_prefix="discovery") as executor:
+                futures = {
+                    executor.submit(self._cached_discover, source_name, discover_func): source_name
+                    for source_name, _, discover_func in online_sources
+                }
+                
+                for future in as_completed(futures):
+                    source_name = futures[future]
+                    try:
+                        # Discover servers
+                        answered[source_name] = future.result()
+                        self.logger.info(f"Found {len(answered[source_name])} servers from {source_name}", category="install")
+                    except Exception as e:
+                        self.logger.error(f"{source_name} discovery failed", e, category="install")
+                        # Still update the tab to show "no servers found"
+                        answered[source_name] = []
                     
                     # Update progress
                     current_progress += progress_step
-                    self.dialog.after(0, lambda p=current_progress: self.progress_bar.set(p))
-                    
-                    # Small delay before UI update
-                    time.sleep(0.05)
-                    
-                    # Update this specific tab
-                    self.dialog.after(0, lambda s=source_name, srv=servers: self._populate_single_list(s, srv))
-                    
-                    # Allow UI to process the updates
-                    time.sleep(0.1)
+                    self._schedule_update(progress=current_progress)
                     
-                except Exception as e:
-                    self.logger.error(f"{source_name} discovery failed", e, category="install")
-                    # Still update the tab to show "no servers found"
-                    self.dialog.after(0, lambda s=source_name: self._populate_single_list(s, []))
+                    # Update every tab that is no longer waiting on an earlier source
+                    while next_source < len(source_order) and source_order[next_source] in answered:
+                        ready_source = source_order[next_source]
+                        servers = self._merge_source(ready_source, answered[ready_source], seen)
+                        discovered[ready_source] = servers
+                        self._ui.call(lambda s=ready_source, srv=servers: self._populate_single_list(s, srv))
+                        next_source += 1
             
             # Store final results
             self.discovered_servers = discovered
             
             # Final update
-            self.dialog.after(0, self._discovery_completed)
+            self._ui.call(self._discovery_completed)
             
         except Exception as e:
             self.logger.error("Server discovery failed", e)
-            self.dialog.after(0, lambda: self._show_error(f"Discovery failed: {str(e)}"))
+            self._ui.call(partial(self._show_error, f"Discovery failed: {str(e)}"))
+    
+    def _schedule_update(self, progress: Optional[float] = None, status: Optional[str] = None):
+        """Request a progress/status update from background work
+        
+        Only the latest values are kept, and they are applied by a single UI pump
+        callback however many updates arrive before it runs.
+        """
+        with self._update_lock:
+            if progress is not None:
+                self._pending_progress = progress
+            if status is not None:
+                self._pending_status = status
+            if self._updater_scheduled:
+                return
+            self._updater_scheduled = True
+        self._ui.call(self._flush_update)
+    
+    def _flush_update(self):
+        """Apply the latest progress/status requested by background work"""
+        with self._update_lock:
+            progress, self._pending_progress = self._pending_progress, None
+            status, self._pending_status = self._pending_status, None
+            self._updater_scheduled = False
+        
+        if progress is not None:
+            _set_progress(self.progress_bar, progress)
+        if status is not None:
+            self.status_label.configure(text=status)
+    
+    def _cached_discover(self, source_name: str, discover_func: Callable[[], List[Dict]],
+                         ttl: float = DISCOVERY_CACHE_TTL) -> List[Dict]:
+        """Run a discovery source, reusing its results for ttl seconds"""
+        with self._discovery_cache_lock:
+            if self._discovery_cache is None:
+                self._discovery_cache = self._load_discovery_cache()
+            cached = self._discovery_cache.get(source_name)
+        
+        if cached is not None and time.time() - cached[0] < ttl:
+            self.logger.info(f"Using cached {source_name} discovery results", category="install")
+            return cached[1]
+        
+        servers = discover_func()
+        
+        # Empty results usually mean the request failed, so don't keep them around
+        if servers:
+            with self._discovery_cache_lock:
+                self._discovery_cache[source_name] = (time.time(), servers)
+                self._save_discovery_cache()
+        
+        return servers
+    
+    def _merge_source(self, source: str, servers, seen: Dict[tuple, Dict]) -> List[Dict]:
+        """Drop servers an earlier source already listed, recording every source per server"""
+        unique = []
+        for server in servers:
+            key = (server.get("name"), server.get("type"))
+            kept = seen.get(key)
+            if kept is None:
+                # Rows show this preview, so shorten each description only once
+                kept = seen[key] = {
+                    **server,
+                    "sources": [],
+                    "display_description": _truncate_description(
+                        server.get("description") or "No description available"
+                    )
+                }
+                unique.append(kept)
+            if source not in kept["sources"]:
+                kept["sources"].append(source)
+        return unique
+    
+    def _load_discovery_cache(self) -> Dict[str, tuple]:
+        """Load persisted discovery results from earlier dialogs"""
+        try:
+            with open(DISCOVERY_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            return {
+                source: (entry["timestamp"], entry["servers"])
+                for source, entry in cached.items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return {}
+    
+    def _save_discovery_cache(self):
+        """Persist discovery results so later dialogs can reuse them"""
+        try:
+            DISCOVERY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = DISCOVERY_CACHE_FILE.with_suffix(".tmp")
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    source: {"timestamp": timestamp, "servers": servers}
+                    for source, (timestamp, servers) in self._discovery_cache.items()
+                }, f)
+            os.replace(temp_file, DISCOVERY_CACHE_FILE)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.debug(f"Could not write discovery cache: {e}", category="install")
     
     def _populate_single_list(self, source: str, servers: List[Dict]):
         """Populate a single server list with discovered servers"""
         try:
-            list_frame = getattr(self, f"{source}_list")
-            loading_label = getattr(self, f"{source}_loading", None)
+            list_frame = self._lists[source]
+            loading_label = self._loading.pop(source, None)
+            
+            # Any rows still pending belong to the list being replaced
+            self._lazy_rows.pop(source, None)
             
             # Remove loading label if it exists
             if loading_label and loading_label.winfo_exists():
                 loading_label.destroy()
             
-            # Clear existing content
-            for widget in list_frame.winfo_children():
+            # Keep the leading rows that would be rebuilt exactly as they are (a refresh
+            # served from the discovery cache usually matches them all) and clear the rest
+            existing = list_frame.winfo_children()
+            kept = 0
+            for widget, server in zip(existing, servers):
+                if getattr(widget, "_row_key", None) != self._row_key(server):
+                    break
+                kept += 1
+            for widget in existing[kept:]:
                 widget.destroy()
             
             if not servers:
                 no_servers_label = ctk.CTkLabel(
                     list_frame,
                     text=f"No servers found in {source}",
-                    font=ctk.CTkFont(size=12),
+                    font=_font(size=12),
                     text_color="gray60"
                 )
                 no_servers_label.pack(pady=20)
                 return
             
-            # Create server entries progressively to keep UI responsive
-            self._create_server_entries_progressive(list_frame, servers, source, 0)
+            build_row = self._row_builder(servers)
+            
+            # Long lists only get their first rows now; the rest are created on scroll
+            initial_count = len(servers)
+            if len(servers) > BATCH_DRAW_LIMIT:
+                initial_count = max(kept, LAZY_ROW_CHUNK)
+                if initial_count < len(servers):
+                    self._lazy_rows[source] = {
+                        "servers": servers,
+                        "builder": build_row,
+                        "next_index": initial_count,
+                        "scheduled": False
+                    }
+            
+            # Build the rows while the list is unmapped, so the geometry manager
+            # lays the list out once when it is shown again instead of per row
+            if kept < initial_count:
+                list_frame.pack_forget()
+                try:
+                    for index in range(kept, initial_count):
+                        build_row(list_frame, servers[index], source, index)
+                finally:
+                    list_frame.pack(fill="both", expand=True, padx=10, pady=10)
+            
+            self.logger.info(f"Created {initial_count - kept} of {len(servers)} server entries for {source} ({kept} kept)", category="install")
                 
         except Exception as e:
             self.logger.error(f"Failed to populate {source} list", e)
     
-    def _create_server_entries_progressive(self, list_frame, servers: List[Dict], source: str, index: int):
-        """Create server entries progressively to maintain UI responsiveness"""
-        if index >= len(servers):
-            self.logger.info(f"Completed creating {index} server entries for {source}", category="install")
-            return  # All entries created
-        
-        try:
-            # Create one server entry
-            server = servers[index]
-            self.logger.debug(f"Creating server entry {index}: {server.get('name', 'Unknown')}", category="install")
-            self._create_server_entry(list_frame, server, source, index)
-            
-            # Schedule next entry creation with a small delay to keep UI responsive
-            # Process multiple entries per batch but with breaks
-            batch_size = 3  # Create 3 entries per batch
-            next_index = index + 1
-            
-            if next_index < len(servers):
-                if (next_index % batch_size) == 0:
-                    # After every batch, give UI thread a chance to process events
-                    self.dialog.after(1, lambda: self._create_server_entries_progressive(list_frame, servers, source, next_index))
-                else:
-                    # Continue immediately within batch
-                    self._create_server_entries_progressive(list_frame, servers, source, next_index)
-                    
-        except Exception as e:
-            self.logger.error(f"Failed to create server entry {index} ({server.get('name', 'Unknown') if 'server' in locals() else 'N/A'})", e)
-            # Continue with next server instead of stopping
-            next_index = index + 1
-            if next_index < len(servers):
-                self.dialog.after(1, lambda: self._create_server_entries_progressive(list_frame, servers, source, next_index))
-    
     def _discovery_completed(self):
         """Handle discovery completion"""
+        # Drop any throttled update still waiting so it can't overwrite the final state
+        with self._update_lock:
+            self._pending_progress = None
+            self._pending_status = None
+        
         self.status_label.configure(text="Discovery completed")
-        self.progress_bar.set(1.0)
+        _set_progress(self.progress_bar, 1.0)
         self.refresh_btn.configure(state="normal")
         self.local_only_btn.configure(state="normal")
         self.logger.info("Server discovery completed successfully")
@@ -402,17 +829,29 @@ class ServerDiscoveryDialog:
         self._discovery_completed()
     
     
-    def _create_server_entry(self, parent, server: Dict, source: str, index: int):
+    def _row_builder(self, servers: List[Dict]) -> Callable:
+        """Bind the per-list invariants of _create_server_entry once for a whole list"""
+        # Use cached Docker status to avoid blocking UI
+        docker_available = bool(self._docker_available)
+        
+        if not any(server.get('type') == 'docker' for server in servers):
+            return partial(self._create_server_entry, requires_docker=False, docker_available=docker_available)
+        return partial(self._create_server_entry, docker_available=docker_available)
+    
+    def _create_server_entry(self, parent, server: Dict, source: str, index: int,
+                             requires_docker: Optional[bool] = None, docker_available: Optional[bool] = None):
         """Create a server entry widget with improved layout and install button"""
         
         try:
             # Check if this server requires Docker
-            requires_docker = server.get('type', '') == 'docker'
-            # Use cached Docker status to avoid blocking UI
-            docker_available = self._docker_available if self._docker_available is not None else False
+            if requires_docker is None:
+                requires_docker = server.get('type', '') == 'docker'
+            if docker_available is None:
+                docker_available = bool(self._docker_available)
+            docker_missing = requires_docker and not docker_available
             
             # Main server frame - highlight if Docker is required but not available
-            frame_color = "gray15" if requires_docker and not docker_available else None
+            frame_color = "gray15" if docker_missing else None
             server_frame = ctk.CTkFrame(parent, fg_color=frame_color)
             server_frame.pack(fill="x", padx=5, pady=3)
             
@@ -424,16 +863,24 @@ class ServerDiscoveryDialog:
             header_frame = ctk.CTkFrame(info_section, fg_color="transparent")
             header_frame.pack(fill="x", pady=(0, 5))
             
+            # Selection box for "Install Selected"; a rebuilt row shows the selection
+            # of the row it replaces, as selections are kept by (name, type)
+            select_box = ctk.CTkCheckBox(header_frame, text="", width=24, checkbox_width=18, checkbox_height=18)
+            if (server.get("name"), server.get("type")) in self.selected_servers:
+                select_box.select()
+            select_box.configure(command=lambda s=server, b=select_box: self._on_server_selected(s, bool(b.get())))
+            select_box.pack(side="left", padx=(0, 5))
+            
             # Server name with Docker warning if needed
             name_text = server.get("name", "Unknown Server")
-            if requires_docker and not docker_available:
+            if docker_missing:
                 name_text += " [Docker Required]"
             
-            name_color = "orange" if requires_docker and not docker_available else "white"
+            name_color = "orange" if docker_missing else "white"
             name_label = ctk.CTkLabel(
                 header_frame,
                 text=name_text,
-                font=ctk.CTkFont(size=14, weight="bold"),
+                font=self._font_name,
                 text_color=name_color,
                 anchor="w"
             )
@@ -451,7 +898,7 @@ class ServerDiscoveryDialog:
             type_label = ctk.CTkLabel(
                 header_frame,
                 text=badge_text,
-                font=ctk.CTkFont(size=10, weight="bold"),
+                font=self._font_badge,
                 text_color="white",
                 fg_color=badge_color,
                 corner_radius=3,
@@ -461,18 +908,21 @@ class ServerDiscoveryDialog:
             type_label.pack(side="left", padx=(10, 0))
             
             # Description with Docker warning if needed
-            description = server.get("description", "No description available")
-            if requires_docker and not docker_available:
-                description += "\n⚠️ Docker is required but not running. Docker will be installed/started during installation."
-            
-            if len(description) > 120:
-                description = description[:120] + "..."
+            if docker_missing:
+                description = _truncate_description(
+                    (server.get("description") or "No description available")
+                    + "\n⚠️ Docker is required but not running. Docker will be installed/started during installation."
+                )
+            else:
+                description = server.get("display_description") or _truncate_description(
+                    server.get("description") or "No description available"
+                )
             
-            desc_color = "orange" if requires_docker and not docker_available else "gray70"
+            desc_color = "orange" if docker_missing else "gray70"
             desc_label = ctk.CTkLabel(
                 info_section,
                 text=description,
-                font=ctk.CTkFont(size=11),
+                font=self._font_desc,
                 text_color=desc_color,
                 anchor="w",
                 wraplength=500
@@ -500,7 +950,7 @@ class ServerDiscoveryDialog:
                 details_label = ctk.CTkLabel(
                     details_frame,
                     text=" • ".join(details),
-                    font=ctk.CTkFont(size=10),
+                    font=self._font_details,
                     text_color="gray60",
                     anchor="w"
                 )
@@ -511,7 +961,7 @@ class ServerDiscoveryDialog:
             action_section.pack(side="right", padx=15, pady=10)
             
             # Check server installation status
-            installation_status = self.server_manager.get_server_installation_status(server)
+            installation_status = self._get_installation_status(server)
             
             # Determine button text and color based on installation status
             if installation_status["status"] == "installed":
@@ -526,7 +976,7 @@ class ServerDiscoveryDialog:
                 install_hover = "dark orange"
                 button_width = 90
                 is_installed = False
-            elif requires_docker and not docker_available:
+            elif docker_missing:
                 install_text = "[+] Install + Docker"
                 install_color = "orange"
                 install_hover = "dark orange"
@@ -545,27 +995,24 @@ class ServerDiscoveryDialog:
                 text=install_text,
                 width=button_width,
                 height=32,
-                font=ctk.CTkFont(size=11),
+                font=self._font_btn,
                 fg_color=install_color,
                 hover_color=install_hover,
                 command=None  # Set command separately to avoid closure issues
             )
             
-            # Define command function based on installation status
+            # Define command function based on installation status; default arguments
+            # bind this row's server and button (the install paths never modify server)
             if is_installed:
                 # For installed servers, add a reinstall option
-                def create_reinstall_command():
-                    current_server = server.copy()
-                    current_btn = install_btn
-                    return lambda: self._reinstall_server_with_confirmation(current_server, current_btn)
-                install_btn.configure(command=create_reinstall_command())
+                install_btn.configure(
+                    command=lambda s=server, b=install_btn: self._reinstall_server_with_confirmation(s, b)
+                )
             else:
                 # For not installed servers, use regular install
-                def create_install_command():
-                    current_server = server.copy()
-                    current_btn = install_btn
-                    return lambda: self._install_directly_with_button_feedback(current_server, current_btn)
-                install_btn.configure(command=create_install_command())
+                install_btn.configure(
+                    command=lambda s=server, b=install_btn: self._install_directly_with_button_feedback(s, b)
+                )
             
             install_btn.pack(pady=2)
             
@@ -576,7 +1023,7 @@ class ServerDiscoveryDialog:
                     text="[↻] Reinstall",
                     width=80,
                     height=28,
-                    font=ctk.CTkFont(size=10),
+                    font=self._font_btn_small,
                     fg_color="gray50",
                     hover_color="gray40",
                     command=lambda s=server: self._reinstall_server_with_confirmation(s, None)
@@ -589,13 +1036,16 @@ class ServerDiscoveryDialog:
                 text="[i] Info",
                 width=80,
                 height=28,
-                font=ctk.CTkFont(size=10),
+                font=self._font_btn_small,
                 fg_color="gray50",
                 hover_color="gray40",
                 command=lambda s=server: self._show_server_details(s)
             )
             details_btn.pack(pady=2)
             
+            # Lets _populate_single_list keep this row when the list is refreshed
+            server_frame._row_key = self._row_key(server)
+            
         except Exception as e:
             self.logger.error(f"Failed to create server entry {index}", e)
             # Create a simple error entry instead of failing completely
@@ -605,19 +1055,78 @@ class ServerDiscoveryDialog:
             error_label = ctk.CTkLabel(
                 error_frame,
                 text=f"Error loading server: {server.get('name', 'Unknown')} - {str(e)}",
-                font=ctk.CTkFont(size=11),
+                font=self._font_desc,
                 text_color="red"
             )
             error_label.pack(pady=10)
     
+    def _row_key(self, server: Dict) -> tuple:
+        """Everything a server row is built from, to tell whether an existing row still fits"""
+        docker_missing = server.get('type', '') == 'docker' and not self._docker_available
+        return (
+            server,
+            docker_missing,
+            self._get_installation_status(server)["status"],
+            self._row_edits.get(server.get("name", "Unknown"), 0)
+        )
+    
+    def _get_installation_status(self, server: Dict) -> Dict:
+        """Get a server's installation status, checking each server once per listing"""
+        server_name = server.get("name", "Unknown")
+        status = self._install_status_cache.get(server_name)
+        if status is None:
+            snapshot = self._installation_snapshot
+            if snapshot is None:
+                # Not read yet: reading it means 'npm list', which never runs on the
+                # Tk thread, so answer from an empty snapshot without caching that
+                return self.server_manager.get_server_installation_status(server, EMPTY_INSTALLATION_SNAPSHOT)
+            status = self.server_manager.get_server_installation_status(server, snapshot)
+            self._install_status_cache[server_name] = status
+        return status
+    
+    def _refresh_installation_snapshot(self, server_name: Optional[str] = None):
+        """Re-read installed packages and IDE configs (worker threads only)
+        
+        The new snapshot replaces the old one on the Tk thread, together with the
+        cached status of server_name (or of every server), so rows always have one.
+        """
+        snapshot = self.server_manager.get_installation_snapshot()
+        self._ui.call(partial(self._apply_installation_snapshot, snapshot, server_name))
+    
+    def _apply_installation_snapshot(self, snapshot: Dict, server_name: Optional[str] = None):
+        """Use a snapshot from _refresh_installation_snapshot, dropping the statuses it replaces"""
+        self._installation_snapshot = snapshot
+        if server_name is None:
+            self._install_status_cache.clear()
+        else:
+            self._install_status_cache.pop(server_name, None)
+    
+    def _refresh_server_rows(self, server_name: str):
+        """Rebuild the rows showing server_name that no longer match its state
+        
+        Every other row, and any of its rows that still match, is left as it is.
+        """
+        for source, list_frame in self._lists.items():
+            for index, row in enumerate(list_frame.winfo_children()):
+                row_key = getattr(row, "_row_key", None)
+                if row_key is None or row_key[0].get("name", "Unknown") != server_name:
+                    continue
+                server = row_key[0]
+                if row_key == self._row_key(server):
+                    continue
+                
+                # The new row is packed last; move it into the old row's place
+                self._create_server_entry(list_frame, server, source, index)
+                list_frame.winfo_children()[-1].pack_configure(before=row)
+                row.destroy()
+    
     def _on_server_selected(self, server: Dict, selected: bool):
         """Handle server selection"""
+        key = (server.get("name"), server.get("type"))
         if selected:
-            if server not in self.selected_servers:
-                self.selected_servers.append(server)
+            self.selected_servers.setdefault(key, server)
         else:
-            if server in self.selected_servers:
-                self.selected_servers.remove(server)
+            self.selected_servers.pop(key, None)
         
         # Update install button state
         self.install_btn.configure(state="normal" if self.selected_servers else "disabled")
@@ -628,12 +1137,12 @@ class ServerDiscoveryDialog:
             return
         
         # Create installation dialog
-        InstallationDialog(self.dialog, self.selected_servers, self.server_manager)
+        InstallationDialog(self.dialog, list(self.selected_servers.values()), self.server_manager)
     
     def _show_error(self, message: str):
         """Show error message"""
         self.status_label.configure(text=f"Error: {message}")
-        self.progress_bar.set(0)
+        _set_progress(self.progress_bar, 0)
         self.refresh_btn.configure(state="normal")
         self.local_only_btn.configure(state="normal")
     
@@ -665,51 +1174,49 @@ class ServerDiscoveryDialog:
         server_name = server.get('name', 'Unknown')
         
         try:
-            # Immediate button feedback
+            # Immediate button feedback; the row no longer matches a freshly built one
+            self._row_edits[server_name] = self._row_edits.get(server_name, 0) + 1
             button.configure(text="Installing...", state="disabled", fg_color="orange")
             self.status_label.configure(text=f"Installing {server_name}...")
             self.logger.log_user_action(f"Direct install started for: {server_name}")
             
+            def apply_result(button_kwargs: Dict, status_text: str):
+                """Update the button and status label in a single main-loop callback"""
+                button.configure(**button_kwargs)
+                self.status_label.configure(text=status_text)
+            
             # Start installation in background thread
             def install_thread():
                 try:
                     success, message = self.server_manager.install_server(server)
+                    self._refresh_installation_snapshot(server_name)
                     
                     # Update button based on result
                     if success:
-                        self.dialog.after(0, lambda: button.configure(
-                            text="✓ Installed", 
-                            fg_color="green", 
-                            state="disabled"
-                        ))
-                        self.dialog.after(0, lambda: self.status_label.configure(
-                            text=f"✓ {server_name} installed successfully"
+                        self._ui.call(partial(
+                            apply_result,
+                            {"text": "✓ Installed", "fg_color": "green", "state": "disabled"},
+                            f"✓ {server_name} installed successfully"
                         ))
                         self.logger.log_user_action(f"Installation successful: {server_name}")
                     else:
-                        self.dialog.after(0, lambda: button.configure(
-                            text="✗ Failed", 
-                            fg_color="red", 
-                            state="normal"
-                        ))
-                        self.dialog.after(0, lambda: self.status_label.configure(
-                            text=f"✗ {server_name} installation failed: {message}"
+                        self._ui.call(partial(
+                            apply_result,
+                            {"text": "✗ Failed", "fg_color": "red", "state": "normal"},
+                            f"✗ {server_name} installation failed: {message}"
                         ))
                         self.logger.error(f"Installation failed for {server_name}: {message}")
                         
                 except Exception as e:
-                    self.dialog.after(0, lambda: button.configure(
-                        text="✗ Error", 
-                        fg_color="red", 
-                        state="normal"
-                    ))
-                    self.dialog.after(0, lambda: self.status_label.configure(
-                        text=f"✗ {server_name} installation error"
+                    self._ui.call(partial(
+                        apply_result,
+                        {"text": "✗ Error", "fg_color": "red", "state": "normal"},
+                        f"✗ {server_name} installation error"
                     ))
                     self.logger.error(f"Installation error for {server_name}", e)
             
             # Run installation in background
-            threading.Thread(target=install_thread, daemon=True).start()
+            self._executor.submit(install_thread)
             
         except Exception as e:
             self.logger.error(f"Failed to start direct installation for {server_name}", e)
@@ -750,56 +1257,103 @@ class ServerDiscoveryDialog:
             self.status_label.configure(text="Installation failed")
             self._show_error_popup(f"Installation failed: {str(e)}")
     
+    def _popup(self, key: str, build: Callable) -> Dict:
+        """Return the popup cached under key, building its widgets on first use
+        
+        Popups are hidden instead of destroyed when closed, so later calls only
+        rebind their text and commands. Every call bumps the popup's token, which
+        callbacks from an earlier showing check before touching its widgets.
+        """
+        popup = self._popups.get(key)
+        if popup is None or not popup["window"].winfo_exists():
+            window = ctk.CTkToplevel(self.dialog)
+            window.protocol("WM_DELETE_WINDOW", lambda: self._hide_popup(window))
+            popup = build(window)
+            popup["window"] = window
+            popup["token"] = 0
+            self._popups[key] = popup
+        popup["token"] += 1
+        return popup
+    
+    def _show_popup(self, window, title: str, width: int, height: int):
+        """Center a popup on the dialog and show it modally"""
+        window.title(title)
+        x = self.dialog.winfo_x() + (self.dialog.winfo_width() // 2) - (width // 2)
+        y = self.dialog.winfo_y() + (self.dialog.winfo_height() // 2) - (height // 2)
+        window.geometry(f"{width}x{height}+{x}+{y}")
+        window.deiconify()
+        window.lift()
+        _make_modal(window, self.dialog)
+    
+    def _hide_popup(self, window):
+        """Hide a popup so it can be shown again later"""
+        window.grab_release()
+        window.withdraw()
+    
+    def _build_confirmation_popup(self, window, action_text: str, **action_colors) -> Dict:
+        """Create the widgets shared by the install and reinstall confirmations"""
+        title_label = ctk.CTkLabel(window, text="", font=_font(size=16, weight="bold"))
+        title_label.pack(pady=20)
+        
+        info_label = ctk.CTkLabel(window, text="", font=_font(size=12), justify="left", wraplength=350)
+        info_label.pack(pady=10)
+        
+        # Status label for progress
+        status_label = ctk.CTkLabel(window, text="", font=_font(size=11))
+        status_label.pack(pady=10)
+        
+        # Buttons
+        button_frame = ctk.CTkFrame(window, fg_color="transparent")
+        button_frame.pack(pady=20)
+        
+        action_btn = ctk.CTkButton(button_frame, text=action_text, width=100, **action_colors)
+        action_btn.pack(side="left", padx=10)
+        
+        cancel_btn = ctk.CTkButton(
+            button_frame,
+            text="Cancel",
+            command=lambda: self._hide_popup(window),
+            width=80,
+            fg_color="gray40",
+            hover_color="gray30"
+        )
+        cancel_btn.pack(side="right", padx=10)
+        
+        return {
+            "title_label": title_label,
+            "info_label": info_label,
+            "status_label": status_label,
+            "action_btn": action_btn,
+            "cancel_btn": cancel_btn,
+            "action_text": action_text
+        }
+    
+    def _reset_confirmation_popup(self, popup: Dict, title: str, info: str,
+                                  status: str, status_color: str, command: Callable):
+        """Rebind a confirmation popup to a new server"""
+        popup["title_label"].configure(text=title)
+        popup["info_label"].configure(text=info)
+        popup["status_label"].configure(text=status, text_color=status_color)
+        popup["action_btn"].configure(text=popup["action_text"], state="normal", command=command)
+        popup["cancel_btn"].configure(text="Cancel", state="normal")
+    
     def _show_direct_install_confirmation(self, server: Dict):
         """Show confirmation dialog for direct installation"""
         server_name = server.get('name', 'Unknown')
         server_type = server.get('type', 'unknown')
         
-        # Create simple confirmation dialog
-        confirm_dialog = ctk.CTkToplevel(self.dialog)
-        confirm_dialog.title("Confirm Installation")
-        confirm_dialog.geometry("400x250")
-        confirm_dialog.transient(self.dialog)
-        confirm_dialog.grab_set()
-        
-        # Center the dialog
-        confirm_dialog.update_idletasks()
-        x = self.dialog.winfo_x() + (self.dialog.winfo_width() // 2) - (400 // 2)
-        y = self.dialog.winfo_y() + (self.dialog.winfo_height() // 2) - (250 // 2)
-        confirm_dialog.geometry(f"400x250+{x}+{y}")
-        
-        # Header
-        ctk.CTkLabel(
-            confirm_dialog,
-            text="[+] Install MCP Server",
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(pady=20)
+        popup = self._popup("install", partial(self._build_confirmation_popup, action_text="Install Now"))
+        token = popup["token"]
+        confirm_dialog = popup["window"]
+        status_label = popup["status_label"]
+        install_btn = popup["action_btn"]
+        cancel_btn = popup["cancel_btn"]
         
         # Info
         info_text = f"Install: {server_name}\nType: {server_type.upper()}"
         if 'package' in server:
             info_text += f"\nPackage: {server['package']}"
         
-        ctk.CTkLabel(
-            confirm_dialog,
-            text=info_text,
-            font=ctk.CTkFont(size=12),
-            justify="left"
-        ).pack(pady=10)
-        
-        # Status label for progress
-        status_label = ctk.CTkLabel(
-            confirm_dialog,
-            text="Ready to install",
-            font=ctk.CTkFont(size=11),
-            text_color="gray70"
-        )
-        status_label.pack(pady=10)
-        
-        # Buttons
-        button_frame = ctk.CTkFrame(confirm_dialog, fg_color="transparent")
-        button_frame.pack(pady=20)
-        
         def start_install():
             """Start installation process"""
             install_btn.configure(state="disabled", text="Installing...")
@@ -810,90 +1364,55 @@ class ServerDiscoveryDialog:
                 try:
                     success, message = self.server_manager.install_server(server)
                     
-                    confirm_dialog.after(0, lambda: installation_complete(success, message))
+                    self._ui.call(partial(installation_complete, success, message))
                     
                 except Exception as e:
-                    confirm_dialog.after(0, lambda: installation_complete(False, str(e)))
+                    self._ui.call(partial(installation_complete, False, str(e)))
             
-            threading.Thread(target=install_thread, daemon=True).start()
+            self._executor.submit(install_thread)
         
         def installation_complete(success, message):
             """Handle installation completion"""
+            if success:
+                self.status_label.configure(text=f"✓ {server_name} installed successfully")
+            else:
+                self.status_label.configure(text=f"✗ {server_name} installation failed")
+            
+            self.logger.log_user_action(f"Direct installation completed: {server_name} - {'Success' if success else 'Failed'}")
+            
+            # The popup may have been closed and reused for another server meanwhile
+            if popup["token"] != token:
+                return
+            
             if success:
                 status_label.configure(text="✓ Installation successful!", text_color="green")
                 install_btn.configure(text="Done")
-                self.status_label.configure(text=f"✓ {server_name} installed successfully")
             else:
                 status_label.configure(text=f"✗ Installation failed: {message}", text_color="red")
                 install_btn.configure(text="Failed")
-                self.status_label.configure(text=f"✗ {server_name} installation failed")
             
             cancel_btn.configure(state="normal", text="Close")
-            
-            self.logger.log_user_action(f"Direct installation completed: {server_name} - {'Success' if success else 'Failed'}")
         
-        install_btn = ctk.CTkButton(
-            button_frame,
-            text="Install Now",
-            command=start_install,
-            width=100
-        )
-        install_btn.pack(side="left", padx=10)
-        
-        cancel_btn = ctk.CTkButton(
-            button_frame,
-            text="Cancel",
-            command=confirm_dialog.destroy,
-            width=80,
-            fg_color="gray40",
-            hover_color="gray30"
+        self._reset_confirmation_popup(
+            popup, "[+] Install MCP Server", info_text, "Ready to install", "gray70", start_install
         )
-        cancel_btn.pack(side="right", padx=10)
+        self._show_popup(confirm_dialog, "Confirm Installation", 400, 250)
     
     def _reinstall_server_with_confirmation(self, server: Dict, button):
         """Reinstall a server with confirmation dialog"""
         server_name = server.get('name', 'Unknown')
         
-        # Create confirmation dialog
-        confirm_dialog = ctk.CTkToplevel(self.dialog)
-        confirm_dialog.title("Reinstall Server")
-        confirm_dialog.geometry("400x250")
-        confirm_dialog.transient(self.dialog)
-        confirm_dialog.grab_set()
-        
-        # Center dialog
-        confirm_dialog.update_idletasks()
-        x = (confirm_dialog.winfo_screenwidth() - confirm_dialog.winfo_width()) // 2
-        y = (confirm_dialog.winfo_screenheight() - confirm_dialog.winfo_height()) // 2
-        confirm_dialog.geometry(f"+{x}+{y}")
-        
-        # Content
-        message_label = ctk.CTkLabel(
-            confirm_dialog,
-            text=f"Reinstall {server_name}?",
-            font=ctk.CTkFont(size=16, weight="bold")
-        )
-        message_label.pack(pady=20)
-        
-        desc_label = ctk.CTkLabel(
-            confirm_dialog,
-            text="This will reinstall the server and update its configuration in all IDEs.",
-            font=ctk.CTkFont(size=12),
-            wraplength=350
-        )
-        desc_label.pack(pady=10)
-        
-        status_label = ctk.CTkLabel(
-            confirm_dialog,
-            text="Ready to reinstall",
-            font=ctk.CTkFont(size=11),
-            text_color="gray"
-        )
-        status_label.pack(pady=10)
-        
-        # Buttons
-        button_frame = ctk.CTkFrame(confirm_dialog, fg_color="transparent")
-        button_frame.pack(pady=20)
+        popup = self._popup("reinstall", partial(
+            self._build_confirmation_popup,
+            action_text="[↻] Reinstall",
+            fg_color="orange",
+            hover_color="dark orange"
+        ))
+        token = popup["token"]
+        confirm_dialog = popup["window"]
+        status_label = popup["status_label"]
+        reinstall_btn = popup["action_btn"]
+        cancel_btn = popup["cancel_btn"]
         
         def start_reinstall():
             status_label.configure(text="Reinstalling...", text_color="orange")
@@ -904,97 +1423,99 @@ class ServerDiscoveryDialog:
                 try:
                     # Force reinstall by calling install_server
                     success, message = self.server_manager.install_server(server)
-                    confirm_dialog.after(0, lambda: reinstall_complete(success, message))
+                    if success:
+                        # Re-read installation status here; the pump applies it before
+                        # reinstall_complete refreshes the rows
+                        self._refresh_installation_snapshot(server_name)
+                    self._ui.call(partial(reinstall_complete, success, message))
                 except Exception as e:
-                    confirm_dialog.after(0, lambda: reinstall_complete(False, str(e)))
+                    self._ui.call(partial(reinstall_complete, False, str(e)))
             
-            threading.Thread(target=reinstall_thread, daemon=True).start()
+            self._executor.submit(reinstall_thread)
         
         def reinstall_complete(success, message):
+            if success:
+                self.status_label.configure(text=f"✓ {server_name} reinstalled successfully")
+                # Update button states in this server's rows only
+                self._refresh_server_rows(server_name)
+            else:
+                self.status_label.configure(text=f"✗ {server_name} reinstall failed")
+            
+            # The popup may have been closed and reused for another server meanwhile
+            if popup["token"] != token:
+                return
+            
             if success:
                 status_label.configure(text="✓ Reinstall successful!", text_color="green")
                 reinstall_btn.configure(text="Done")
-                self.status_label.configure(text=f"✓ {server_name} reinstalled successfully")
-                # Refresh the server list to update button states
-                self._load_local_only()
             else:
                 status_label.configure(text=f"✗ Reinstall failed: {message}", text_color="red")
                 reinstall_btn.configure(text="Failed")
-                self.status_label.configure(text=f"✗ {server_name} reinstall failed")
-        
-        reinstall_btn = ctk.CTkButton(
-            button_frame,
-            text="[↻] Reinstall",
-            command=start_reinstall,
-            width=100,
-            fg_color="orange",
-            hover_color="dark orange"
-        )
-        reinstall_btn.pack(side="left", padx=10)
         
-        cancel_btn = ctk.CTkButton(
-            button_frame,
-            text="Cancel",
-            command=confirm_dialog.destroy,
-            width=80,
-            fg_color="gray40",
-            hover_color="gray30"
+        self._reset_confirmation_popup(
+            popup,
+            f"Reinstall {server_name}?",
+            "This will reinstall the server and update its configuration in all IDEs.",
+            "Ready to reinstall",
+            "gray",
+            start_reinstall
         )
-        cancel_btn.pack(side="right", padx=10)
+        self._show_popup(confirm_dialog, "Reinstall Server", 400, 250)
     
     def _show_server_details(self, server: Dict):
         """Show detailed information about a server"""
         try:
-            details_dialog = ServerDetailsDialog(self.dialog, server)
+            if self._details_dialog is not None and self._details_dialog.dialog.winfo_exists():
+                self._details_dialog.show(server)
+            else:
+                self._details_dialog = ServerDetailsDialog(self.dialog, server)
             
         except Exception as e:
             self.logger.error("Failed to show server details", e)
             self._show_error_popup(f"Failed to show details: {str(e)}")
     
-    def _show_error_popup(self, message: str):
-        """Show a simple error popup"""
-        error_dialog = ctk.CTkToplevel(self.dialog)
-        error_dialog.title("Error")
-        error_dialog.geometry("400x150")
-        error_dialog.transient(self.dialog)
-        error_dialog.grab_set()
-        
-        # Center the popup
-        error_dialog.update_idletasks()
-        x = self.dialog.winfo_x() + (self.dialog.winfo_width() // 2) - (400 // 2)
-        y = self.dialog.winfo_y() + (self.dialog.winfo_height() // 2) - (150 // 2)
-        error_dialog.geometry(f"400x150+{x}+{y}")
-        
+    def _build_error_popup(self, window) -> Dict:
+        """Create the error popup widgets"""
         ctk.CTkLabel(
-            error_dialog, 
+            window, 
             text="[X] Error", 
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(size=16, weight="bold")
         ).pack(pady=20)
         
-        ctk.CTkLabel(
-            error_dialog, 
-            text=message, 
+        message_label = ctk.CTkLabel(
+            window, 
+            text="", 
             wraplength=350,
-            font=ctk.CTkFont(size=11)
-        ).pack(pady=10)
+            font=_font(size=11)
+        )
+        message_label.pack(pady=10)
         
         ctk.CTkButton(
-            error_dialog, 
+            window, 
             text="OK", 
-            command=error_dialog.destroy
+            command=lambda: self._hide_popup(window)
         ).pack(pady=20)
+        
+        return {"message_label": message_label}
+    
+    def _show_error_popup(self, message: str):
+        """Show a simple error popup"""
+        popup = self._popup("error", self._build_error_popup)
+        popup["message_label"].configure(text=message)
+        self._show_popup(popup["window"], "Error", 400, 150)
     
     def _close_dialog(self):
         """Close the dialog"""
         if self.callback:
-            self.callback(self.selected_servers)
+            self.callback(list(self.selected_servers.values()))
+        self._executor.shutdown(wait=False, cancel_futures=True)
         self.dialog.destroy()
 
 
 class InstallationDialog:
     """Dialog for installing selected MCP servers"""
     
-    def __init__(self, parent, servers: List[Dict], server_manager: MCPServerManager):
+    def __init__(self, parent, servers: List[Dict], server_manager: "MCPServerManager"):
         self.parent = parent
         self.servers = servers
         self.server_manager = server_manager
@@ -1004,8 +1525,6 @@ class InstallationDialog:
         self.dialog = ctk.CTkToplevel(parent)
         self.dialog.title("Install MCP Servers")
         self.dialog.geometry("600x500")
-        self.dialog.transient(parent)
-        self.dialog.grab_set()
         
         # Center dialog
         self._center_dialog()
@@ -1014,13 +1533,25 @@ class InstallationDialog:
         self.current_index = 0
         self.results = []
         self.installing = False
-        
-        # Create UI
+        self._ui = UiPump(self.dialog)
+        self._results_feed = _TextFeed(self._ui, self._results_textbox)
+        
+        # (servers finished, server last started), published by the workers under
+        # _progress_lock and shown by _poll_progress
+        self._progress_state: Optional[tuple] = None
+        self._shown_progress: Optional[tuple] = None
+        self._started_count = 0
+        self._finished_count = 0
+        self._progress_lock = threading.Lock()
+        
+        # Create UI, then make the dialog modal; the window's close button is
+        # refused while installing, like the Close button
         self._create_widgets()
+        self.dialog.protocol("WM_DELETE_WINDOW", self._close_dialog)
+        _make_modal(self.dialog, parent)
     
     def _center_dialog(self):
         """Center dialog on parent"""
-        self.dialog.update_idletasks()
         x = self.parent.winfo_x() + (self.parent.winfo_width() // 2) - (600 // 2)
         y = self.parent.winfo_y() + (self.parent.winfo_height() // 2) - (500 // 2)
         self.dialog.geometry(f"600x500+{x}+{y}")
@@ -1035,14 +1566,14 @@ class InstallationDialog:
         title_label = ctk.CTkLabel(
             header_frame,
             text="[+] Install MCP Servers",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(size=18, weight="bold")
         )
         title_label.pack(pady=15)
         
         count_label = ctk.CTkLabel(
             header_frame,
             text=f"Installing {len(self.servers)} server(s)",
-            font=ctk.CTkFont(size=12),
+            font=_font(size=12),
             text_color="gray70"
         )
         count_label.pack(pady=(0, 15))
@@ -1054,41 +1585,34 @@ class InstallationDialog:
         self.overall_progress_label = ctk.CTkLabel(
             progress_frame,
             text="Ready to install",
-            font=ctk.CTkFont(size=12)
+            font=_font(size=12)
         )
         self.overall_progress_label.pack(pady=(15, 5))
         
         self.overall_progress = ctk.CTkProgressBar(progress_frame, width=400)
         self.overall_progress.pack(pady=(0, 15))
-        self.overall_progress.set(0)
+        _set_progress(self.overall_progress, 0)
         
         # Current server info
         self.current_server_label = ctk.CTkLabel(
             progress_frame,
             text="",
-            font=ctk.CTkFont(size=11),
+            font=_font(size=11),
             text_color="gray60"
         )
         self.current_server_label.pack(pady=(0, 15))
         
-        # Results area
-        results_frame = ctk.CTkFrame(self.dialog)
-        results_frame.pack(fill="both", expand=True, padx=20, pady=10)
+        # Results area; the textbox itself is created by the first result
+        self.results_frame = ctk.CTkFrame(self.dialog)
+        self.results_frame.pack(fill="both", expand=True, padx=20, pady=10)
         
         results_label = ctk.CTkLabel(
-            results_frame,
+            self.results_frame,
             text="Installation Results",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(size=14, weight="bold")
         )
         results_label.pack(pady=(15, 5))
-        
-        self.results_text = ctk.CTkTextbox(
-            results_frame,
-            width=550,
-            height=200,
-            font=ctk.CTkFont(family="Consolas", size=11)
-        )
-        self.results_text.pack(fill="both", expand=True, padx=15, pady=(0, 15))
+        self.results_text = None
         
         # Buttons
         button_frame = ctk.CTkFrame(self.dialog)
@@ -1102,6 +1626,15 @@ class InstallationDialog:
         )
         self.start_btn.pack(side="left", padx=20, pady=15)
         
+        # Users behind rate-limited registries can install one server at a time
+        self.parallel_var = ctk.BooleanVar(value=True)
+        self.parallel_check = ctk.CTkCheckBox(
+            button_frame,
+            text="Install in parallel",
+            variable=self.parallel_var
+        )
+        self.parallel_check.pack(side="left", pady=15)
+        
         self.close_btn = ctk.CTkButton(
             button_frame,
             text="Close",
@@ -1115,85 +1648,137 @@ class InstallationDialog:
         """Start the installation process"""
         self.installing = True
         self.start_btn.configure(state="disabled")
-        self.results_text.delete("0.0", "end")
+        self.parallel_check.configure(state="disabled")
+        if self.results_text is not None:
+            self.results_text.clear()
         
         self._add_result("Starting installation process...\n")
         
         # Start installation in background thread
-        threading.Thread(target=self._install_servers, daemon=True).start()
+        max_workers = min(MAX_PARALLEL_INSTALLS, len(self.servers)) if self.parallel_var.get() else 1
+        _install_pool().submit(self._install_servers, max(max_workers, 1))
+        self.dialog.after(PROGRESS_POLL_INTERVAL_MS, self._poll_progress)
     
-    def _install_servers(self):
-        """Install servers in background thread"""
+    def _install_servers(self, max_workers: int = 1):
+        """Install servers in background thread, up to max_workers at a time"""
         try:
-            total_servers = len(self.servers)
-            
-            for i, server in enumerate(self.servers):
-                self.current_index = i
-                
-                # Update UI
-                self.dialog.after(0, lambda s=server, idx=i: self._update_progress(s, idx))
+            with DaemonThreadPool(max_workers=max_workers, thread_name_prefix="install") as executor:
+                futures = {executor.submit(self._install_one, server): server for server in self.servers}
+                for future in futures:
+                    future.add_done_callback(self._install_finished)
                 
-                # Install server
-                server_name = server.get("name", "Unknown Server")
-                self._add_result(f"\n[{i+1}/{total_servers}] Installing {server_name}...")
-                
-                success, message = self.server_manager.install_server(server)
-                
-                # Record result
-                result = {
-                    "server": server,
-                    "success": success,
-                    "message": message
-                }
-                self.results.append(result)
-                
-                # Update UI
-                if success:
-                    self._add_result(f"[+] Success: {message}")
-                else:
-                    self._add_result(f"[X] Failed: {message}")
+                for future in as_completed(futures):
+                    server = futures[future]
+                    server_name = server.get("name", "Unknown Server")
+                    try:
+                        success, message = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Installation of {server_name} failed", e)
+                        success, message = False, str(e)
+                    
+                    # Record result
+                    result = {
+                        "server": server,
+                        "success": success,
+                        "message": message
+                    }
+                    self.results.append(result)
+                    
+                    # Update UI
+                    if success:
+                        self._add_result(f"[+] Success: {message}")
+                    else:
+                        self._add_result(f"[X] Failed ({server_name}): {message}")
             
             # Installation complete
-            self.dialog.after(0, self._installation_complete)
+            self._ui.call(self._installation_complete)
             
         except Exception as e:
             self.logger.error("Installation process failed", e)
-            self.dialog.after(0, lambda: self._add_result(f"\n✗ Installation process failed: {str(e)}"))
-            self.dialog.after(0, self._installation_complete)
+            
+            failure = f"\n✗ Installation process failed: {str(e)}"
+            
+            def report_failure():
+                """Show the failure and the summary in a single UI callback"""
+                self._add_result(failure)
+                self._installation_complete()
+            
+            self._ui.call(report_failure)
+    
+    def _install_one(self, server: Dict):
+        """Install a single server on an install worker"""
+        with self._progress_lock:
+            index = self._started_count
+            self._started_count += 1
+            # Update UI (picked up by _poll_progress)
+            self._progress_state = (self._finished_count, server)
+        self.current_index = index
+        
+        server_name = server.get("name", "Unknown Server")
+        self._add_result(f"\n[{index + 1}/{len(self.servers)}] Installing {server_name}...")
+        
+        return self.server_manager.install_server(server)
     
-    def _update_progress(self, server: Dict, index: int):
-        """Update progress indicators"""
+    def _install_finished(self, future):
+        """Count a finished install for the progress bar (runs as a future's done-callback)"""
+        with self._progress_lock:
+            self._finished_count += 1
+            current_server = self._progress_state[1] if self._progress_state else None
+            self._progress_state = (self._finished_count, current_server)
+    
+    def _poll_progress(self):
+        """Show the worker's latest progress while the installation runs"""
+        if not self.installing:
+            return
+        
+        state = self._progress_state
+        if state is not None and state is not self._shown_progress:
+            self._shown_progress = state
+            finished, server = state
+            self._update_progress(server, finished)
+        
+        self.dialog.after(PROGRESS_POLL_INTERVAL_MS, self._poll_progress)
+    
+    def _update_progress(self, server: Optional[Dict], finished: int):
+        """Update progress indicators from the number of servers finished so far"""
         total = len(self.servers)
-        progress = (index + 1) / total
+        progress = finished / total
         
-        self.overall_progress.set(progress)
+        _set_progress(self.overall_progress, progress)
         self.overall_progress_label.configure(
-            text=f"Installing {index + 1} of {total} servers"
+            text=f"Installed {finished} of {total} servers"
         )
         
+        if server is None:
+            return
         server_name = server.get("name", "Unknown Server")
         server_type = server.get("type", "unknown")
         self.current_server_label.configure(
             text=f"Current: {server_name} ({server_type})"
         )
     
+    def _results_textbox(self):
+        """Create the results log on first use, so opening the dialog skips it"""
+        if self.results_text is None:
+            self.results_text = _LogText(
+                self.results_frame,
+                width=550,
+                height=200,
+                font=_font(family="Consolas", size=11)
+            )
+            self.results_text.pack(fill="both", expand=True, padx=15, pady=(0, 15))
+        return self.results_text
+    
     def _add_result(self, text: str):
         """Add text to results area"""
-        def add_text():
-            self.results_text.insert("end", text + "\n")
-            self.results_text.see("end")
-        
-        if threading.current_thread() == threading.main_thread():
-            add_text()
-        else:
-            self.dialog.after(0, add_text)
+        self._results_feed.write(text + "\n")
     
     def _installation_complete(self):
         """Handle installation completion"""
         self.installing = False
         
         # Update progress
-        self.overall_progress.set(1.0)
+        _set_progress(self.overall_progress, 1.0)
         self.overall_progress_label.configure(text="Installation completed")
         self.current_server_label.configure(text="")
         
@@ -1201,19 +1786,26 @@ class InstallationDialog:
         successful = sum(1 for r in self.results if r["success"])
         failed = len(self.results) - successful
         
-        self._add_result(f"\n{'='*50}")
-        self._add_result(f"INSTALLATION SUMMARY")
-        self._add_result(f"{'='*50}")
-        self._add_result(f"Successful: {successful}")
-        self._add_result(f"Failed: {failed}")
-        self._add_result(f"Total: {len(self.results)}")
+        rule = "=" * 50
+        summary = [
+            "",
+            rule,
+            "INSTALLATION SUMMARY",
+            rule,
+            f"Successful: {successful}",
+            f"Failed: {failed}",
+            f"Total: {len(self.results)}"
+        ]
         
         if failed > 0:
-            self._add_result(f"\nFailed installations:")
-            for result in self.results:
-                if not result["success"]:
-                    server_name = result["server"].get("name", "Unknown")
-                    self._add_result(f"  - {server_name}: {result['message']}")
+            summary += ["", "Failed installations:"]
+            summary.extend(
+                f"  - {result['server'].get('name', 'Unknown')}: {result['message']}"
+                for result in self.results if not result["success"]
+            )
+        
+        # One insert for the whole summary
+        self._add_result("\n".join(summary))
         
         # Enable close button
         self.close_btn.configure(state="normal")
@@ -1236,15 +1828,14 @@ class SingleInstallDialog:
             self.server_manager = server_manager
             self.logger = get_logger()
             
-            server_name = server.get('name', 'Server')
+            # Read once; the title, output and log lines all use it
+            self.server_name = server_name = server.get('name', 'Server')
             self.logger.info(f"Initializing installation dialog for: {server_name}", category="install")
             
             # Create dialog
             self.dialog = ctk.CTkToplevel(parent)
             self.dialog.title(f"Install {server_name}")
             self.dialog.geometry("500x400")
-            self.dialog.transient(parent)
-            self.dialog.grab_set()
             
             self.logger.info(f"Dialog window created for: {server_name}", category="install")
             
@@ -1254,9 +1845,14 @@ class SingleInstallDialog:
             # Installation state
             self.installing = False
             self.success = False
+            self._ui = UiPump(self.dialog)
+            self._output_feed = _TextFeed(self._ui, self._output_textbox)
             
-            # Create UI
+            # Create UI, then make the dialog modal; the window's close button is
+            # refused while installing, like the Close button
             self._create_widgets()
+            self.dialog.protocol("WM_DELETE_WINDOW", self._close_dialog)
+            _make_modal(self.dialog, parent)
             
             self.logger.info(f"Installation dialog fully initialized for: {server_name}", category="install")
             
@@ -1266,7 +1862,6 @@ class SingleInstallDialog:
     
     def _center_dialog(self):
         """Center dialog on parent"""
-        self.dialog.update_idletasks()
         x = self.parent.winfo_x() + (self.parent.winfo_width() // 2) - (500 // 2)
         y = self.parent.winfo_y() + (self.parent.winfo_height() // 2) - (400 // 2)
         self.dialog.geometry(f"500x400+{x}+{y}")
@@ -1280,8 +1875,8 @@ class SingleInstallDialog:
         
         title_label = ctk.CTkLabel(
             header_frame,
-            text=f"[+] Install {self.server.get('name', 'Server')}",
-            font=ctk.CTkFont(size=16, weight="bold")
+            text=f"[+] Install {self.server_name}",
+            font=_font(size=16, weight="bold")
         )
         title_label.pack(pady=15)
         
@@ -1289,18 +1884,15 @@ class SingleInstallDialog:
         info_frame = ctk.CTkFrame(self.dialog)
         info_frame.pack(fill="x", padx=20, pady=10)
         
-        info_text = f"Type: {self.server.get('type', 'unknown').upper()}\n"
-        if 'package' in self.server:
-            info_text += f"Package: {self.server['package']}\n"
-        if 'repository' in self.server:
-            info_text += f"Repository: {self.server['repository']}\n"
-        if 'version' in self.server:
-            info_text += f"Version: {self.server['version']}\n"
+        info_lines = [f"Type: {self.server.get('type', 'unknown').upper()}"]
+        for key, label in INSTALL_INFO_FIELDS:
+            if key in self.server:
+                info_lines.append(f"{label}: {self.server[key]}")
         
         info_label = ctk.CTkLabel(
             info_frame,
-            text=info_text.strip(),
-            font=ctk.CTkFont(size=11),
+            text="\n".join(info_lines),
+            font=_font(size=11),
             anchor="w",
             justify="left"
         )
@@ -1313,32 +1905,25 @@ class SingleInstallDialog:
         self.status_label = ctk.CTkLabel(
             progress_frame,
             text="Ready to install - Click '[>] Install Now' to begin",
-            font=ctk.CTkFont(size=12)
+            font=_font(size=12)
         )
         self.status_label.pack(pady=(15, 5))
         
         self.progress_bar = ctk.CTkProgressBar(progress_frame, width=400)
         self.progress_bar.pack(pady=(0, 15))
-        self.progress_bar.set(0)
+        _set_progress(self.progress_bar, 0)
         
-        # Output area
-        output_frame = ctk.CTkFrame(self.dialog)
-        output_frame.pack(fill="both", expand=True, padx=20, pady=10)
+        # Output area; the textbox itself is created by the first output
+        self.output_frame = ctk.CTkFrame(self.dialog)
+        self.output_frame.pack(fill="both", expand=True, padx=20, pady=10)
         
         output_label = ctk.CTkLabel(
-            output_frame,
+            self.output_frame,
             text="Installation Output",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=_font(size=12, weight="bold")
         )
         output_label.pack(pady=(15, 5))
-        
-        self.output_text = ctk.CTkTextbox(
-            output_frame,
-            width=450,
-            height=150,
-            font=ctk.CTkFont(family="Consolas", size=10)
-        )
-        self.output_text.pack(fill="both", expand=True, padx=15, pady=(0, 15))
+        self.output_text = None
         
         # Buttons
         button_frame = ctk.CTkFrame(self.dialog)
@@ -1365,33 +1950,33 @@ class SingleInstallDialog:
         """Start the installation process"""
         self.installing = True
         self.install_btn.configure(state="disabled")
-        self.output_text.delete("0.0", "end")
+        if self.output_text is not None:
+            self.output_text.clear()
         
         self._add_output("Starting installation...\n")
         self.status_label.configure(text="Installing...")
-        self.progress_bar.set(0.1)
+        _set_progress(self.progress_bar, 0.1)
         
         # Start installation in background thread
-        threading.Thread(target=self._install_server, daemon=True).start()
+        _install_pool().submit(self._install_server)
     
     def _install_server(self):
         """Install server in background thread"""
         try:
-            server_name = self.server.get("name", "Unknown Server")
-            self._add_output(f"Installing {server_name}...\n")
+            self._add_output(f"Installing {self.server_name}...\n")
             
             # Update progress
-            self.dialog.after(0, lambda: self.progress_bar.set(0.3))
+            self._ui.call(partial(_set_progress, self.progress_bar, 0.3))
             
             # Install server
             success, message = self.server_manager.install_server(self.server)
             
             # Update UI
-            self.dialog.after(0, lambda: self._installation_complete(success, message))
+            self._ui.call(partial(self._installation_complete, success, message))
             
         except Exception as e:
             self.logger.error("Single server installation failed", e)
-            self.dialog.after(0, lambda: self._installation_complete(False, f"Installation failed: {str(e)}"))
+            self._ui.call(partial(self._installation_complete, False, f"Installation failed: {str(e)}"))
     
     def _installation_complete(self, success: bool, message: str):
         """Handle installation completion"""
@@ -1399,7 +1984,7 @@ class SingleInstallDialog:
         self.success = success
         
         # Update progress
-        self.progress_bar.set(1.0)
+        _set_progress(self.progress_bar, 1.0)
         
         if success:
             self.status_label.configure(text="[+] Installation successful!")
@@ -1412,18 +1997,23 @@ class SingleInstallDialog:
         # Enable close button
         self.close_btn.configure(state="normal")
         
-        self.logger.log_user_action(f"Single installation completed: {self.server.get('name')} - {'Success' if success else 'Failed'}")
+        self.logger.log_user_action(f"Single installation completed: {self.server_name} - {'Success' if success else 'Failed'}")
+    
+    def _output_textbox(self):
+        """Create the output log on first use, so opening the dialog skips it"""
+        if self.output_text is None:
+            self.output_text = _LogText(
+                self.output_frame,
+                width=450,
+                height=150,
+                font=_font(family="Consolas", size=10)
+            )
+            self.output_text.pack(fill="both", expand=True, padx=15, pady=(0, 15))
+        return self.output_text
     
     def _add_output(self, text: str):
         """Add text to output area"""
-        def add_text():
-            self.output_text.insert("end", text)
-            self.output_text.see("end")
-        
-        if threading.current_thread() == threading.main_thread():
-            add_text()
-        else:
-            self.dialog.after(0, add_text)
+        self._output_feed.write(text)
     
     def _close_dialog(self):
         """Close the dialog"""
@@ -1437,23 +2027,54 @@ class ServerDetailsDialog:
     def __init__(self, parent, server: Dict):
         self.parent = parent
         self.server = server
+        # Details text per server shown, see _details_text()
+        self._details_texts: Dict[int, tuple] = {}
         
-        # Create dialog
+        # Create dialog; closing only hides it so show() can reuse it
         self.dialog = ctk.CTkToplevel(parent)
         self.dialog.title(f"Server Details: {server.get('name', 'Unknown')}")
         self.dialog.geometry("600x500")
-        self.dialog.transient(parent)
-        self.dialog.grab_set()
+        self.dialog.protocol("WM_DELETE_WINDOW", self._hide)
         
         # Center dialog
         self._center_dialog()
         
-        # Create UI
+        # Create UI, then make the dialog modal
         self._create_widgets()
+        _make_modal(self.dialog, parent)
+    
+    def show(self, server: Dict):
+        """Show the dialog again for another server, reusing its widgets"""
+        self.server = server
+        self.dialog.title(f"Server Details: {server.get('name', 'Unknown')}")
+        self.title_label.configure(text=f"[i] {server.get('name', 'Unknown Server')}")
+        self.details_label.configure(text=self._details_text())
+        self._center_dialog()
+        self.dialog.deiconify()
+        self.dialog.lift()
+        _make_modal(self.dialog, self.parent)
+    
+    def _details_text(self) -> str:
+        """Details text for self.server, built once per server this dialog shows
+        
+        Entries are keyed by the server dict's identity plus its source count, as
+        discovery can still add sources to a server after its details were shown.
+        """
+        key = id(self.server)
+        sources_count = len(self.server.get("sources", ()))
+        cached = self._details_texts.get(key)
+        if cached is None or cached[0] is not self.server or cached[1] != sources_count:
+            cached = (self.server, sources_count, self._build_details_text())
+            self._details_texts[key] = cached
+        return cached[2]
+    
+    def _hide(self):
+        """Hide the dialog until it is shown again"""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
     
     def _center_dialog(self):
         """Center dialog on parent"""
-        self.dialog.update_idletasks()
         x = self.parent.winfo_x() + (self.parent.winfo_width() // 2) - (600 // 2)
         y = self.parent.winfo_y() + (self.parent.winfo_height() // 2) - (500 // 2)
         self.dialog.geometry(f"600x500+{x}+{y}")
@@ -1465,28 +2086,28 @@ class ServerDetailsDialog:
         header_frame = ctk.CTkFrame(self.dialog)
         header_frame.pack(fill="x", padx=20, pady=(20, 10))
         
-        title_label = ctk.CTkLabel(
+        self.title_label = ctk.CTkLabel(
             header_frame,
             text=f"[i] {self.server.get('name', 'Unknown Server')}",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(size=18, weight="bold")
         )
-        title_label.pack(pady=15)
+        self.title_label.pack(pady=15)
         
         # Details area
         details_frame = ctk.CTkScrollableFrame(self.dialog, width=550, height=350)
         details_frame.pack(fill="both", expand=True, padx=20, pady=10)
         
         # Build details text
-        details_text = self._build_details_text()
+        details_text = self._details_text()
         
-        details_label = ctk.CTkLabel(
+        self.details_label = ctk.CTkLabel(
             details_frame,
             text=details_text,
-            font=ctk.CTkFont(size=11),
+            font=_font(size=11),
             anchor="nw",
             justify="left"
         )
-        details_label.pack(fill="both", expand=True, padx=15, pady=15)
+        self.details_label.pack(fill="both", expand=True, padx=15, pady=15)
         
         # Close button
         button_frame = ctk.CTkFrame(self.dialog)
@@ -1496,84 +2117,82 @@ class ServerDetailsDialog:
             button_frame,
             text="Close",
             width=100,
-            command=self.dialog.destroy
+            command=self._hide
         )
         close_btn.pack(pady=15)
     
     def _build_details_text(self) -> str:
         """Build detailed information text"""
-        details = []
+        # Lines that are always shown are written as one multi-line entry; the list
+        # is joined once at the end. Each optional field is looked up once.
+        get = self.server.get
         
         # Basic info
-        details.append("=== BASIC INFORMATION ===")
-        details.append(f"Name: {self.server.get('name', 'Unknown')}")
-        details.append(f"Type: {self.server.get('type', 'unknown').upper()}")
-        details.append(f"Category: {self.server.get('category', 'unknown')}")
+        details = [
+            "=== BASIC INFORMATION ===\n"
+            f"Name: {get('name', 'Unknown')}\n"
+            f"Type: {get('type', 'unknown').upper()}\n"
+            f"Category: {get('category', 'unknown')}"
+        ]
         
-        if 'description' in self.server:
-            details.append(f"Description: {self.server['description']}")
-        
-        details.append("")
+        description = get('description')
+        if description is not None:
+            details.append(f"Description: {description}")
         
         # Technical details
-        details.append("=== TECHNICAL DETAILS ===")
-        if 'package' in self.server:
-            details.append(f"Package: {self.server['package']}")
-        if 'repository' in self.server:
-            details.append(f"Repository: {self.server['repository']}")
-        if 'image' in self.server:
-            details.append(f"Docker Image: {self.server['image']}")
-        if 'version' in self.server:
-            details.append(f"Version: {self.server['version']}")
-        if 'language' in self.server:
-            details.append(f"Language: {self.server['language']}")
-        
-        details.append("")
+        details.append("\n=== TECHNICAL DETAILS ===")
+        for key, label in TECHNICAL_DETAIL_FIELDS:
+            value = get(key)
+            if value is not None:
+                details.append(f"{label}: {value}")
         
         # Source info
-        details.append("=== SOURCE INFORMATION ===")
-        if 'source' in self.server:
-            details.append(f"Source: {self.server['source']}")
-        if 'stars' in self.server:
-            details.append(f"GitHub Stars: {self.server['stars']}")
+        details.append("\n=== SOURCE INFORMATION ===")
+        source = get('source')
+        if source is not None:
+            details.append(f"Source: {source}")
+        sources = get('sources', ())
+        if len(sources) > 1:
+            details.append(f"Also listed in: {', '.join(sources[1:])}")
+        stars = get('stars')
+        if stars is not None:
+            details.append(f"GitHub Stars: {stars}")
         
         details.append("")
         
         # Prerequisites
-        if 'prerequisites' in self.server:
+        prereqs = get('prerequisites')
+        if prereqs is not None:
             details.append("=== PREREQUISITES ===")
-            prereqs = self.server['prerequisites']
             if isinstance(prereqs, list):
-                for prereq in prereqs:
-                    details.append(f"- {prereq}")
+                details.extend(f"- {prereq}" for prereq in prereqs)
             else:
                 details.append(f"- {prereqs}")
             details.append("")
         
         # Configuration
-        if 'configuration' in self.server:
-            config = self.server['configuration']
+        config = get('configuration')
+        if config is not None:
             details.append("=== CONFIGURATION ===")
             
-            if 'command' in config:
-                details.append(f"Command: {config['command']}")
-            if 'args' in config and config['args']:
-                details.append(f"Arguments: {' '.join(config['args'])}")
-            if 'env' in config and config['env']:
+            command = config.get('command')
+            if command is not None:
+                details.append(f"Command: {command}")
+            args = config.get('args')
+            if args:
+                details.append(f"Arguments: {' '.join(args)}")
+            env = config.get('env')
+            if env:
                 details.append("Environment Variables:")
-                for key, value in config['env'].items():
-                    details.append(f"  {key}={value}")
+                details.extend(f"  {key}={value}" for key, value in env.items())
             
             details.append("")
         
         # Tags
-        if 'tags' in self.server:
+        tags = get('tags')
+        if tags is not None:
             details.append("=== TAGS ===")
-            tags = self.server['tags']
-            if isinstance(tags, list):
-                details.append(", ".join(tags))
-            else:
-                details.append(str(tags))
+            details.append(", ".join(tags) if isinstance(tags, list) else str(tags))
         
         return "\n".join(details)
 
@@ -1585,22 +2204,24 @@ class ServerCreationDialog:
         self.parent = parent
         self.logger = get_logger()
         
+        # Error/success popup, built on first use and reused after (see _show_message)
+        self._message_popup: Optional[Dict] = None
+        
         # Create dialog
         self.dialog = ctk.CTkToplevel(parent)
         self.dialog.title("Create Custom MCP Server")
         self.dialog.geometry("700x600")
-        self.dialog.transient(parent)
-        self.dialog.grab_set()
         
         # Center dialog
         self._center_dialog()
         
-        # Create UI
-        self._create_widgets()
+        # Build the form once Tk is idle, so the window shows before its widgets
+        # are created; _make_modal's idle callback is queued after it
+        self.dialog.after_idle(self._create_widgets)
+        _make_modal(self.dialog, parent)
     
     def _center_dialog(self):
         """Center dialog on parent"""
-        self.dialog.update_idletasks()
         x = self.parent.winfo_x() + (self.parent.winfo_width() // 2) - (700 // 2)
         y = self.parent.winfo_y() + (self.parent.winfo_height() // 2) - (600 // 2)
         self.dialog.geometry(f"700x600+{x}+{y}")
@@ -1615,7 +2236,7 @@ class ServerCreationDialog:
         title_label = ctk.CTkLabel(
             header_frame,
             text="[+] Create Custom MCP Server",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(size=18, weight="bold")
         )
         title_label.pack(pady=15)
         
@@ -1624,37 +2245,37 @@ class ServerCreationDialog:
         form_frame.pack(fill="both", expand=True, padx=20, pady=10)
         
         # Server Name
-        ctk.CTkLabel(form_frame, text="Server Name:", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(10, 5))
+        ctk.CTkLabel(form_frame, text="Server Name:", font=_font(weight="bold")).pack(anchor="w", pady=(10, 5))
         self.name_entry = ctk.CTkEntry(form_frame, width=400, placeholder_text="My Custom Server")
         self.name_entry.pack(anchor="w", pady=(0, 10))
         
         # Server Type
-        ctk.CTkLabel(form_frame, text="Server Type:", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(10, 5))
+        ctk.CTkLabel(form_frame, text="Server Type:", font=_font(weight="bold")).pack(anchor="w", pady=(10, 5))
         self.type_combo = ctk.CTkComboBox(form_frame, values=["npm", "python", "git", "docker"], width=200)
         self.type_combo.pack(anchor="w", pady=(0, 10))
         self.type_combo.set("npm")
         
         # Description
-        ctk.CTkLabel(form_frame, text="Description:", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(10, 5))
+        ctk.CTkLabel(form_frame, text="Description:", font=_font(weight="bold")).pack(anchor="w", pady=(10, 5))
         self.description_text = ctk.CTkTextbox(form_frame, width=600, height=80)
         self.description_text.pack(anchor="w", pady=(0, 10))
         
         # Package/Repository
-        ctk.CTkLabel(form_frame, text="Package/Repository:", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(10, 5))
+        ctk.CTkLabel(form_frame, text="Package/Repository:", font=_font(weight="bold")).pack(anchor="w", pady=(10, 5))
         self.package_entry = ctk.CTkEntry(form_frame, width=400, placeholder_text="npm package name or git repository URL")
         self.package_entry.pack(anchor="w", pady=(0, 10))
         
         # Command and Args
-        ctk.CTkLabel(form_frame, text="Command:", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(10, 5))
+        ctk.CTkLabel(form_frame, text="Command:", font=_font(weight="bold")).pack(anchor="w", pady=(10, 5))
         self.command_entry = ctk.CTkEntry(form_frame, width=400, placeholder_text="npx")
         self.command_entry.pack(anchor="w", pady=(0, 10))
         
-        ctk.CTkLabel(form_frame, text="Arguments (one per line):", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(10, 5))
+        ctk.CTkLabel(form_frame, text="Arguments (one per line):", font=_font(weight="bold")).pack(anchor="w", pady=(10, 5))
         self.args_text = ctk.CTkTextbox(form_frame, width=600, height=80)
         self.args_text.pack(anchor="w", pady=(0, 10))
         
         # Environment Variables
-        ctk.CTkLabel(form_frame, text="Environment Variables (KEY=value, one per line):", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(10, 5))
+        ctk.CTkLabel(form_frame, text="Environment Variables (KEY=value, one per line):", font=_font(weight="bold")).pack(anchor="w", pady=(10, 5))
         self.env_text = ctk.CTkTextbox(form_frame, width=600, height=80)
         self.env_text.pack(anchor="w", pady=(0, 10))
         
@@ -1692,19 +2313,12 @@ class ServerCreationDialog:
             package = self.package_entry.get().strip()
             command = self.command_entry.get().strip()
             
-            # Parse arguments
-            args_text = self.args_text.get("0.0", "end").strip()
-            args = [arg.strip() for arg in args_text.split('\n') if arg.strip()] if args_text else []
+            # Parse arguments, one per non-blank line
+            args_text = self.args_text.get("0.0", "end")
+            args = [arg for arg in map(str.strip, args_text.splitlines()) if arg]
             
-            # Parse environment variables
-            env_text = self.env_text.get("0.0", "end").strip()
-            env = {}
-            if env_text:
-                for line in env_text.split('\n'):
-                    line = line.strip()
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        env[key.strip()] = value.strip()
+            # Parse environment variables in one scan of the text
+            env = dict(ENV_LINE_PATTERN.findall(self.env_text.get("0.0", "end")))
             
             # Create server configuration
             server_config = {
@@ -1741,11 +2355,13 @@ class ServerCreationDialog:
         try:
             catalog_file = Path("config/servers.json")
             
-            # Load existing catalog
-            if catalog_file.exists():
-                with open(catalog_file, 'r', encoding='utf-8') as f:
-                    catalog = json.load(f)
-            else:
+            # Load existing catalog; only a missing one may need its directory created
+            try:
+                # Parse the whole file in one call rather than through a text stream
+                with open(catalog_file, 'rb') as f:
+                    catalog = json.loads(f.read())
+            except FileNotFoundError:
+                catalog_file.parent.mkdir(exist_ok=True)
                 catalog = {"servers": {}, "categories": {}}
             
             # Add server to catalog
@@ -1759,10 +2375,18 @@ class ServerCreationDialog:
                     "description": "User-created server configurations"
                 }
             
-            # Save catalog
-            catalog_file.parent.mkdir(exist_ok=True)
-            with open(catalog_file, 'w', encoding='utf-8') as f:
-                json.dump(catalog, f, indent=2, ensure_ascii=False)
+            # Save catalog through a temp file, so a failed write can't leave it truncated
+            temp_file = catalog_file.with_suffix(".tmp")
+            try:
+                with open(temp_file, 'wb') as f:
+                    f.write(json.dumps(catalog, indent=2, ensure_ascii=False).encode('utf-8'))
+                os.replace(temp_file, catalog_file)
+            except Exception:
+                try:
+                    os.remove(temp_file)
+                except OSError:
+                    pass
+                raise
             
             self.logger.log_user_action(f"Custom server created: {server_config['name']}")
             
@@ -1770,34 +2394,55 @@ class ServerCreationDialog:
             self.logger.error("Failed to save server to catalog", e)
             raise
     
+    def _show_message(self, title: str, heading: str, message: str, on_ok: Callable):
+        """Show the message popup, creating its widgets only the first time
+        
+        Later calls just swap its text and OK command, so repeated validation
+        errors don't build a new window each time.
+        """
+        popup = self._message_popup
+        if popup is None or not popup["window"].winfo_exists():
+            window = ctk.CTkToplevel(self.dialog)
+            window.geometry("400x150")
+            window.protocol("WM_DELETE_WINDOW", self._hide_message)
+            
+            heading_label = ctk.CTkLabel(window, text="", font=_font(size=16, weight="bold"))
+            heading_label.pack(pady=20)
+            message_label = ctk.CTkLabel(window, text="", wraplength=350)
+            message_label.pack(pady=10)
+            ok_btn = ctk.CTkButton(window, text="OK")
+            ok_btn.pack(pady=20)
+            
+            popup = self._message_popup = {
+                "window": window,
+                "heading_label": heading_label,
+                "message_label": message_label,
+                "ok_btn": ok_btn
+            }
+        else:
+            popup["window"].deiconify()
+            popup["window"].lift()
+        
+        popup["window"].title(title)
+        popup["heading_label"].configure(text=heading)
+        popup["message_label"].configure(text=message)
+        popup["ok_btn"].configure(command=on_ok)
+        _make_modal(popup["window"], self.dialog)
+    
+    def _hide_message(self):
+        """Hide the message popup so it can be shown again later"""
+        window = self._message_popup["window"]
+        window.grab_release()
+        window.withdraw()
+    
     def _show_error(self, message: str):
         """Show error message"""
-        error_dialog = ctk.CTkToplevel(self.dialog)
-        error_dialog.title("Error")
-        error_dialog.geometry("400x150")
-        error_dialog.transient(self.dialog)
-        error_dialog.grab_set()
-        
-        ctk.CTkLabel(error_dialog, text="[X] Error", font=ctk.CTkFont(size=16, weight="bold")).pack(pady=20)
-        ctk.CTkLabel(error_dialog, text=message, wraplength=350).pack(pady=10)
-        ctk.CTkButton(error_dialog, text="OK", command=error_dialog.destroy).pack(pady=20)
+        self._show_message("Error", "[X] Error", message, self._hide_message)
     
     def _show_success(self, message: str):
         """Show success message"""
-        success_dialog = ctk.CTkToplevel(self.dialog)
-        success_dialog.title("Success")
-        success_dialog.geometry("400x150")
-        success_dialog.transient(self.dialog)
-        success_dialog.grab_set()
-        
-        ctk.CTkLabel(success_dialog, text="[+] Success", font=ctk.CTkFont(size=16, weight="bold")).pack(pady=20)
-        ctk.CTkLabel(success_dialog, text=message, wraplength=350).pack(pady=10)
-        
-        def close_both():
-            success_dialog.destroy()
-            self.dialog.destroy()
-        
-        ctk.CTkButton(success_dialog, text="OK", command=close_both).pack(pady=20)
+        # Closing the creation dialog also destroys the popup
+        self._show_message("Success", "[+] Success", message, self.dialog.destroy)
     
     def _close_dialog(self):
         """Close the dialog"""
@@ -1,18 +1,39 @@
 """
 Main application window for MCP Installer
 Built with CustomTkinter for a modern, professional appearance
+
+Widgets are only changed on the Tk thread: the status, progress and log helpers
+may be called from worker threads and hand their updates to a UiPump, the same
+queue-and-drain loop the dialogs use.
 """
 
 import customtkinter as ctk
+import collections
 import threading
-import webbrowser
+import time
+from functools import partial
 from typing import Optional, Callable
 from pathlib import Path
 
 from ..utils.logger import get_logger
+from ..utils.workers import DaemonThreadPool
+from .ui_pump import UiPump
 from ..core.system_checker import SystemChecker
 from ..core.server_manager import MCPServerManager
-from .dialogs import ServerDiscoveryDialog, ServerCreationDialog
+
+# Color coding for the activity log levels
+LOG_LEVEL_COLORS = {
+    "INFO": "white",
+    "WARNING": "orange",
+    "ERROR": "red",
+    "SUCCESS": "green"
+}
+
+# Background tasks started from the main window that may run at once
+BACKGROUND_WORKERS = 4
+
+# Lines kept in the activity log; older ones are dropped as new ones arrive
+LOG_MAX_LINES = 2000
 
 
 class MCPInstallerGUI:
@@ -43,6 +64,18 @@ class MCPInstallerGUI:
         self.status_var = ctk.StringVar(value="Ready")
         self.progress_var = ctk.DoubleVar()
         
+        # Widget updates requested by worker threads, run on the Tk thread
+        self._ui = UiPump(self.root)
+        
+        # Activity log lines waiting for _flush_log_buffer (added from any thread)
+        self._log_buffer = collections.deque()
+        self._log_lock = threading.Lock()
+        self._log_flush_scheduled = False
+        
+        # Worker threads for run_in_thread, reused across button clicks; they are
+        # daemon threads, so a task still running never keeps the app open
+        self._pool = DaemonThreadPool(max_workers=BACKGROUND_WORKERS, thread_name_prefix="mcp-gui")
+        
         # Create UI
         self.create_widgets()
         
@@ -54,7 +87,6 @@ class MCPInstallerGUI:
     
     def center_window(self):
         """Center the window on screen"""
-        self.root.update_idletasks()
         x = (self.root.winfo_screenwidth() // 2) - (1000 // 2)
         y = (self.root.winfo_screenheight() // 2) - (700 // 2)
         self.root.geometry(f"1000x700+{x}+{y}")
@@ -62,6 +94,10 @@ class MCPInstallerGUI:
     def create_widgets(self):
         """Create and layout all GUI widgets"""
         
+        # Fonts shared by the labels and buttons below, created once the root exists
+        self.body_font = ctk.CTkFont(size=14)
+        self.heading_font = ctk.CTkFont(size=16, weight="bold")
+        
         # Header Frame
         header_frame = ctk.CTkFrame(self.root)
         header_frame.pack(fill="x", padx=20, pady=(20, 10))
@@ -78,7 +114,7 @@ class MCPInstallerGUI:
         subtitle_label = ctk.CTkLabel(
             header_frame,
             text="Professional MCP Server Management Tool",
-            font=ctk.CTkFont(size=14),
+            font=self.body_font,
             text_color="gray70"
         )
         subtitle_label.pack(pady=(0, 20))
@@ -112,7 +148,7 @@ class MCPInstallerGUI:
         quick_label = ctk.CTkLabel(
             parent,
             text="Quick Actions",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.heading_font
         )
         quick_label.pack(pady=(20, 15))
         
@@ -122,7 +158,7 @@ class MCPInstallerGUI:
             text="[?] System Check",
             width=200,
             height=40,
-            font=ctk.CTkFont(size=14),
+            font=self.body_font,
             command=self.system_check_clicked
         )
         self.system_btn.pack(pady=5)
@@ -135,7 +171,7 @@ class MCPInstallerGUI:
         server_label = ctk.CTkLabel(
             parent,
             text="Server Management",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.heading_font
         )
         server_label.pack(pady=(15, 15))
         
@@ -145,7 +181,7 @@ class MCPInstallerGUI:
             text="[*] Discover Servers",
             width=200,
             height=40,
-            font=ctk.CTkFont(size=14),
+            font=self.body_font,
             command=self.discover_servers_clicked
         )
         self.discover_btn.pack(pady=5)
@@ -156,7 +192,7 @@ class MCPInstallerGUI:
             text="[+] Create Server",
             width=200,
             height=40,
-            font=ctk.CTkFont(size=14),
+            font=self.body_font,
             command=self.create_server_clicked
         )
         self.create_btn.pack(pady=5)
@@ -167,7 +203,7 @@ class MCPInstallerGUI:
             text="[I] Install Servers",
             width=200,
             height=40,
-            font=ctk.CTkFont(size=14),
+            font=self.body_font,
             command=self.install_server_clicked
         )
         self.install_btn.pack(pady=5)
@@ -180,7 +216,7 @@ class MCPInstallerGUI:
         tools_label = ctk.CTkLabel(
             parent,
             text="Tools & Monitoring",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.heading_font
         )
         tools_label.pack(pady=(15, 15))
         
@@ -190,7 +226,7 @@ class MCPInstallerGUI:
             text="[D] Docker Manager",
             width=200,
             height=40,
-            font=ctk.CTkFont(size=14),
+            font=self.body_font,
             command=self.docker_manager_clicked
         )
         self.docker_btn.pack(pady=5)
@@ -201,7 +237,7 @@ class MCPInstallerGUI:
             text="[W] Web Dashboard",
             width=200,
             height=40,
-            font=ctk.CTkFont(size=14),
+            font=self.body_font,
             command=self.web_dashboard_clicked
         )
         self.dashboard_btn.pack(pady=5)
@@ -212,7 +248,7 @@ class MCPInstallerGUI:
             text="[U] Check Updates",
             width=200,
             height=40,
-            font=ctk.CTkFont(size=14),
+            font=self.body_font,
             command=self.check_updates_clicked
         )
         self.update_btn.pack(pady=5)
@@ -224,7 +260,7 @@ class MCPInstallerGUI:
         info_label = ctk.CTkLabel(
             parent,
             text="System Information",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.heading_font
         )
         info_label.pack(pady=(20, 10))
         
@@ -245,7 +281,7 @@ class MCPInstallerGUI:
         log_label = ctk.CTkLabel(
             parent,
             text="Activity Log",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.heading_font
         )
         log_label.pack(pady=(20, 10))
         
@@ -281,25 +317,18 @@ class MCPInstallerGUI:
         self.progress_bar.set(0)
     
     def add_log_entry(self, message: str, level: str = "INFO"):
-        """Add entry to the activity log"""
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        
-        # Color coding for different log levels
-        color_map = {
-            "INFO": "white",
-            "WARNING": "orange",
-            "ERROR": "red",
-            "SUCCESS": "green"
-        }
+        """Add entry to the activity log (safe from any thread)"""
+        timestamp = time.strftime("%H:%M:%S")
         
         log_entry = f"[{timestamp}] {level}: {message}\n"
         
-        # Insert at the end
-        self.log_text.insert("end", log_entry)
-        
-        # Auto-scroll to bottom
-        self.log_text.see("end")
+        # Queue the line; the first one queued schedules a flush for all of them
+        with self._log_lock:
+            self._log_buffer.append(log_entry)
+            schedule_flush = not self._log_flush_scheduled
+            self._log_flush_scheduled = True
+        if schedule_flush:
+            self._ui.call(self._flush_log_buffer)
         
         # Also log to file
         if level == "ERROR":
@@ -309,18 +338,38 @@ class MCPInstallerGUI:
         else:
             self.logger.info(message)
     
+    def _flush_log_buffer(self):
+        """Insert all queued log lines at once and scroll to the bottom (Tk thread)"""
+        with self._log_lock:
+            entries = "".join(self._log_buffer)
+            self._log_buffer.clear()
+            self._log_flush_scheduled = False
+        
+        self.log_text.insert("end", entries)
+        
+        # "end-1c" is just past the trailing newline, so its line number is the line count
+        line_count = int(self.log_text.index("end-1c").split(".")[0]) - 1
+        if line_count > LOG_MAX_LINES:
+            self.log_text.delete("1.0", f"{line_count - LOG_MAX_LINES + 1}.0")
+        
+        self.log_text.see("end")
+    
     def update_status(self, message: str):
-        """Update status bar message"""
-        self.status_var.set(message)
+        """Update status bar message (safe from any thread)"""
+        self._ui.call(partial(self.status_var.set, message))
         self.add_log_entry(f"Status: {message}")
     
     def update_progress(self, value: float):
-        """Update progress bar (0.0 to 1.0)"""
-        self.progress_bar.set(value)
-        self.root.update_idletasks()
+        """Update progress bar (0.0 to 1.0, safe from any thread)"""
+        self._ui.call(partial(self.progress_bar.set, value))
+    
+    def _show_system_info(self, text: str):
+        """Replace the system information panel's text (Tk thread)"""
+        self.sys_info_text.delete("0.0", "end")
+        self.sys_info_text.insert("0.0", text)
     
     def run_in_thread(self, func: Callable, *args, **kwargs):
-        """Run a function in a separate thread to prevent GUI blocking"""
+        """Run a function on a background worker thread to prevent GUI blocking"""
         def wrapper():
             try:
                 func(*args, **kwargs)
@@ -331,8 +380,7 @@ class MCPInstallerGUI:
                 self.update_progress(0)
                 self.update_status("Ready")
         
-        thread = threading.Thread(target=wrapper, daemon=True)
-        thread.start()
+        self._pool.submit(wrapper)
     
     # Button Event Handlers
     
@@ -386,6 +434,7 @@ class MCPInstallerGUI:
         
         dashboard_path = Path("mcp-dashboard.html")
         if dashboard_path.exists():
+            import webbrowser
             webbrowser.open(dashboard_path.absolute().as_uri())
             self.add_log_entry("Web dashboard opened successfully", "SUCCESS")
         else:
@@ -414,8 +463,7 @@ class MCPInstallerGUI:
             
             # Update system info display
             formatted_results = self.system_checker.format_results_for_display()
-            self.sys_info_text.delete("0.0", "end")
-            self.sys_info_text.insert("0.0", formatted_results)
+            self._ui.call(partial(self._show_system_info, formatted_results))
             
             # Get summary
             summary = self.system_checker.get_summary()
@@ -444,13 +492,15 @@ class MCPInstallerGUI:
             
             # Open discovery dialog in main thread
             def open_dialog():
+                # The dialogs module is loaded on first use, not at startup
+                from .dialogs import ServerDiscoveryDialog
                 dialog = ServerDiscoveryDialog(
                     self.root, 
                     callback=self._on_servers_discovered
                 )
             
             # Run in main thread
-            self.root.after(0, open_dialog)
+            self._ui.call(open_dialog)
             
         except Exception as e:
             self.logger.error("Failed to open server discovery", e)
@@ -462,9 +512,10 @@ class MCPInstallerGUI:
             self.add_log_entry("Opening server creation dialog...")
             
             def open_dialog():
+                from .dialogs import ServerCreationDialog
                 dialog = ServerCreationDialog(self.root)
             
-            self.root.after(0, open_dialog)
+            self._ui.call(open_dialog)
             
         except Exception as e:
             self.logger.error("Failed to open server creator", e)
@@ -554,13 +605,19 @@ class MCPInstallerGUI:
                 self.update_status("Initializing system checks...")
                 self.logger.info("Running startup system checks")
                 
-                # Run system info check
-                self.update_status("Checking system information...")
-                system_info = self.system_checker.get_system_info()
+                # System information and IDE detection are independent, so the
+                # IDE scan runs on another worker while the platform is checked here
+                self.update_status("Checking system information and detecting installed IDEs...")
+                ide_future = self._pool.submit(self.server_manager.vscode_config.get_extension_status)
+                
+                system_info = self.system_checker.check_platform()
+                self.logger.log_system_info(
+                    "platform",
+                    "PASS" if system_info["status"] else "FAIL",
+                    system_info.get("details", "")
+                )
                 
-                # Check IDE installations
-                self.update_status("Detecting installed IDEs...")
-                ide_status = self.server_manager.vscode_config.get_extension_status()
+                ide_status = ide_future.result()
                 
                 # Log detected IDEs
                 for ide_name, status in ide_status.items():
@@ -583,6 +640,7 @@ class MCPInstallerGUI:
         """Handle application closing"""
         self.logger.log_user_action("Application closing")
         self.logger.end_session()
+        self._pool.shutdown(wait=False, cancel_futures=True)
         self.root.destroy()
     
     def run(self):
@@ -0,0 +1,57 @@
+"""
+Hands widget updates from worker threads to the Tk thread
+"""
+
+import queue
+import tkinter as tk
+from typing import Callable
+
+from ..utils.logger import get_logger
+
+# Callables queued by worker threads run on the Tk thread from a pump that ticks
+# this often while it has work (about 60 Hz), and slower while it is idle
+UI_PUMP_BUSY_MS = 16
+UI_PUMP_IDLE_MS = 100
+UI_PUMP_BATCH = 50
+
+
+class UiPump:
+    """Runs callables queued by worker threads on the Tk thread
+    
+    Tk is not thread-safe, so workers never call into it: call() only queues,
+    and a loop started on the Tk thread runs up to UI_PUMP_BATCH queued
+    callables per tick, in order, until its widget is destroyed.
+    """
+    
+    def __init__(self, widget):
+        # Must be created on the Tk thread, which then owns the pump loop
+        self._widget = widget
+        self._queue = queue.Queue()
+        self._logger = get_logger()
+        self._tick()
+    
+    def call(self, func: Callable):
+        """Run func on the Tk thread at the next tick (safe from any thread)"""
+        self._queue.put(func)
+    
+    def _tick(self):
+        """Run queued callables and schedule the next tick"""
+        try:
+            if not self._widget.winfo_exists():
+                return
+        except tk.TclError:
+            return
+        
+        ran = 0
+        while ran < UI_PUMP_BATCH:
+            try:
+                func = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            ran += 1
+            try:
+                func()
+            except Exception as e:
+                self._logger.error("UI update failed", e)
+        
+        self._widget.after(UI_PUMP_BUSY_MS if ran else UI_PUMP_IDLE_MS, self._tick)
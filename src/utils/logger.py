@@ -3,13 +3,129 @@ Comprehensive logging system for MCP Installer
 Provides detailed logging with automatic log rotation and multiple log levels
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+
+# Loggers only queue their records; one listener thread writes them to the files
+# and the console, so logging from the GUI thread never waits on disk I/O
+LOG_QUEUE = queue.Queue()
+
+# Records each log file buffers before writing them in one go; errors are written
+# at once, and anything buffered is written at least every LOG_FLUSH_INTERVAL seconds
+LOG_BUFFER_CAPACITY = 512
+LOG_FLUSH_INTERVAL = 1.0
+
+
+class _HandlerRouter(logging.Handler):
+    """Hands each queued record to the handlers registered for its logger"""
+    
+    def __init__(self):
+        super().__init__()
+        self.routes: Dict[str, List[logging.Handler]] = {}
+    
+    def add(self, logger_name: str, handler: logging.Handler):
+        """Send records from the named logger to handler"""
+        self.routes.setdefault(logger_name, []).append(handler)
+    
+    def emit(self, record: logging.LogRecord):
+        for handler in self.routes.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+    
+    def flush(self):
+        """Write out anything the routed handlers are buffering"""
+        for handlers in list(self.routes.values()):
+            for handler in handlers:
+                handler.flush()
+
+
+def _write_batch(handler: logging.handlers.RotatingFileHandler, records: List[logging.LogRecord]):
+    """Write records to a rotating file handler's file with one write and one flush
+    
+    The handler may have been created with delay=True, and doRollover leaves such
+    a handler without an open stream, so the stream is (re)opened whenever it is
+    missing. Rollover happens before the batch if the whole batch would push the
+    file past maxBytes; the caller holds the handler's lock.
+    """
+    text = "".join(handler.format(record) + handler.terminator for record in records)
+    if handler.stream is None:
+        handler.stream = handler._open()
+    if handler.maxBytes > 0:
+        handler.stream.seek(0, 2)  # Non-posix platforms report tell() at 0 until a seek
+        size = handler.stream.tell()
+        if size and size + len(text) >= handler.maxBytes:
+            handler.doRollover()
+            if handler.stream is None:
+                handler.stream = handler._open()
+    handler.stream.write(text)
+    handler.flush()
+
+
+class _BatchedFileHandler(logging.handlers.MemoryHandler):
+    """Buffers records for a rotating file handler and writes each batch at once
+    
+    MemoryHandler's own flush hands records to the target one by one, and the
+    target writes and flushes each of them; here the batch goes through
+    _write_batch, so the file sees one write and one flush per batch.
+    """
+    
+    def __init__(self, target: logging.handlers.RotatingFileHandler):
+        super().__init__(LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=target)
+    
+    def flush(self):
+        self.acquire()
+        try:
+            if not self.buffer or self.target is None:
+                return
+            target = self.target
+            target.acquire()
+            try:
+                _write_batch(target, self.buffer)
+            except Exception:
+                target.handleError(self.buffer[-1])
+            finally:
+                target.release()
+            self.buffer.clear()
+        finally:
+            self.release()
+
+
+_router = _HandlerRouter()
+_listener: Optional[logging.handlers.QueueListener] = None
+_listener_lock = threading.Lock()
+_stop_flushing = threading.Event()
+
+
+def _flush_periodically():
+    """Bound how long buffered records wait before reaching the log files"""
+    while not _stop_flushing.wait(LOG_FLUSH_INTERVAL):
+        _router.flush()
+
+
+def _stop_listener():
+    """Write out everything still queued or buffered (run at exit)"""
+    _listener.stop()
+    _stop_flushing.set()
+    _router.flush()
+
+
+def _start_listener():
+    """Start the threads that write queued records, once per process"""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            _listener = logging.handlers.QueueListener(LOG_QUEUE, _router)
+            _listener.start()
+            threading.Thread(target=_flush_periodically, name="mcp-log-flush", daemon=True).start()
+            atexit.register(_stop_listener)
 
 
 class MCPLogger:
@@ -18,21 +134,40 @@ class MCPLogger:
     def __init__(self, log_dir: str = "logs"):
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
+        _start_listener()
         
         # Initialize different loggers for different purposes
         self.main_logger = self._setup_logger("main", "mcp_installer.log")
         self.system_logger = self._setup_logger("system", "system_check.log")
         self.install_logger = self._setup_logger("install", "installations.log")
-        self.error_logger = self._setup_logger("error", "errors.log", level=logging.ERROR)
+        # Errors from every category also reach errors.log; the router hands each
+        # record to both files, so an error is logged and queued only once
+        self.error_logger = self._setup_logger(
+            "error", "errors.log", level=logging.ERROR,
+            shared_with=(self.main_logger.name, self.system_logger.name, self.install_logger.name)
+        )
+        
+        # Category names accepted by the logging methods
+        self._loggers = {
+            "main": self.main_logger,
+            "system": self.system_logger,
+            "install": self.install_logger,
+            "error": self.error_logger,
+        }
         
         # Console handler for immediate feedback
         self.console_handler = self._setup_console_handler()
         
         # Add console handler to main logger
-        self.main_logger.addHandler(self.console_handler)
+        _router.add(self.main_logger.name, self.console_handler)
+        
+    def _setup_logger(self, name: str, filename: str, level: int = logging.INFO,
+                      shared_with: Tuple[str, ...] = ()) -> logging.Logger:
+        """Set up a logger with file rotation, written from the listener thread
         
-    def _setup_logger(self, name: str, filename: str, level: int = logging.INFO) -> logging.Logger:
-        """Set up a logger with file rotation"""
+        Records at or above level from the loggers named in shared_with are
+        written to the same file.
+        """
         logger = logging.getLogger(name)
         logger.setLevel(level)
         
@@ -43,7 +178,8 @@ class MCPLogger:
         # File handler with rotation
         file_path = self.log_dir / filename
         file_handler = logging.handlers.RotatingFileHandler(
-            file_path, maxBytes=10*1024*1024, backupCount=5  # 10MB max, 5 backups
+            file_path, maxBytes=10*1024*1024, backupCount=5,  # 10MB max, 5 backups
+            delay=True  # Files that are never written to are never opened
         )
         
         # Detailed format for file logs
@@ -52,7 +188,13 @@ class MCPLogger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        
+        # Buffer records so bursts reach the file in a few writes instead of one per record
+        batched_handler = _BatchedFileHandler(file_handler)
+        batched_handler.setLevel(level)
+        for logger_name in (name,) + tuple(shared_with):
+            _router.add(logger_name, batched_handler)
+        logger.addHandler(logging.handlers.QueueHandler(LOG_QUEUE))
         
         return logger
     
@@ -90,33 +232,33 @@ class MCPLogger:
     
     def info(self, message: str, category: str = "main"):
         """Log info message"""
-        logger = getattr(self, f"{category}_logger", self.main_logger)
+        logger = self._loggers.get(category, self.main_logger)
         logger.info(message)
     
     def warning(self, message: str, category: str = "main"):
         """Log warning message"""
-        logger = getattr(self, f"{category}_logger", self.main_logger)
+        logger = self._loggers.get(category, self.main_logger)
         logger.warning(message)
     
     def error(self, message: str, exception: Optional[Exception] = None, category: str = "main"):
         """Log error message with optional exception details"""
-        logger = getattr(self, f"{category}_logger", self.main_logger)
+        logger = self._loggers.get(category, self.main_logger)
         
         if exception:
             logger.error(f"{message} | Exception: {str(exception)}")
-            # Also log to error logger
-            self.error_logger.error(f"{message} | Exception: {str(exception)}")
         else:
             logger.error(message)
-            self.error_logger.error(message)
     
     def debug(self, message: str, category: str = "main"):
         """Log debug message"""
-        logger = getattr(self, f"{category}_logger", self.main_logger)
+        logger = self._loggers.get(category, self.main_logger)
         logger.debug(message)
     
     def log_user_action(self, action: str, details: str = ""):
         """Log user interactions for debugging"""
+        # The helpers below skip building their message when it would be dropped
+        if not self.main_logger.isEnabledFor(logging.INFO):
+            return
         message = f"USER ACTION: {action}"
         if details:
             message += f" | Details: {details}"
@@ -124,6 +266,8 @@ class MCPLogger:
     
     def log_command_execution(self, command: str, exit_code: int, output: str = "", error: str = ""):
         """Log command execution details"""
+        if not error and not self.install_logger.isEnabledFor(logging.INFO):
+            return
         message = f"COMMAND: {command} | Exit Code: {exit_code}"
         
         if output:
@@ -137,6 +281,8 @@ class MCPLogger:
     
     def log_system_info(self, component: str, status: str, details: str = ""):
         """Log system checking information"""
+        if not self.system_logger.isEnabledFor(logging.INFO):
+            return
         message = f"SYSTEM CHECK: {component} | Status: {status}"
         if details:
             message += f" | Details: {details}"
@@ -144,6 +290,8 @@ class MCPLogger:
     
     def log_server_operation(self, operation: str, server_name: str, result: str):
         """Log MCP server operations"""
+        if not self.install_logger.isEnabledFor(logging.INFO):
+            return
         message = f"SERVER {operation.upper()}: {server_name} | Result: {result}"
         self.info(message, category="install")
     
@@ -0,0 +1,89 @@
+"""
+Thread pool for background work that must not keep the application alive
+"""
+
+import queue
+import threading
+from concurrent.futures import Executor, Future
+from typing import Callable, List
+
+
+class DaemonThreadPool(Executor):
+    """Executor that runs submitted calls on a fixed number of daemon threads
+    
+    ThreadPoolExecutor's workers are joined when the interpreter exits, so a long
+    installation or system check still running when the user closes the window
+    keeps an invisible process alive. These workers are daemon threads, like the
+    per-task threads the GUI used before, and are simply dropped at exit.
+    """
+    
+    def __init__(self, max_workers: int, thread_name_prefix: str = "worker"):
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._work_queue = queue.SimpleQueue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+    
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Schedule fn(*args, **kwargs) and return a Future for its result"""
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            
+            future = Future()
+            self._work_queue.put((future, fn, args, kwargs))
+            
+            # Start workers on demand, up to max_workers
+            if len(self._threads) < self._max_workers:
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"{self._thread_name_prefix}_{len(self._threads)}",
+                    daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+            
+            return future
+    
+    def _work(self):
+        """Run queued calls until shutdown puts a stop marker on the queue"""
+        while True:
+            item = self._work_queue.get()
+            if item is None:
+                return
+            
+            future, fn, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+    
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        """Stop accepting work; optionally cancel queued calls and wait for running ones
+        
+        cancel_futures matches the Python 3.9+ ThreadPoolExecutor argument, which
+        is not available on 3.8.
+        """
+        with self._lock:
+            self._shutdown = True
+            
+            if cancel_futures:
+                while True:
+                    try:
+                        item = self._work_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None:
+                        item[0].cancel()
+            
+            for _ in self._threads:
+                self._work_queue.put(None)
+        
+        if wait:
+            for thread in self._threads:
+                thread.join()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test script for batched log writes across log file rotation
+"""
+
+import sys
+import logging
+import logging.handlers
+import tempfile
+from pathlib import Path
+
+# Add src directory to Python path
+src_path = Path(__file__).parent / "src"
+sys.path.insert(0, str(src_path))
+
+RECORD_COUNT = 200
+MAX_BYTES = 2000
+
+def _write_records(delay: bool, batch_size: int):
+    """Log RECORD_COUNT records through a batched handler and return the log files"""
+    from src.utils.logger import _BatchedFileHandler
+    
+    log_dir = Path(tempfile.mkdtemp())
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_dir / "test.log", maxBytes=MAX_BYTES, backupCount=100, delay=delay
+    )
+    file_handler.setFormatter(logging.Formatter('%(message)s'))
+    batched_handler = _BatchedFileHandler(file_handler)
+    
+    for i in range(RECORD_COUNT):
+        record = logging.LogRecord("test", logging.INFO, __file__, 0, f"record {i:03d} " + "x" * 40, None, None)
+        batched_handler.handle(record)
+        if (i + 1) % batch_size == 0:
+            batched_handler.flush()
+    batched_handler.close()
+    file_handler.close()
+    
+    return sorted(log_dir.glob("test.log*"))
+
+def test_rollover_keeps_records():
+    """Test that no records are lost when batches force rollovers"""
+    print("Testing batched writes across rollovers...")
+    
+    try:
+        for delay in (False, True):
+            files = _write_records(delay, batch_size=10)
+            lines = [line for path in files for line in path.read_text().splitlines()]
+            
+            print(f"  delay={delay}: {len(lines)} records in {len(files)} files")
+            if len(files) < 2:
+                print("✗ No rollover happened")
+                return False
+            if sorted(lines) != [f"record {i:03d} " + "x" * 40 for i in range(RECORD_COUNT)]:
+                print("✗ Records were lost or duplicated")
+                return False
+            if any(path.stat().st_size > MAX_BYTES for path in files):
+                print("✗ A log file grew past maxBytes")
+                return False
+        
+        print("✓ All records written, every file within maxBytes")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Log rotation test failed: {e}")
+        return False
+
+def test_oversized_batch():
+    """Test that a batch larger than maxBytes is still written in full"""
+    print("\nTesting a batch larger than maxBytes...")
+    
+    try:
+        files = _write_records(True, batch_size=RECORD_COUNT)
+        lines = [line for path in files for line in path.read_text().splitlines()]
+        
+        if len(lines) != RECORD_COUNT:
+            print(f"✗ Expected {RECORD_COUNT} records, found {len(lines)}")
+            return False
+        
+        print("✓ Oversized batch written in full")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Oversized batch test failed: {e}")
+        return False
+
+def main():
+    """Run all log rotation tests"""
+    print("=" * 60)
+    print("Log Rotation Tests")
+    print("=" * 60)
+    
+    tests = [
+        test_rollover_keeps_records,
+        test_oversized_batch
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except Exception as e:
+            print(f"✗ Test {test.__name__} crashed: {e}")
+    
+    print("\n" + "=" * 60)
+    print(f"LOG ROTATION TEST RESULTS: {passed}/{total} tests passed")
+    print("=" * 60)
+    
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)